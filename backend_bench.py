@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Backend Benchmarks
+Benchmarks built from the ERPScorecardTester building blocks. Each
+benchmark prints its own report and returns True when nothing was flagged.
+"""
+
+import math
+import random
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from backend_client import ScorecardClient, new_run_tag
+from backend_coldstart import bench_cold_start
+from backend_metrics import percentile
+from backend_regression import bench_regression
+from backend_test import ERPScorecardTester
+
+BANK_SIZES = [40, 120, 500, 2000]
+PILLAR_KEYS = [f"P{i}" for i in range(1, 11)]
+GATE_KEYS = [f"G{i}" for i in range(1, 6)]
+
+# Growth exponent above which a curve counts as worse than linear
+LINEAR_TOLERANCE = 1.15
+
+# Paged and streamed listings must deliver their first row within this fraction of their total time
+FIRST_ROW_FRACTION = 0.25
+
+
+def bench_question(number):
+    """A seeded benchmark question; TEST qid and isTest so remove-test-question clears it"""
+    return {
+        "qid": f"TESTBENCH{number}",
+        "pillar": PILLAR_KEYS[number % len(PILLAR_KEYS)],
+        "gate": GATE_KEYS[number % len(GATE_KEYS)],
+        "text": f"Benchmark question {number}?",
+        "whyItMatters": "Benchmark data",
+        "evidenceToCheck": "Benchmark evidence",
+        "effort": "LMH"[number % 3],
+        "fixHint": "Benchmark fix hint",
+        "riskText": "Benchmark risk text",
+        "active": True,
+        "sortOrder": 10000 + number,
+        "isTest": True,
+    }
+
+
+def seed_questions(tester, count, start=0, workers=8):
+    """Create `count` benchmark questions through test_admin_questions"""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        created = list(pool.map(lambda n: tester.test_admin_questions(bench_question(n)),
+                                range(start, start + count)))
+    return sum(created)
+
+
+def active_questions(tester):
+    return tester.client.get_questions().json().get('questions', [])
+
+
+def growth_exponent(sizes, values):
+    """Least-squares slope of log(value) against log(size); 1.0 is linear"""
+    points = [(math.log(size), math.log(value)) for size, value in zip(sizes, values) if value > 0]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread if spread else 0.0
+
+
+def bench_bank_scaling(base_url=None, sizes=None, repeats=5, workers=8, seed=0, keep_data=False):
+    """Time /calculate-results as the question bank grows.
+
+    Seeds TEST questions up to each bank size, submits a full answer set,
+    times the calculation `repeats` times, then removes every seeded question
+    with a single /admin/remove-test-question call and, unless `keep_data`,
+    the assessments the run created.
+    """
+    sizes = sorted(sizes or BANK_SIZES)
+    rng = random.Random(seed)
+    tester = ERPScorecardTester(max_workers=workers, verbose=False, base_url=base_url, run_tag=new_run_tag('bench'))
+    rows = []
+    seeded = 0
+    try:
+        for size in sizes:
+            bank = active_questions(tester)
+            missing = size - len(bank)
+            if missing > 0:
+                seeded += seed_questions(tester, missing, start=seeded, workers=workers)
+                bank = active_questions(tester)
+
+            tester.assessment_id = None
+            answers = [{"questionId": q['id'], "score": rng.randint(0, 4)} for q in bank]
+            if not (tester.test_start_assessment() and tester.test_save_answers(answers)):
+                print(f"❌ Could not prepare an assessment for a {len(bank)}-question bank")
+                return False
+
+            timings = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                if not tester.test_calculate_results(recompute=True):
+                    print(f"❌ /calculate-results failed for a {len(bank)}-question bank")
+                    return False
+                timings.append(time.perf_counter() - started)
+            response_bytes = [
+                record['responseBytes'] for record in tester.metrics.records
+                if record['route'] == '/calculate-results'
+            ][-1]
+            rows.append({
+                'size': len(bank),
+                'median': statistics.median(timings),
+                'p95': percentile(sorted(timings), 95),
+                'bytes': response_bytes,
+            })
+    finally:
+        started = time.perf_counter()
+        tester.test_admin_remove_test_question()
+        teardown = time.perf_counter() - started
+        if not keep_data:
+            tester.teardown_run_data()
+
+    bank_sizes = [row['size'] for row in rows]
+    latency_growth = growth_exponent(bank_sizes, [row['median'] for row in rows])
+    size_growth = growth_exponent(bank_sizes, [row['bytes'] for row in rows])
+
+    print("=" * 72)
+    print("Benchmark: /calculate-results vs question bank size")
+    print("=" * 72)
+    print(f"{'Questions':>10}{'median ms':>12}{'p95 ms':>10}{'response KB':>14}{'us/question':>14}")
+    for row in rows:
+        print(f"{row['size']:>10}{row['median'] * 1000:>12.1f}{row['p95'] * 1000:>10.1f}"
+              f"{row['bytes'] / 1024:>14.1f}{row['median'] / row['size'] * 1e6:>14.1f}")
+    # Fixed per-request overhead flattens the overall fit at small banks, so every segment is checked too
+    flagged = [f"overall {name}" for name, exponent in (('latency', latency_growth), ('response size', size_growth))
+               if exponent > LINEAR_TOLERANCE]
+    for previous, current in zip(rows, rows[1:]):
+        segment = [previous['size'], current['size']]
+        step = growth_exponent(segment, [previous['median'], current['median']])
+        size_step = growth_exponent(segment, [previous['bytes'], current['bytes']])
+        over = [name for name, exponent in (('latency', step), ('response size', size_step)) if exponent > LINEAR_TOLERANCE]
+        flagged.extend(f"{name} {previous['size']} -> {current['size']}" for name in over)
+        print(f"   {previous['size']} -> {current['size']} questions: latency exponent {step:.2f}, "
+              f"size exponent {size_step:.2f}{'  ⚠️' if over else ''}")
+    print(f"Growth exponent (1.0 = linear): latency {latency_growth:.2f}, response size {size_growth:.2f}")
+    print(f"Teardown: removed {seeded} seeded questions in one call ({teardown * 1000:.0f}ms)")
+
+    for name in flagged:
+        print(f"⚠️  {name} grows worse than linearly with bank size (exponent above {LINEAR_TOLERANCE})")
+    print("=" * 72)
+    return not flagged
+
+
+def _save_stats(tester):
+    records = [record for record in tester.metrics.records if record['route'] == '/save-answers']
+    ttfb = sorted(record['ttfb'] for record in records)
+    return {
+        'requests': len(records),
+        'bytes': sum(record['requestBytes'] for record in records),
+        'server': sum(ttfb),
+        'p50': percentile(ttfb, 50),
+        'p95': percentile(ttfb, 95),
+        'wall': sum(record['wall'] for record in records),
+    }
+
+
+def bench_autosave(base_url=None, question_count=120, workers=8, seed=0, keep_data=False):
+    """Compare per-click autosave with delta saves against full-array saves.
+
+    Simulates one user answering `question_count` questions one click at a
+    time. Full mode re-posts every answer so far on each click (today's Save
+    Draft). Delta mode posts only the clicked answer with its baseVersion.
+    """
+    rng = random.Random(seed)
+    # One run tag for all three testers, so a single teardown removes both assessments
+    run_tag = new_run_tag('bench')
+    setup = ERPScorecardTester(max_workers=workers, verbose=False, base_url=base_url, run_tag=run_tag)
+    full = ERPScorecardTester(max_workers=1, verbose=False, base_url=base_url, run_tag=run_tag)
+    delta = ERPScorecardTester(max_workers=1, verbose=False, base_url=base_url, run_tag=run_tag)
+    try:
+        bank = active_questions(setup)
+        if len(bank) < question_count:
+            seed_questions(setup, question_count - len(bank), workers=workers)
+            bank = active_questions(setup)
+        clicks = [{"questionId": q['id'], "score": rng.randint(0, 4)} for q in bank[:question_count]]
+
+        if not (full.test_start_assessment() and delta.test_start_assessment()):
+            print("❌ Could not start benchmark assessments")
+            return False
+
+        for index in range(len(clicks)):
+            response = full.client.save_answers(full.assessment_id, answers=clicks[:index + 1])
+            if response.status_code != 200:
+                print(f"❌ Full save failed at click {index + 1}: HTTP {response.status_code}")
+                return False
+
+        version = 0
+        for index, answer in enumerate(clicks):
+            response = delta.client.save_answers(delta.assessment_id, answer=answer, base_version=version)
+            if response.status_code != 200 or 'version' not in response.json():
+                print(f"❌ Delta save failed at click {index + 1}: HTTP {response.status_code}")
+                return False
+            version = response.json()['version']
+
+        if not (full.test_calculate_results() and delta.test_calculate_results()):
+            print("❌ Could not score the benchmark assessments")
+            return False
+        same_result = all(full.last_results[field] == delta.last_results[field]
+                          for field in ('overallScore', 'decision', 'gateResults'))
+    finally:
+        setup.test_admin_remove_test_question()
+        if not keep_data:
+            setup.teardown_run_data()
+
+    full_stats, delta_stats = _save_stats(full), _save_stats(delta)
+    print("=" * 72)
+    print(f"Benchmark: autosave of {len(clicks)} answers, one click at a time")
+    print("=" * 72)
+    print(f"{'Mode':<8}{'Saves':>7}{'KB sent':>10}{'server s':>10}{'p50 ms':>9}{'p95 ms':>9}{'wall s':>9}")
+    for name, stats in (('full', full_stats), ('delta', delta_stats)):
+        print(f"{name:<8}{stats['requests']:>7}{stats['bytes'] / 1024:>10.1f}{stats['server']:>10.2f}"
+              f"{stats['p50'] * 1000:>9.1f}{stats['p95'] * 1000:>9.1f}{stats['wall']:>9.2f}")
+    if delta_stats['bytes']:
+        print(f"Delta mode sends {full_stats['bytes'] / delta_stats['bytes']:.1f}x fewer bytes")
+    print(f"{'✅' if same_result else '❌'} Both modes produce "
+          f"{'the same' if same_result else 'different'} results")
+    print("=" * 72)
+    return same_result
+
+
+def _measure(label, fetch):
+    """Run `fetch` (returns a row count) and record time, first-row latency and peak client memory"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows, first_row = fetch(started)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'mode': label, 'rows': rows, 'elapsed': elapsed, 'first': first_row, 'peak': peak}
+
+
+def bench_pagination(base_url=None, count=10000, page_size=500, store=None, seed=0):
+    """Compare full-list, cursor-paginated and NDJSON retrieval of /admin/assessments.
+
+    With an in-process stand-in `store`, `count` synthetic completed
+    assessments are added first; otherwise the server's existing data is used.
+    """
+    if store is not None:
+        store.add_synthetic_assessments(count, seed=seed)
+    tester = ERPScorecardTester(max_workers=1, verbose=False, base_url=base_url)
+    def full_list(started):
+        response = tester.client.admin_assessments()
+        response.raise_for_status()
+        rows = response.json()['assessments']
+        return len(rows), time.perf_counter() - started
+
+    def walk(iterator):
+        def fetch(started):
+            rows, first_row = 0, None
+            for _ in iterator():
+                if first_row is None:
+                    first_row = time.perf_counter() - started
+                rows += 1
+            return rows, first_row or 0.0
+        return fetch
+
+    results = [
+        _measure('full list', full_list),
+        _measure(f'pages of {page_size}', walk(lambda: tester.iter_admin_assessments(page_size))),
+        _measure('ndjson stream', walk(tester.iter_admin_assessments_ndjson)),
+    ]
+    consistent = len({result['rows'] for result in results}) == 1
+    # A streamed body that is buffered (e.g. by a compressor that is never flushed) shows up as a late first row
+    buffered = [result['mode'] for result in results[1:]
+                if result['first'] > FIRST_ROW_FRACTION * result['elapsed']]
+
+    print("=" * 72)
+    print(f"Benchmark: /admin/assessments retrieval of {results[0]['rows']} completed assessments")
+    print("=" * 72)
+    print(f"{'Mode':<16}{'Rows':>8}{'total s':>10}{'first row ms':>14}{'peak client MB':>16}")
+    for result in results:
+        print(f"{result['mode']:<16}{result['rows']:>8}{result['elapsed']:>10.2f}"
+              f"{result['first'] * 1000:>14.1f}{result['peak'] / 2 ** 20:>16.2f}")
+    print(f"{'✅' if consistent else '❌'} All modes returned "
+          f"{'the same number of' if consistent else 'different numbers of'} rows")
+    for mode in buffered:
+        print(f"❌ {mode}: first row took more than {FIRST_ROW_FRACTION:.0%} of the total time; "
+              f"the body is buffered instead of streamed")
+    print("=" * 72)
+    return consistent and not buffered
+
+
+def _stats(tester, mode=None):
+    response = tester.client.admin_stats(mode)
+    response.raise_for_status()
+    return response.json()['stats']
+
+
+def bench_stats_consistency(base_url=None, completions=200, workers=16, loads=20, store=None,
+                            preload=10000, seed=0, keep_data=False):
+    """Check incremental /admin/stats against a full recompute after concurrent completions.
+
+    Runs `completions` assessment lifecycles on `workers` threads; every
+    fifth one is answered and scored a second time, to exercise re-completion.
+    Then compares the counters with ?mode=recompute and times both dashboard reads.
+    With an in-process stand-in `store`, `preload` synthetic assessments are added first.
+    Unless `keep_data`, the completed assessments are torn down afterwards.
+    """
+    if store is not None and preload:
+        store.add_synthetic_assessments(preload, seed=seed)
+    # One pooled client shared by every worker's tester
+    client = ScorecardClient(base_url, pool_size=workers, run_tag=new_run_tag('bench'))
+    probe = ERPScorecardTester(max_workers=1, verbose=False, client=client)
+    bank = active_questions(probe)
+
+    def complete(number):
+        rng = random.Random(seed * 100003 + number)
+        tester = ERPScorecardTester(max_workers=1, verbose=False, client=client)
+        rounds = 2 if number % 5 == 0 else 1
+        if not tester.test_start_assessment():
+            return False
+        for _ in range(rounds):
+            answers = [{"questionId": q['id'], "score": rng.randint(0, 4)} for q in bank]
+            if not (tester.test_save_answers(answers) and tester.test_calculate_results()):
+                return False
+        return True
+
+    try:
+        before = _stats(probe)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            succeeded = sum(pool.map(complete, range(completions)))
+        elapsed = time.perf_counter() - started
+
+        incremental = _stats(probe)
+        recomputed = _stats(probe, 'recompute')
+        mismatched = [field for field in recomputed if incremental.get(field) != recomputed[field]]
+
+        timings = {}
+        for mode in (None, 'recompute'):
+            samples = []
+            for _ in range(loads):
+                load_started = time.perf_counter()
+                _stats(probe, mode)
+                samples.append(time.perf_counter() - load_started)
+            timings[mode or 'incremental'] = statistics.median(samples)
+    finally:
+        if not keep_data:
+            probe.teardown_run_data()
+
+    print("=" * 72)
+    print(f"Consistency check: /admin/stats after {completions} concurrent completions")
+    print("=" * 72)
+    print(f"Completions: {succeeded}/{completions} succeeded in {elapsed:.2f}s on {workers} workers")
+    print(f"Total assessments: {before['totalAssessments']} -> {incremental['totalAssessments']}")
+    print(f"{'Field':<32}{'incremental':>14}{'recompute':>14}")
+    for field, value in recomputed.items():
+        if isinstance(value, dict):
+            for key, count in value.items():
+                print(f"{field + '.' + key:<32}{incremental[field].get(key, '-'):>14}{count:>14}")
+        else:
+            print(f"{field:<32}{incremental.get(field, '-'):>14}{value:>14}")
+    print(f"Dashboard load (median of {loads}): incremental {timings['incremental'] * 1000:.1f}ms, "
+          f"recompute {timings['recompute'] * 1000:.1f}ms")
+    if mismatched:
+        print(f"❌ Incremental stats drifted from a full recompute: {', '.join(mismatched)}")
+    else:
+        print("✅ Incremental stats match a full recompute")
+    print("=" * 72)
+    return not mismatched and succeeded == completions
+
+
+BENCHMARKS = {
+    'scaling': bench_bank_scaling,
+    'autosave': bench_autosave,
+    'pagination': bench_pagination,
+    'stats': bench_stats_consistency,
+    'regression': bench_regression,
+    'coldstart': bench_cold_start,
+}
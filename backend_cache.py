@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Client Cache
+Revalidating HTTP cache for rarely-changing GET routes such as /questions
+and /settings: cached copies are revalidated with If-None-Match /
+If-Modified-Since instead of being downloaded again.
+"""
+
+import copy
+import threading
+
+
+class RevalidatingCache:
+    """Conditional-GET cache keyed by URL; safe to share between threads"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def get(self, session, url, **kwargs):
+        """GET `url`, revalidating a cached copy when there is one.
+
+        Returns the response to use. On a 304 that is a shallow copy of the
+        cached 200 response with `from_cache` set to True; the cached response
+        itself is never modified, so concurrent callers don't see each other's flag.
+        """
+        with self._lock:
+            cached = self._entries.get(url)
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached is not None:
+            if cached.headers.get('ETag'):
+                headers['If-None-Match'] = cached.headers['ETag']
+            if cached.headers.get('Last-Modified'):
+                headers['If-Modified-Since'] = cached.headers['Last-Modified']
+
+        response = session.get(url, headers=headers, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            with self._lock:
+                self.hits += 1
+                self.bytes_saved += len(cached.content)
+            hit = copy.copy(cached)
+            hit.from_cache = True
+            return hit
+
+        response.from_cache = False
+        with self._lock:
+            self.misses += 1
+            if response.status_code == 200 and (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+                self._entries[url] = response
+            else:
+                self._entries.pop(url, None)
+        return response
+
+    def invalidate(self, url=None):
+        """Drop one cached URL, or everything"""
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(url, None)
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Record/Replay
+Captures every request/response exchanged through a ScorecardClient into a
+compact gzipped cassette, and serves them back from memory so the backend
+suite runs offline in milliseconds.
+
+Requests are matched on method, route template, normalized query and JSON
+body, with generated IDs masked, so a replay matches even though fresh IDs
+appear in every run. Conditional requests are also matched on their
+validators: replayed ETags are the recorded ones, so the same test sends the
+same If-None-Match again however the concurrent tests interleave.
+
+`python backend_cassette.py --round-trip` records the suite against a fresh
+stand-in and replays it, both with the default number of concurrent tests.
+"""
+
+import argparse
+import contextlib
+import gzip
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlsplit
+
+from requests import Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from backend_metrics import ID_SEGMENT, route_template
+
+CASSETTE_VERSION = 3
+
+# Query parameters whose values change on every run
+VOLATILE_PARAMS = {'cursor'}
+
+# JSON body fields whose values change on every run
+VOLATILE_FIELDS = {'runTag'}
+
+# Transport headers that no longer apply once the body is stored decoded. Content-Encoding is kept as a
+# record of what was negotiated: replayed bodies are preset, so nothing tries to decode them again
+DROPPED_HEADERS = {'content-length', 'transfer-encoding', 'connection', 'keep-alive', 'date'}
+
+# Request headers that change which response the server sends
+CONDITIONAL_HEADERS = ('if-none-match', 'if-modified-since')
+
+# Relative size change that is reported as a difference when re-recording
+SIZE_TOLERANCE = 0.10
+
+
+def mask_ids(value):
+    """Replace generated IDs and per-run values anywhere in a JSON value with placeholders"""
+    if isinstance(value, dict):
+        return {key: '<volatile>' if key in VOLATILE_FIELDS else mask_ids(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [mask_ids(item) for item in value]
+    if isinstance(value, str) and ID_SEGMENT.match(value):
+        return '<id>'
+    return value
+
+
+def normalize_body(body):
+    if not body:
+        return ''
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', 'replace')
+    if not isinstance(body, str):
+        # Streamed bodies are consumed by the time they could be compared
+        return '<stream>'
+    try:
+        return json.dumps(mask_ids(json.loads(body)), sort_keys=True, separators=(',', ':'))
+    except ValueError:
+        return body
+
+
+def request_key(request, base_url):
+    """Matching key for a prepared request"""
+    url = urlsplit(request.url)
+    query = sorted(
+        (name, '<volatile>' if name in VOLATILE_PARAMS else '<id>' if ID_SEGMENT.match(value) else value)
+        for name, value in parse_qsl(url.query)
+    )
+    headers = request.headers
+    password = headers.get('x-admin-password')
+    return json.dumps([
+        request.method,
+        route_template(request.url, base_url),
+        query,
+        normalize_body(request.body),
+        # Distinguish the right, wrong and missing admin password without storing it
+        hashlib.sha256(password.encode()).hexdigest()[:12] if password is not None else None,
+        [headers.get(name) for name in CONDITIONAL_HEADERS],
+        # Which content coding the server picks depends on it
+        headers.get('accept-encoding'),
+    ], separators=(',', ':'))
+
+
+def shape(value):
+    """Structural signature of a JSON value: keys and types, first list element only"""
+    if isinstance(value, dict):
+        return {key: shape(item) for key, item in sorted(value.items())}
+    if isinstance(value, list):
+        return [shape(value[0])] if value else []
+    return type(value).__name__
+
+
+class Cassette:
+    """Recorded interactions grouped by request key, in recorded order"""
+
+    def __init__(self, base_url='', interactions=None):
+        self.base_url = base_url
+        self.interactions = interactions or []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')} in {path}")
+        return cls(data['baseUrl'], data['interactions'])
+
+    def save(self, path):
+        data = {
+            'version': CASSETTE_VERSION,
+            'baseUrl': self.base_url,
+            'recordedAt': datetime.now().isoformat(),
+            'interactions': self.interactions,
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    def add(self, key, response):
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in DROPPED_HEADERS}
+        with self._lock:
+            self.interactions.append({
+                'key': key,
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': headers,
+                'body': response.content.decode('utf-8', 'replace'),
+            })
+
+    def by_key(self):
+        grouped = {}
+        for interaction in self.interactions:
+            grouped.setdefault(interaction['key'], []).append(interaction)
+        return grouped
+
+
+class RecordingAdapter(HTTPAdapter):
+    """HTTPAdapter that also writes every exchange into a Cassette"""
+
+    def __init__(self, cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        # Reading the body here keeps it available to the caller, streamed or not
+        self.cassette.add(request_key(request, self.cassette.base_url), response)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serves responses from a Cassette without touching the network.
+
+    Identical keys are replayed in recorded order; once exhausted, the last
+    recorded response for that key is served again.
+    """
+
+    def __init__(self, cassette):
+        super().__init__()
+        self.cassette = cassette
+        self._queues = {key: deque(items) for key, items in cassette.by_key().items()}
+        self._last = {}
+        self._lock = threading.Lock()
+        self.misses = []
+
+    def send(self, request, **kwargs):
+        key = request_key(request, self.cassette.base_url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                interaction = queue.popleft()
+                self._last[key] = interaction
+            else:
+                interaction = self._last.get(key)
+            if interaction is None:
+                self.misses.append(key)
+        if interaction is None:
+            interaction = {'status': 599, 'reason': 'Not In Cassette', 'headers': {},
+                           'body': json.dumps({'error': 'No recorded response', 'key': json.loads(key)})}
+
+        response = Response()
+        response.status_code = interaction['status']
+        response.reason = interaction['reason']
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response._content = interaction['body'].encode('utf-8')
+        response._content_consumed = True
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(0)
+        return response
+
+    def close(self):
+        pass
+
+
+def install_recorder(client, cassette):
+    """Route a ScorecardClient through a RecordingAdapter, keeping its pool and retry settings"""
+    current = client.session.get_adapter(client.base_url)
+    adapter = RecordingAdapter(cassette, pool_connections=current._pool_connections,
+                               pool_maxsize=current._pool_maxsize, max_retries=current.max_retries)
+    client.session.mount('http://', adapter)
+    client.session.mount('https://', adapter)
+    return adapter
+
+
+def install_replayer(client, cassette):
+    adapter = ReplayAdapter(cassette)
+    client.session.mount('http://', adapter)
+    client.session.mount('https://', adapter)
+    return adapter
+
+
+def compare_cassettes(previous, current):
+    """Describe responses whose status, shape or size changed between two recordings"""
+    before, after = previous.by_key(), current.by_key()
+    changes = []
+    for key in sorted(set(before) | set(after)):
+        method, route = json.loads(key)[:2]
+        label = f"{method} {route}"
+        if key not in before:
+            changes.append(f"+ {label}: new request")
+            continue
+        if key not in after:
+            changes.append(f"- {label}: no longer requested")
+            continue
+        old, new = before[key][0], after[key][0]
+        if old['status'] != new['status']:
+            changes.append(f"~ {label}: status {old['status']} -> {new['status']}")
+        try:
+            old_shape, new_shape = shape(json.loads(old['body'])), shape(json.loads(new['body']))
+        except ValueError:
+            old_shape = new_shape = None
+        if old_shape != new_shape:
+            changes.append(f"~ {label}: response shape changed")
+        old_size, new_size = len(old['body']), len(new['body'])
+        if old_size and abs(new_size - old_size) / old_size > SIZE_TOLERANCE:
+            changes.append(f"~ {label}: size {old_size}B -> {new_size}B")
+    return changes
+
+
+def report_changes(path, cassette):
+    """Print how a fresh recording differs from the cassette already at `path`"""
+    if not os.path.exists(path):
+        return
+    try:
+        previous = Cassette.load(path)
+    except ValueError as e:
+        print(f"Not comparing against the previous recording: {e}")
+        return
+    changes = compare_cassettes(previous, cassette)
+    print(f"Changes against previous recording ({len(changes)}):")
+    for change in changes:
+        print(f"   {change}")
+
+
+def round_trip(workers=None, replays=3):
+    """Record the suite against a fresh stand-in, then replay it `replays` times, all with `workers` concurrent tests.
+
+    Returns a list of failure descriptions; empty when every run passed.
+    """
+    from backend_client import ScorecardClient
+    from backend_stub_server import StubServer
+    from backend_test import DEFAULT_WORKERS, ERPScorecardTester
+
+    workers = workers or DEFAULT_WORKERS
+
+    def run_suite(client):
+        # The suite's own report is not needed here, only whether it passed
+        with contextlib.redirect_stdout(io.StringIO()):
+            return ERPScorecardTester(max_workers=workers, client=client).run_all_tests()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'round-trip.json.gz')
+        with StubServer() as stub:
+            client = ScorecardClient(stub.base_url, pool_size=workers)
+            cassette = Cassette(client.base_url)
+            install_recorder(client, cassette)
+            if not run_suite(client):
+                failures.append("recording: the suite failed against the stand-in")
+            cassette.save(path)
+        for number in range(1, replays + 1):
+            cassette = Cassette.load(path)
+            client = ScorecardClient(cassette.base_url, pool_size=workers)
+            replayer = install_replayer(client, cassette)
+            if not run_suite(client):
+                failures.append(f"replay {number}: the suite failed")
+            if replayer.misses:
+                failures.append(f"replay {number}: {len(replayer.misses)} requests had no recorded response")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cassette record/replay checks")
+    parser.add_argument("--round-trip", action="store_true",
+                        help="record the suite against a fresh stand-in and replay it with concurrent tests")
+    parser.add_argument("--workers", type=int, default=None, help="concurrent tests (default: the suite's default)")
+    parser.add_argument("--replays", type=int, default=3, help="replays of the recording (default 3)")
+    args = parser.parse_args()
+    if not args.round_trip:
+        parser.error("nothing to do; pass --round-trip")
+    failures = round_trip(args.workers, args.replays)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print(f"✅ Recorded and replayed the suite {args.replays} time(s) with concurrent tests")
+    sys.exit(1 if failures else 0)
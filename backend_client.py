@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard API Client
+One pooled, instrumented client for every /api route, shared by the backend
+tester and the load, benchmark and tooling scripts.
+
+Configuration comes from the environment unless passed explicitly:
+    SCORECARD_BASE_URL        API base URL (default: the preview deployment)
+    SCORECARD_ADMIN_PASSWORD  x-admin-password for admin routes (falls back to ADMIN_PASSWORD)
+"""
+
+import json
+import os
+import time
+import uuid
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from backend_cache import RevalidatingCache
+from backend_metrics import InstrumentedSession, MetricsRecorder
+
+DEFAULT_BASE_URL = "https://scorecloud.preview.emergentagent.com/api"
+DEFAULT_ADMIN_PASSWORD = "Murugan@369"
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (5, 30)
+
+# Only methods that are safe to repeat are retried; POSTs are never replayed
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def base_url_from_env():
+    return (os.environ.get('SCORECARD_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+
+
+def admin_password_from_env():
+    return os.environ.get('SCORECARD_ADMIN_PASSWORD') or os.environ.get('ADMIN_PASSWORD') or DEFAULT_ADMIN_PASSWORD
+
+
+def new_run_tag(tool='tester'):
+    """Unique tag for the data one tool run creates, e.g. tester-20260117T093000-3fa2c1"""
+    return f"{tool}-{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+class ScorecardClient:
+    """Typed wrapper over the /api routes.
+
+    Every method returns the raw requests.Response so callers keep full
+    control over status handling. Share one client between threads: its
+    connection pool holds `pool_size` keep-alive connections per host.
+
+    With a `run_tag` (or SCORECARD_RUN_TAG) every profile and assessment the
+    client starts carries it as runTag, so admin_teardown can remove them.
+    """
+
+    def __init__(self, base_url=None, admin_password=None, pool_size=10, timeout=DEFAULT_TIMEOUT,
+                 retries=3, backoff=0.2, metrics=None, run_tag=None):
+        self.base_url = (base_url or base_url_from_env()).rstrip('/')
+        self.admin_password = admin_password or admin_password_from_env()
+        self.run_tag = run_tag or os.environ.get('SCORECARD_RUN_TAG')
+        self.timeout = timeout
+        self.metrics = metrics or MetricsRecorder(self.base_url)
+        if not self.metrics.base_url:
+            self.metrics.base_url = self.base_url
+        self.cache = RevalidatingCache()
+
+        self.session = InstrumentedSession(self.metrics)
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Connection': 'keep-alive',
+        })
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=IDEMPOTENT_METHODS,
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size), max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def url(self, path):
+        return f"{self.base_url}{path}"
+
+    def admin_headers(self, password=None):
+        return {'x-admin-password': self.admin_password if password is None else password}
+
+    def request(self, method, path, admin=False, password=None, timeout=None, **kwargs):
+        """Send one request; `admin` adds the x-admin-password header"""
+        if admin or password is not None:
+            kwargs['headers'] = {**self.admin_headers(password), **(kwargs.get('headers') or {})}
+        return self.session.request(method, self.url(path), timeout=timeout or self.timeout, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Public routes
+
+    def get_root(self, **kwargs):
+        return self.request('GET', '/', **kwargs)
+
+    def get_questions(self, cached=False, **kwargs):
+        """GET /questions; `cached` revalidates a cached copy with If-None-Match"""
+        if cached:
+            return self.cache.get(self.session, self.url('/questions'), timeout=kwargs.get('timeout') or self.timeout)
+        return self.request('GET', '/questions', **kwargs)
+
+    def get_settings(self, cached=False, **kwargs):
+        if cached:
+            return self.cache.get(self.session, self.url('/settings'), timeout=kwargs.get('timeout') or self.timeout)
+        return self.request('GET', '/settings', **kwargs)
+
+    def start_assessment(self, profile, **kwargs):
+        if self.run_tag and 'runTag' not in profile:
+            profile = {**profile, 'runTag': self.run_tag}
+        return self.request('POST', '/start-assessment', json=profile, **kwargs)
+
+    def save_answers(self, assessment_id, answers=None, changes=None, answer=None, base_version=None, **kwargs):
+        """POST /save-answers with the full `answers` array, a `changes` delta or a single `answer`"""
+        body = {'assessmentId': assessment_id}
+        if answers is not None:
+            body['answers'] = answers
+        if changes is not None:
+            body['changes'] = changes
+        if answer is not None:
+            body['answer'] = answer
+        if base_version is not None:
+            body['baseVersion'] = base_version
+        return self.request('POST', '/save-answers', json=body, **kwargs)
+
+    def calculate_results(self, assessment_id, recompute=False, **kwargs):
+        """POST /calculate-results; `recompute` bypasses the stored result even when its inputs are unchanged"""
+        body = {'assessmentId': assessment_id}
+        if recompute:
+            body['recompute'] = True
+        return self.request('POST', '/calculate-results', json=body, **kwargs)
+
+    def get_results(self, assessment_id, **kwargs):
+        return self.request('GET', f'/results/{assessment_id}', **kwargs)
+
+    def what_if(self, assessment_id, candidates, **kwargs):
+        return self.request('POST', '/what-if', json={'assessmentId': assessment_id, 'candidates': candidates}, **kwargs)
+
+    def get_about(self, **kwargs):
+        return self.request('GET', '/admin/about', **kwargs)
+
+    def get_contact(self, **kwargs):
+        return self.request('GET', '/admin/contact', **kwargs)
+
+    def get_pricing(self, **kwargs):
+        return self.request('GET', '/admin/pricing', **kwargs)
+
+    # Admin routes
+
+    def admin_verify(self, password=None, **kwargs):
+        return self.request('GET', '/admin/verify', password=password, admin=True, **kwargs)
+
+    def admin_list_questions(self, **kwargs):
+        return self.request('GET', '/admin/questions', **kwargs)
+
+    def admin_create_question(self, question, **kwargs):
+        return self.request('POST', '/admin/questions', json=question, **kwargs)
+
+    def admin_import_questions(self, csv_chunks, batch_size=None, all_or_nothing=False, dry_run=False, **kwargs):
+        """POST /admin/questions/import, streaming `csv_chunks` (bytes or an iterable of bytes) as the body"""
+        params = {'allOrNothing': 'true' if all_or_nothing else 'false', 'dryRun': 'true' if dry_run else 'false'}
+        if batch_size:
+            params['batchSize'] = batch_size
+        return self.request('POST', '/admin/questions/import', params=params, data=csv_chunks, admin=True,
+                            headers={'Content-Type': 'text/csv'}, **kwargs)
+
+    def admin_delete_question(self, question_id, **kwargs):
+        return self.request('DELETE', f'/admin/questions/{question_id}', **kwargs)
+
+    def admin_update_settings(self, settings, **kwargs):
+        return self.request('POST', '/admin/settings', json=settings, admin=True, **kwargs)
+
+    def admin_stats(self, mode=None, **kwargs):
+        """GET /admin/stats; mode='recompute' asks for a full scan instead of the counters"""
+        params = {'mode': mode} if mode else None
+        return self.request('GET', '/admin/stats', params=params, admin=True, **kwargs)
+
+    def admin_assessments(self, limit=None, cursor=None, **kwargs):
+        params = {}
+        if limit is not None:
+            params['limit'] = limit
+        if cursor:
+            params['cursor'] = cursor
+        return self.request('GET', '/admin/assessments', params=params or None, admin=True, **kwargs)
+
+    def iter_admin_assessments(self, page_size=500):
+        """Yield every completed assessment, one cursor page in memory at a time"""
+        cursor = None
+        while True:
+            response = self.admin_assessments(limit=page_size, cursor=cursor)
+            response.raise_for_status()
+            data = response.json()
+            yield from data.get('assessments', [])
+            cursor = data.get('nextCursor')
+            if not cursor:
+                return
+
+    def iter_admin_assessments_ndjson(self):
+        """Yield every completed assessment from the NDJSON stream as it arrives"""
+        with self.request('GET', '/admin/assessments', params={'format': 'ndjson'}, admin=True,
+                          stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
+    def iter_export(self, since=None):
+        """Yield every completed assessment joined with its profile and result, oldest first"""
+        params = {'since': since} if since else None
+        with self.request('GET', '/admin/export', params=params, admin=True, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
+    def admin_start_rescore(self, batch_size=None, concurrency=None, **kwargs):
+        body = {key: value for key, value in (('batchSize', batch_size), ('concurrency', concurrency)) if value is not None}
+        return self.request('POST', '/admin/rescore', json=body, admin=True, **kwargs)
+
+    def admin_rescore_status(self, job_id, **kwargs):
+        return self.request('GET', f'/admin/rescore/{job_id}', admin=True, **kwargs)
+
+    def admin_cancel_rescore(self, job_id, **kwargs):
+        return self.request('DELETE', f'/admin/rescore/{job_id}', admin=True, **kwargs)
+
+    def wait_for_rescore(self, job_id, poll=1.0, timeout=None, on_progress=None):
+        """Poll a rescoring job until it stops running; return its final progress"""
+        started = time.monotonic()
+        while True:
+            response = self.admin_rescore_status(job_id)
+            response.raise_for_status()
+            progress = response.json()
+            if on_progress:
+                on_progress(progress)
+            if progress['status'] != 'running':
+                return progress
+            if timeout is not None and time.monotonic() - started > timeout:
+                raise TimeoutError(f"Rescoring job {job_id} still running after {timeout}s")
+            time.sleep(poll)
+
+    def admin_teardown(self, run_tag=None, batch_size=None, **kwargs):
+        """Delete every profile, assessment, answer and result tagged `run_tag` (default: this client's)"""
+        body = {'runTag': run_tag or self.run_tag}
+        if batch_size:
+            body['batchSize'] = batch_size
+        return self.request('POST', '/admin/teardown', json=body, admin=True, **kwargs)
+
+    def admin_update_about(self, about, **kwargs):
+        return self.request('POST', '/admin/about', json=about, admin=True, **kwargs)
+
+    def admin_update_contact(self, contact, **kwargs):
+        return self.request('POST', '/admin/contact', json=contact, admin=True, **kwargs)
+
+    def admin_remove_test_questions(self, **kwargs):
+        return self.request('POST', '/admin/remove-test-question', json={}, admin=True, **kwargs)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Cold-Start Benchmark
+Starts a fresh backend (the in-process stand-in, or any server command such
+as `yarn start`), then times the first successful response of every route
+the tester covers and compares it with the same route's warm latency. The
+difference is what route compilation, module loading and opening database
+connections cost the first customer after a deploy.
+"""
+
+import os
+import shlex
+import signal
+import socket
+import statistics
+import subprocess
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from backend_client import ScorecardClient, new_run_tag
+
+# Seconds to keep retrying a route that is still starting (connection refused or 5xx)
+FIRST_RESPONSE_TIMEOUT = 120
+POLL_INTERVAL = 0.05
+
+
+def route_calls(client, state):
+    """(route, call) for every route the tester covers, in an order that satisfies their data needs"""
+    def start():
+        response = client.start_assessment({
+            'name': 'Cold Start', 'email': 'coldstart@example.com', 'companyName': 'Cold Start Co',
+            'role': 'IT Manager', 'erp': 'Epicor Kinetic', 'epicorVersion': 'Kinetic 2023', 'timeline': '3-6 months',
+        })
+        if response.status_code == 200:
+            state['assessmentId'] = response.json()['assessmentId']
+        return response
+
+    def questions():
+        response = client.get_questions()
+        if response.status_code == 200:
+            state['answers'] = [{'questionId': q['id'], 'score': i % 5}
+                                for i, q in enumerate(response.json().get('questions', []))]
+        return response
+
+    return [
+        ('GET /', client.get_root),
+        ('GET /questions', questions),
+        ('GET /settings', client.get_settings),
+        ('POST /start-assessment', start),
+        ('POST /save-answers', lambda: client.save_answers(state['assessmentId'], answers=state['answers'])),
+        ('POST /calculate-results', lambda: client.calculate_results(state['assessmentId'])),
+        ('GET /results/:id', lambda: client.get_results(state['assessmentId'])),
+        ('POST /what-if', lambda: client.what_if(state['assessmentId'], [
+            {'id': 'all-4', 'changes': [{'questionId': a['questionId'], 'score': 4} for a in state['answers'][:5]]}])),
+        ('GET /admin/verify', client.admin_verify),
+        ('GET /admin/questions', client.admin_list_questions),
+        ('GET /admin/stats', client.admin_stats),
+        ('GET /admin/assessments', lambda: client.admin_assessments(limit=100)),
+        ('GET /admin/about', client.get_about),
+        ('GET /admin/contact', client.get_contact),
+        ('GET /admin/pricing', client.get_pricing),
+    ]
+
+
+def first_success(call, timeout=FIRST_RESPONSE_TIMEOUT):
+    """Seconds from the first attempt until `call` gets a non-5xx response; retries while the server starts"""
+    started = time.perf_counter()
+    while True:
+        try:
+            response = call()
+            if response.status_code < 500:
+                return time.perf_counter() - started, response.status_code
+        except requests.ConnectionError:
+            pass
+        if time.perf_counter() - started > timeout:
+            raise RuntimeError(f"No successful response within {timeout}s")
+        time.sleep(POLL_INTERVAL)
+
+
+def wait_for_port(base_url, timeout=FIRST_RESPONSE_TIMEOUT):
+    """Seconds until the server accepts TCP connections; sends no request, so no route is warmed"""
+    url = urlsplit(base_url)
+    address = (url.hostname, url.port or (443 if url.scheme == 'https' else 80))
+    started = time.perf_counter()
+    while True:
+        try:
+            socket.create_connection(address, timeout=1).close()
+            return time.perf_counter() - started
+        except OSError:
+            if time.perf_counter() - started > timeout:
+                raise RuntimeError(f"{address[0]}:{address[1]} not accepting connections within {timeout}s")
+            time.sleep(POLL_INTERVAL)
+
+
+def measure_run(base_url, warm_repeats, keep_data=False):
+    """First-hit and warm median latency per route against a freshly started backend.
+
+    Unless `keep_data`, the assessments the warm repeats created are torn down.
+    """
+    # A fresh client, so no pooled connection carries over between runs
+    client = ScorecardClient(base_url, retries=0, run_tag=new_run_tag('coldstart'))
+    state = {}
+    rows = {}
+    calls = route_calls(client, state)
+    try:
+        for route, call in calls:
+            first, status = first_success(call)
+            rows[route] = {'first': first, 'status': status}
+        for route, call in calls:
+            samples = []
+            for _ in range(warm_repeats):
+                started = time.perf_counter()
+                call()
+                samples.append(time.perf_counter() - started)
+            rows[route]['warm'] = statistics.median(samples)
+    finally:
+        if not keep_data:
+            client.admin_teardown()
+        client.close()
+    return rows
+
+
+def stub_launcher(cold_start=0.0):
+    """Launch a fresh in-process stand-in per run; returns (base_url, stop)"""
+    def launch():
+        from backend_stub_server import StubServer
+        server = StubServer(cold_start=cold_start).start()
+        return server.base_url, server.stop
+    return launch
+
+
+def command_launcher(command, base_url):
+    """Launch `command` (e.g. 'yarn start') per run and serve `base_url`; returns (base_url, stop)"""
+    def launch():
+        # Own process group, so the server started by e.g. yarn is stopped along with it
+        process = subprocess.Popen(shlex.split(command), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                   start_new_session=True)
+
+        def stop():
+            os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+        return base_url, stop
+    return launch
+
+
+def bench_cold_start(base_url=None, runs=3, warm_repeats=20, launch=None, keep_data=False):
+    """Compare first-request and warm latency per route over `runs` fresh starts.
+
+    `launch` returns (base_url, stop) for a freshly started backend. Without
+    it the backend at `base_url` is measured once, as deployed; point it at a
+    fresh instance for a meaningful first-hit number.
+    """
+    results = []
+    for _ in range(runs if launch else 1):
+        stop = None
+        if launch:
+            base_url, stop = launch()
+        try:
+            ready = wait_for_port(base_url)
+            rows = measure_run(base_url, warm_repeats, keep_data)
+        finally:
+            if stop:
+                stop()
+        results.append((ready, rows))
+
+    summary = {}
+    for route in results[0][1]:
+        first = statistics.median(rows[route]['first'] for _, rows in results)
+        warm = statistics.median(rows[route]['warm'] for _, rows in results)
+        summary[route] = {'first': first, 'warm': warm, 'cost': first - warm,
+                          'status': results[-1][1][route]['status']}
+    ready = statistics.median(ready for ready, _ in results)
+
+    print("=" * 78)
+    print(f"Cold start: first successful response vs warm median, median of {len(results)} fresh start(s)")
+    print("=" * 78)
+    print(f"Time until the server accepted connections after launch: {ready * 1000:.0f}ms")
+    print(f"{'Route':<28}{'first ms':>10}{'warm ms':>10}{'startup ms':>12}{'x warm':>8}{'HTTP':>6}")
+    for route, row in summary.items():
+        ratio = row['first'] / row['warm'] if row['warm'] else 0.0
+        print(f"{route:<28}{row['first'] * 1000:>10.1f}{row['warm'] * 1000:>10.1f}"
+              f"{row['cost'] * 1000:>12.1f}{ratio:>8.1f}{row['status']:>6}")
+    total = sum(max(0.0, row['cost']) for row in summary.values())
+    worst = max(summary, key=lambda route: summary[route]['cost'])
+    print(f"Total startup cost over {len(summary)} routes: {total * 1000:.0f}ms; worst: {worst}")
+    print("=" * 78)
+    return all(row['status'] < 400 for row in summary.values())
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Synthetic Dataset Generator
+Bulk-loads realistic profiles, assessments (DRAFT, COMPLETED and PAID),
+answers and results into a local MongoDB, or into the in-process stand-in,
+so /admin/stats, /admin/assessments and rescoring can be benchmarked at
+10k, 100k and 1M assessments.
+
+Everything is drawn from one seeded random generator, IDs and timestamps
+included, so the same options always produce the same documents. Documents
+are written with batched inserts. Profiles and assessments carry a runTag
+(dataset-seed<seed> by default), so POST /api/admin/teardown removes them.
+
+Loading into MongoDB needs pymongo (pip install pymongo).
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+try:
+    import pymongo
+except ImportError:
+    pymongo = None
+
+from backend_client import ScorecardClient
+from backend_stub_server import DEFAULT_WEIGHTS, EFFORTS, GATES, PILLARS, calculate_results, iso
+
+PILLAR_KEYS = list(PILLARS)
+GATE_KEYS = list(GATES)
+
+DEFAULT_STATUS_MIX = {'DRAFT': 0.2, 'COMPLETED': 0.6, 'PAID': 0.2}
+# (mean, standard deviation) of answer scores per pillar, before each assessment's own maturity shift
+DEFAULT_PILLAR_SCORES = {pillar: (2.5, 1.0) for pillar in PILLAR_KEYS}
+# Standard deviation of the per-assessment shift, so some companies are strong across the board
+MATURITY_SPREAD = 0.7
+
+BATCH_SIZE = 5000
+# Assessments are created over the DAYS days before EPOCH
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+DAYS = 365
+
+ROLES = ['IT Director', 'IT Manager', 'CFO', 'Operations Manager', 'ERP Administrator', 'Plant Manager']
+ERP_VERSIONS = ['10.2.500', '10.2.700', 'Kinetic 2022', 'Kinetic 2023', 'Kinetic 2024']
+TIMELINES = ['0-3 months', '3-6 months', '6-12 months', '12+ months']
+COMPANY_WORDS = ['Precision', 'Allied', 'Northern', 'Summit', 'Apex', 'Continental', 'Pioneer', 'Delta']
+COMPANY_KINDS = ['Manufacturing', 'Fabrication', 'Components', 'Industries', 'Plastics', 'Machining']
+FIRST_NAMES = ['Anita', 'Ravi', 'Sara', 'Omar', 'Li', 'Maria', 'James', 'Priya', 'Tom', 'Fatima']
+LAST_NAMES = ['Shah', 'Khan', 'Nair', 'Smith', 'Garcia', 'Chen', 'Iyer', 'Brown', 'Haddad', 'Patel']
+
+
+def parse_status_mix(value):
+    """'DRAFT=0.2,COMPLETED=0.6,PAID=0.2' -> normalized weights"""
+    mix = {}
+    for part in value.split(','):
+        status, _, weight = part.partition('=')
+        status = status.strip().upper()
+        if status not in DEFAULT_STATUS_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown status {status!r}")
+        mix[status] = float(weight)
+    total = sum(mix.values())
+    if total <= 0:
+        raise argparse.ArgumentTypeError("Status weights must add up to more than 0")
+    return {status: weight / total for status, weight in mix.items()}
+
+
+def parse_pillar_scores(value):
+    """'P1=1.5:0.8,P7=3' -> {pillar: (mean, sd)} over DEFAULT_PILLAR_SCORES"""
+    scores = dict(DEFAULT_PILLAR_SCORES)
+    for part in value.split(','):
+        pillar, _, spec = part.partition('=')
+        pillar = pillar.strip().upper()
+        if pillar not in PILLARS:
+            raise argparse.ArgumentTypeError(f"Unknown pillar {pillar!r}")
+        mean, _, sd = spec.partition(':')
+        scores[pillar] = (float(mean), float(sd) if sd else scores[pillar][1])
+    return scores
+
+
+def dataset_question(number):
+    """A generated question padding the bank; TEST qid and isTest so remove-test-question clears it"""
+    pillar = PILLAR_KEYS[number % len(PILLAR_KEYS)]
+    gate = GATE_KEYS[number % len(GATE_KEYS)]
+    return {
+        'id': str(uuid.UUID(int=number, version=4)),
+        'qid': f"TESTDATA{number}",
+        'pillar': pillar,
+        'gate': gate,
+        'text': f"How mature is {PILLARS[pillar].lower()} practice #{number}?",
+        'whyItMatters': 'Synthetic dataset question',
+        'evidenceToCheck': 'Synthetic dataset evidence',
+        'effort': EFFORTS[number % len(EFFORTS)],
+        'fixHint': 'Synthetic dataset fix hint',
+        'riskText': 'Synthetic dataset risk text',
+        'active': True,
+        'sortOrder': 20000 + number,
+        'isTest': True,
+    }
+
+
+def pad_bank(questions, bank_size):
+    """Generated questions needed to bring the active bank up to `bank_size`"""
+    return [dataset_question(number) for number in range(len(questions), bank_size)]
+
+
+class DatasetGenerator:
+    """Yields (profile, assessment, answers, result) tuples, reproducibly for a given seed"""
+
+    def __init__(self, questions, weights, seed=0, status_mix=None, pillar_scores=None, run_tag=None):
+        self.questions = questions
+        self.weights = weights
+        self.rng = random.Random(seed)
+        mix = status_mix or DEFAULT_STATUS_MIX
+        self.statuses = list(mix)
+        self.status_weights = [mix[status] for status in self.statuses]
+        self.pillar_scores = pillar_scores or DEFAULT_PILLAR_SCORES
+        self.run_tag = run_tag or f"dataset-seed{seed}"
+
+    def uuid(self):
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def profile(self, number, created_at):
+        rng = self.rng
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        company = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_KINDS)} {number}"
+        return {
+            'id': self.uuid(),
+            'name': f"{first} {last}",
+            'email': f"{first.lower()}.{last.lower()}{number}@example.com",
+            'companyName': company,
+            'role': rng.choice(ROLES),
+            'erp': 'Epicor',
+            'epicorVersion': rng.choice(ERP_VERSIONS),
+            'timeline': rng.choice(TIMELINES),
+            'createdAt': iso(created_at),
+            'runTag': self.run_tag,
+        }
+
+    def answers(self, assessment_id, status):
+        """Answer documents; a DRAFT stops part of the way through the bank"""
+        rng = self.rng
+        shift = rng.gauss(0, MATURITY_SPREAD)
+        questions = self.questions
+        if status == 'DRAFT':
+            questions = questions[:rng.randint(0, len(questions))]
+        answers = []
+        for question in questions:
+            mean, sd = self.pillar_scores[question['pillar']]
+            answers.append({
+                'id': self.uuid(),
+                'assessmentId': assessment_id,
+                'questionId': question['id'],
+                'score': min(4, max(0, round(rng.gauss(mean + shift, sd)))),
+                'notes': '',
+            })
+        return answers
+
+    def generate(self, count):
+        rng = self.rng
+        for number in range(count):
+            created_at = EPOCH - timedelta(seconds=rng.uniform(0, DAYS * 86400))
+            status = rng.choices(self.statuses, self.status_weights)[0]
+            profile = self.profile(number, created_at)
+            assessment = {
+                'id': self.uuid(),
+                'profileId': profile['id'],
+                'email': profile['email'],
+                'status': status,
+                'createdAt': iso(created_at),
+                'completedAt': None,
+                'answersVersion': 1,
+                'runTag': self.run_tag,
+            }
+            answers = self.answers(assessment['id'], status)
+            result = None
+            if status != 'DRAFT':
+                completed_at = created_at + timedelta(minutes=rng.uniform(5, 120))
+                assessment['completedAt'] = iso(completed_at)
+                result = {
+                    'id': self.uuid(),
+                    'assessmentId': assessment['id'],
+                    'createdAt': assessment['completedAt'],
+                    **calculate_results(self.questions, answers, self.weights),
+                }
+            yield profile, assessment, answers, result
+
+
+class MongoSink:
+    """Buffers documents per collection and writes them with insert_many"""
+
+    COLLECTIONS = ('profiles', 'assessments', 'answers', 'results')
+
+    def __init__(self, url, db_name, batch_size=BATCH_SIZE):
+        if pymongo is None:
+            raise RuntimeError("Loading into MongoDB needs pymongo: pip install pymongo")
+        self.client = pymongo.MongoClient(url)
+        self.db = self.client[db_name]
+        self.batch_size = batch_size
+        self.buffers = {name: [] for name in self.COLLECTIONS}
+        self.counts = {name: 0 for name in self.COLLECTIONS}
+
+    def questions_and_weights(self):
+        questions = sorted(self.db.questions.find({'active': True}, {'_id': 0}),
+                           key=lambda question: question.get('sortOrder', 0))
+        settings = self.db.settings.find_one({}, {'_id': 0}) or {}
+        return questions, settings.get('weights') or dict(DEFAULT_WEIGHTS)
+
+    def add_questions(self, questions):
+        if questions:
+            self.db.questions.insert_many([dict(question) for question in questions], ordered=False)
+
+    def remove(self, run_tag):
+        """Delete an earlier load with the same tag, so a rerun produces exactly the same data"""
+        assessment_ids = [doc['id'] for doc in self.db.assessments.find({'runTag': run_tag}, {'id': 1})]
+        for i in range(0, len(assessment_ids), self.batch_size):
+            chunk = {'assessmentId': {'$in': assessment_ids[i:i + self.batch_size]}}
+            self.db.answers.delete_many(chunk)
+            self.db.results.delete_many(chunk)
+        self.db.assessments.delete_many({'runTag': run_tag})
+        self.db.profiles.delete_many({'runTag': run_tag})
+
+    def write(self, profile, assessment, answers, result):
+        self.buffers['profiles'].append(profile)
+        self.buffers['assessments'].append(assessment)
+        self.buffers['answers'].extend(answers)
+        if result:
+            self.buffers['results'].append(result)
+        for name, buffer in self.buffers.items():
+            if len(buffer) >= self.batch_size:
+                self._flush(name)
+
+    def _flush(self, name):
+        buffer = self.buffers[name]
+        if buffer:
+            # insert_many adds _id to each document; they are not reused
+            self.db[name].insert_many(buffer, ordered=False)
+            self.counts[name] += len(buffer)
+            self.buffers[name] = []
+
+    def close(self):
+        for name in self.COLLECTIONS:
+            self._flush(name)
+        self.client.close()
+
+
+class StoreSink:
+    """Writes into an in-process ScorecardStore, one lock acquisition per batch of assessments"""
+
+    def __init__(self, store, batch_size=BATCH_SIZE):
+        self.store = store
+        self.batch_size = batch_size
+        self.pending = []
+        self.counts = {'profiles': 0, 'assessments': 0, 'answers': 0, 'results': 0}
+
+    def questions_and_weights(self):
+        with self.store.lock:
+            weights = dict(self.store.settings['weights'])
+        return self.store.active_questions(), weights
+
+    def add_questions(self, questions):
+        if questions:
+            with self.store.lock:
+                for question in questions:
+                    self.store.questions[question['id']] = dict(question)
+                self.store.touch('questions')
+
+    def remove(self, run_tag):
+        with self.store.lock:
+            assessment_ids = [assessment_id for assessment_id, assessment in self.store.assessments.items()
+                              if assessment.get('runTag') == run_tag]
+            self.store.delete_assessments(assessment_ids)
+            for profile_id in [profile_id for profile_id, profile in self.store.profiles.items()
+                               if profile.get('runTag') == run_tag]:
+                del self.store.profiles[profile_id]
+
+    def write(self, profile, assessment, answers, result):
+        self.pending.append((profile, assessment, answers, result))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        store = self.store
+        with store.lock:
+            for profile, assessment, answers, result in self.pending:
+                status, completed_at = assessment['status'], assessment['completedAt']
+                assessment = dict(assessment, status='DRAFT', completedAt=None)
+                store.add_assessment(profile, assessment, {answer['questionId']: answer for answer in answers})
+                if result:
+                    store.complete(assessment, result, completed_at=completed_at)
+                    assessment['status'] = status
+                    self.counts['results'] += 1
+                self.counts['profiles'] += 1
+                self.counts['assessments'] += 1
+                self.counts['answers'] += len(answers)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+
+
+def load_dataset(sink, count, seed=0, bank_size=None, status_mix=None, pillar_scores=None, run_tag=None,
+                 replace=False, on_progress=None, progress_every=10000):
+    """Generate `count` assessments into `sink`; return (documents written per collection, elapsed seconds)"""
+    started = time.perf_counter()
+    questions, weights = sink.questions_and_weights()
+    if bank_size and bank_size > len(questions):
+        padding = pad_bank(questions, bank_size)
+        sink.add_questions(padding)
+        questions = questions + padding
+    generator = DatasetGenerator(questions, weights, seed=seed, status_mix=status_mix,
+                                 pillar_scores=pillar_scores, run_tag=run_tag)
+    if replace:
+        sink.remove(generator.run_tag)
+    try:
+        for number, documents in enumerate(generator.generate(count), 1):
+            sink.write(*documents)
+            if on_progress and number % progress_every == 0:
+                on_progress(number, time.perf_counter() - started)
+    finally:
+        sink.close()
+    return dict(sink.counts), time.perf_counter() - started
+
+
+def bench_endpoints(client, repeats=5, page_size=500):
+    """Time /admin/stats, a full /admin/assessments walk and a rescoring job at the loaded size"""
+    from backend_rescore import run_rescore
+
+    rows = {}
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        client.admin_stats().raise_for_status()
+        samples.append(time.perf_counter() - started)
+    rows['GET /admin/stats'] = f"median {statistics.median(samples) * 1000:.1f}ms over {repeats} calls"
+
+    started = time.perf_counter()
+    walked = sum(1 for _ in client.iter_admin_assessments(page_size=page_size))
+    elapsed = time.perf_counter() - started
+    rows['GET /admin/assessments'] = (f"{walked} rows in {elapsed:.2f}s "
+                                      f"({walked / elapsed if elapsed else 0:.0f} rows/s, pages of {page_size})")
+
+    progress, _ = run_rescore(client, verbose=False)
+    rows['POST /admin/rescore'] = (f"{progress['processed']} assessments in {progress['elapsedSeconds']:.2f}s "
+                                   f"({progress['ratePerSecond']:.0f}/s), status {progress['status']}")
+    for route, summary in rows.items():
+        print(f"   {route:<26}{summary}")
+    return progress['status'] == 'completed'
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-load a reproducible synthetic assessment dataset")
+    parser.add_argument("--assessments", type=int, default=10000, help="assessments to generate (default 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed; the same seed gives the same data")
+    parser.add_argument("--bank-size", type=int, default=None,
+                        help="pad the active question bank with generated TEST questions up to this size, e.g. 120")
+    parser.add_argument("--status-mix", type=parse_status_mix, default=None,
+                        help="relative status weights (default DRAFT=0.2,COMPLETED=0.6,PAID=0.2)")
+    parser.add_argument("--pillar-scores", type=parse_pillar_scores, default=None,
+                        help="per-pillar answer score mean[:sd], e.g. P1=1.5:0.8,P7=3 (default 2.5:1.0)")
+    parser.add_argument("--run-tag", default=None, help="runTag on the generated data (default dataset-seed<seed>)")
+    parser.add_argument("--replace", action="store_true", help="delete data with the same run tag first")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help=f"documents per insert_many (default {BATCH_SIZE})")
+    parser.add_argument("--mongo-url", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="erp_scorecard")
+    parser.add_argument("--offline", action="store_true",
+                        help="load into the in-process stand-in instead of MongoDB")
+    parser.add_argument("--bench", action="store_true",
+                        help="afterwards time /admin/stats, /admin/assessments and rescoring "
+                             "(against the stand-in when offline, otherwise BASE_URL)")
+    args = parser.parse_args()
+
+    stub = None
+    base_url = None
+    ok = True
+    try:
+        if args.offline:
+            from backend_stub_server import StubServer
+            stub = StubServer().start()
+            base_url = stub.base_url
+            sink = StoreSink(stub.store, args.batch_size)
+        else:
+            sink = MongoSink(args.mongo_url, args.db, args.batch_size)
+        counts, elapsed = load_dataset(
+            sink, args.assessments, seed=args.seed, bank_size=args.bank_size, status_mix=args.status_mix,
+            pillar_scores=args.pillar_scores, run_tag=args.run_tag, replace=args.replace,
+            on_progress=lambda number, seconds: print(f"   {number} assessments, {number / seconds:.0f}/s", flush=True))
+        documents = sum(counts.values())
+        print(f"Loaded {', '.join(f'{count} {name}' for name, count in counts.items())} "
+              f"in {elapsed:.2f}s ({documents / elapsed if elapsed else 0:.0f} documents/s)")
+        if args.bench:
+            ok = bench_endpoints(ScorecardClient(base_url))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        ok = False
+    finally:
+        if stub:
+            stub.stop()
+    sys.exit(0 if ok else 1)
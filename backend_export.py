@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Results Export
+Streams every completed assessment, joined with its profile and result,
+from GET /api/admin/export and writes one flat row per assessment to CSV
+or Parquet as it arrives, so memory stays constant however many rows exist.
+
+Parquet output needs pyarrow (pip install pyarrow); CSV has no extra dependency.
+"""
+
+import argparse
+import csv
+import sys
+import time
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from backend_client import ScorecardClient
+
+PILLAR_KEYS = [f"P{i}" for i in range(1, 11)]
+GATE_KEYS = [f"G{i}" for i in range(1, 6)]
+PROFILE_FIELDS = ['name', 'email', 'companyName', 'role', 'erp', 'epicorVersion', 'timeline']
+
+COLUMNS = (
+    ['assessmentId', 'status', 'createdAt', 'completedAt']
+    + PROFILE_FIELDS
+    + ['overallScore', 'decision']
+    + [f"{pillar}_{field}" for pillar in PILLAR_KEYS for field in ('score', 'rag', 'answered')]
+    + [f"{gate}_{field}" for gate in GATE_KEYS for field in ('avgScore', 'status')]
+    + ['topRisks', 'quickWins']
+)
+
+# Rows buffered per Parquet row group
+ROW_GROUP_SIZE = 10000
+
+
+def flatten(row):
+    """One export row as a flat dict over COLUMNS; unanswered pillars and gates are None"""
+    flat = {column: row.get(column) for column in ('assessmentId', 'status', 'createdAt', 'completedAt',
+                                                  'overallScore', 'decision')}
+    profile = row.get('profile') or {}
+    flat.update({field: profile.get(field) for field in PROFILE_FIELDS})
+    for pillar in PILLAR_KEYS:
+        values = row['pillars'].get(pillar) or {}
+        for field in ('score', 'rag', 'answered'):
+            flat[f"{pillar}_{field}"] = values.get(field)
+    for gate in GATE_KEYS:
+        values = row['gates'].get(gate) or {}
+        for field in ('avgScore', 'status'):
+            flat[f"{gate}_{field}"] = values.get(field)
+    flat['topRisks'] = ';'.join(row.get('topRisks', []))
+    flat['quickWins'] = ';'.join(row.get('quickWins', []))
+    return flat
+
+
+class CsvSink:
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, flat):
+        self.writer.writerow(flat)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+    """Writes row groups of ROW_GROUP_SIZE rows with a fixed, typed schema"""
+
+    def __init__(self, path, row_group_size=ROW_GROUP_SIZE):
+        if pyarrow is None:
+            raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+        types = {'overallScore': pyarrow.int32()}
+        for pillar in PILLAR_KEYS:
+            types[f"{pillar}_score"] = pyarrow.int32()
+            types[f"{pillar}_answered"] = pyarrow.int32()
+        for gate in GATE_KEYS:
+            types[f"{gate}_avgScore"] = pyarrow.float64()
+        self.schema = pyarrow.schema([(column, types.get(column, pyarrow.string())) for column in COLUMNS])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        self.row_group_size = row_group_size
+        self.buffer = []
+
+    def write(self, flat):
+        self.buffer.append(flat)
+        if len(self.buffer) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.writer.write_table(pyarrow.Table.from_pylist(self.buffer, schema=self.schema))
+            self.buffer = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def open_sink(path, fmt=None):
+    fmt = fmt or ('parquet' if path.endswith('.parquet') else 'csv')
+    return ParquetSink(path) if fmt == 'parquet' else CsvSink(path)
+
+
+def export(client, path, fmt=None, since=None):
+    """Stream the export into `path`; return (rows written, elapsed seconds)"""
+    started = time.perf_counter()
+    sink = open_sink(path, fmt)
+    rows = 0
+    try:
+        for row in client.iter_export(since=since):
+            sink.write(flatten(row))
+            rows += 1
+    finally:
+        sink.close()
+    return rows, time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export completed assessments as a flat table")
+    parser.add_argument("path", help="output file; .parquet selects Parquet unless --format is given")
+    parser.add_argument("--format", choices=["csv", "parquet"], default=None)
+    parser.add_argument("--since", default=None, help="only assessments completed after this timestamp")
+    parser.add_argument("--offline", action="store_true",
+                        help="export from the in-process stand-in seeded with synthetic assessments")
+    parser.add_argument("--synthetic", type=int, default=10000,
+                        help="offline mode: synthetic completed assessments to seed (default 10000)")
+    args = parser.parse_args()
+
+    stub = None
+    base_url = None
+    if args.offline:
+        from backend_stub_server import StubServer
+        stub = StubServer().start()
+        stub.store.add_synthetic_assessments(args.synthetic)
+        base_url = stub.base_url
+    try:
+        rows, elapsed = export(ScorecardClient(base_url), args.path, args.format, args.since)
+        print(f"Exported {rows} assessments to {args.path} in {elapsed:.2f}s "
+              f"({rows / elapsed if elapsed else 0:.0f} rows/s)")
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        if stub:
+            stub.stop()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Latency Histogram
+Compact log-linear latency histogram: each power-of-two range of
+microseconds is split into 2**SUB_BUCKET_BITS linear buckets, so any
+recorded value is kept to within about 3%. Histograms from separate
+processes merge by adding bucket counts.
+"""
+
+import math
+
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+
+def bucket_index(micros):
+    """Bucket for a latency in whole microseconds"""
+    value = max(0, int(micros))
+    if value < SUB_BUCKETS:
+        return value
+    exponent = value.bit_length() - 1
+    shift = exponent - SUB_BUCKET_BITS
+    return ((shift + 1) << SUB_BUCKET_BITS) + (value >> shift) - SUB_BUCKETS
+
+
+def bucket_bounds(index):
+    """(lowest, highest) microseconds that land in bucket `index`"""
+    if index < SUB_BUCKETS:
+        return index, index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    lowest = (SUB_BUCKETS + (index & (SUB_BUCKETS - 1))) << shift
+    return lowest, lowest + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """Sparse bucket counts plus exact count, sum, min and max; values in seconds"""
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds):
+        index = bucket_index(seconds * 1e6)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, pct):
+        """Nearest-rank percentile, reported as the midpoint of its bucket and clamped to min/max"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                lowest, highest = bucket_bounds(index)
+                return min(self.max, max(self.min, (lowest + highest) / 2 / 1e6))
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self):
+        return {'buckets': self.buckets, 'count': self.count, 'total': self.total, 'min': self.min, 'max': self.max}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.buckets = {int(index): count for index, count in data['buckets'].items()}
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.min = data['min']
+        histogram.max = data['max']
+        return histogram
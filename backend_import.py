@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Question Importer
+Streams a question CSV to POST /api/admin/questions/import in fixed-size
+chunks, so banks of any size are imported without loading the file into
+memory. The server validates every row and upserts by qid in batches.
+
+CSV columns: qid, pillar, gate, text, whyItMatters, evidenceToCheck,
+effort, fixHint, riskText, active, sortOrder (isTest optional).
+"""
+
+import argparse
+import sys
+import time
+
+from backend_client import ScorecardClient
+
+CHUNK_SIZE = 64 * 1024
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    """Yield the file at `path` in `chunk_size` byte pieces"""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def import_questions(client, path, batch_size=None, all_or_nothing=False, dry_run=False,
+                     chunk_size=CHUNK_SIZE):
+    """Stream `path` to the import route; return (report, elapsed seconds)"""
+    started = time.perf_counter()
+    response = client.admin_import_questions(read_chunks(path, chunk_size), batch_size=batch_size,
+                                             all_or_nothing=all_or_nothing, dry_run=dry_run)
+    elapsed = time.perf_counter() - started
+    if response.status_code != 200:
+        raise RuntimeError(f"Import failed: HTTP {response.status_code} {response.text}")
+    return response.json(), elapsed
+
+
+def print_report(report, elapsed, limit=50):
+    mode = 'dry run' if report['dryRun'] else 'applied' if report['applied'] else 'NOT applied'
+    print(f"Rows: {report['rows']} ({mode}) in {elapsed:.2f}s, {report['rows'] / elapsed if elapsed else 0:.0f} rows/s")
+    print(f"Created: {report['created']}, Updated: {report['updated']}, Batches: {report['batches']}")
+    print(f"Rejected rows: {report['errorCount']}")
+    for error in report['errors'][:limit]:
+        print(f"   line {error['line']} ({error['qid'] or 'no qid'}): {'; '.join(error['errors'])}")
+    if report['errorCount'] > limit:
+        print(f"   ... {report['errorCount'] - limit} more")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-import questions from a CSV file")
+    parser.add_argument("path", help="CSV file with a header row")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="rows the server upserts per batch (server default 500)")
+    parser.add_argument("--all-or-nothing", action="store_true",
+                        help="apply nothing unless every row is valid")
+    parser.add_argument("--dry-run", action="store_true", help="validate only")
+    parser.add_argument("--offline", action="store_true", help="import into the in-process stand-in")
+    args = parser.parse_args()
+
+    stub = None
+    base_url = None
+    if args.offline:
+        from backend_stub_server import StubServer
+        stub = StubServer().start()
+        base_url = stub.base_url
+    try:
+        client = ScorecardClient(base_url)
+        report, elapsed = import_questions(client, args.path, batch_size=args.batch_size,
+                                           all_or_nothing=args.all_or_nothing, dry_run=args.dry_run)
+        print_report(report, elapsed)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        if stub:
+            stub.stop()
+    sys.exit(0 if report['success'] else 1)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Load Generator
+Drives full assessment lifecycles from many concurrent virtual users and
+reports throughput plus per-endpoint latency percentiles.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend_client import ScorecardClient
+from backend_test import ERPScorecardTester
+
+# One lifecycle per virtual user iteration, built from the functional tests
+LIFECYCLE = [
+    "test_start_assessment",
+    "test_save_answers",
+    "test_calculate_results",
+    "test_get_results",
+]
+
+class LoadReport:
+    """Outcome of a load run"""
+
+    def __init__(self, users, duration, ramp_up, elapsed, recorder, completed, failed):
+        self.users = users
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.elapsed = elapsed
+        self.recorder = recorder
+        self.completed_lifecycles = completed
+        self.failed_lifecycles = failed
+
+    def endpoint_stats(self):
+        return self.recorder.summary(self.elapsed)
+
+    def print_report(self):
+        total_requests = len(self.recorder.records)
+        print("=" * 78)
+        print("CloudReady ERP Scorecard Load Test")
+        print(f"Virtual users: {self.users}, Duration: {self.duration}s, Ramp-up: {self.ramp_up}s")
+        print(f"Elapsed: {self.elapsed:.2f}s")
+        print(f"Lifecycles: {self.completed_lifecycles} completed, {self.failed_lifecycles} failed "
+              f"({self.completed_lifecycles / self.elapsed if self.elapsed else 0:.2f}/s)")
+        print(f"Requests: {total_requests} ({total_requests / self.elapsed if self.elapsed else 0:.2f}/s)")
+        print("=" * 78)
+        print(f"{'Endpoint':<32}{'Reqs':>7}{'Errs':>6}{'Req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+        for endpoint, row in self.endpoint_stats().items():
+            print(f"{endpoint:<32}{row['requests']:>7}{row['errors']:>6}{row['rps']:>8.2f}"
+                  f"{row['p50'] * 1000:>9.1f}{row['p95'] * 1000:>9.1f}{row['p99'] * 1000:>9.1f}")
+        print("=" * 78)
+
+
+class VirtualUser:
+    """One simulated customer repeatedly completing assessments"""
+
+    def __init__(self, client, before_step=None):
+        self.tester = ERPScorecardTester(max_workers=1, verbose=False, client=client)
+        # Called before every lifecycle step, e.g. to pace the user to a target request rate
+        self.before_step = before_step
+        self.completed = 0
+        self.failed = 0
+
+    def run_lifecycle(self):
+        """Start, answer, score and fetch one assessment with fresh IDs"""
+        self.tester.assessment_id = None
+        self.tester.profile_id = None
+        for step in LIFECYCLE:
+            if self.before_step:
+                self.before_step()
+            if not getattr(self.tester, step)():
+                return False
+        return True
+
+    def run(self, start_delay, deadline):
+        time.sleep(start_delay)
+        while time.monotonic() < deadline:
+            if self.run_lifecycle():
+                self.completed += 1
+            else:
+                self.failed += 1
+
+
+def run_load(users=10, duration=60, ramp_up=10, base_url=None, client=None, run_tag=None):
+    """Run `users` virtual users for `duration` seconds, started evenly over `ramp_up` seconds.
+
+    All virtual users share one client, so keep-alive connections are reused
+    rather than set up again per user. Their data is tagged with `run_tag`.
+    """
+    users = max(1, users)
+    client = client or ScorecardClient(base_url, pool_size=users, run_tag=run_tag)
+    recorder = client.metrics
+    virtual_users = [VirtualUser(client) for _ in range(users)]
+    started = time.monotonic()
+    deadline = started + duration
+    step = ramp_up / users if ramp_up > 0 else 0
+
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        futures = [pool.submit(user.run, index * step, deadline) for index, user in enumerate(virtual_users)]
+        for future in futures:
+            future.result()
+
+    elapsed = time.monotonic() - started
+    return LoadReport(
+        users, duration, ramp_up, elapsed, recorder,
+        sum(user.completed for user in virtual_users),
+        sum(user.failed for user in virtual_users),
+    )
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Multi-Process Load Generator
+Spreads virtual users over worker processes (one per core by default) so
+client-side CPU and the GIL stop capping the load. Every virtual user runs the
+same tester lifecycle as the single-process load mode. Each worker records
+per-endpoint latencies into LatencyHistograms; the parent merges them into
+one throughput and percentile report, with rates over the measured run time.
+
+With a target rate, every lifecycle step has an intended send time. The
+corrected latency is measured from that time rather than from the actual
+send, so a stalled server is not hidden by the generator waiting for it
+(coordinated omission).
+"""
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend_client import ScorecardClient
+from backend_histogram import LatencyHistogram
+from backend_load import VirtualUser
+from backend_metrics import MetricsRecorder
+
+# Seconds allowed for worker processes to start before the common start time
+STARTUP_GRACE = 3.0
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class HistogramRecorder(MetricsRecorder):
+    """Folds every request into per-endpoint LatencyHistograms instead of keeping a record of it.
+
+    With pacing, the first request of each lifecycle step is also measured
+    from its intended send time (set per thread in `intended.time`); the
+    others in the step from their actual send.
+    """
+
+    def __init__(self, base_url='', paced=False):
+        super().__init__(base_url)
+        self.paced = paced
+        self.intended = threading.local()
+        self.histograms, self.corrected, self.errors = {}, {}, {}
+
+    def record(self, **fields):
+        finished = fields['timestamp'] + fields['wall']
+        intended = getattr(self.intended, 'time', None)
+        self.intended.time = None
+        endpoint = self.endpoint(fields)
+        with self._lock:
+            self.histograms.setdefault(endpoint, LatencyHistogram()).record(fields['wall'])
+            if self.paced:
+                latency = finished - intended if intended is not None else fields['wall']
+                self.corrected.setdefault(endpoint, LatencyHistogram()).record(latency)
+            if fields['status'] is None or fields['status'] >= 400:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+
+def run_worker(spec):
+    """Drive spec['users'] virtual users in this process; return serialized histograms and counts.
+
+    Each user is a backend_load.VirtualUser running the tester's lifecycle.
+    """
+    interval = len(spec['users']) / spec['rate'] if spec['rate'] else None
+    recorder = HistogramRecorder(paced=bool(interval))
+    client = ScorecardClient(spec['base_url'], pool_size=max(1, len(spec['users'])), metrics=recorder,
+                             run_tag=spec['run_tag'])
+    deadline = spec['start_at'] + spec['duration']
+
+    def pacer():
+        """Sleep until the user's next intended send; each user's share of the rate sets the interval"""
+        state = {'next': None}
+
+        def pace():
+            now = time.time()
+            if state['next'] is None:
+                state['next'] = now
+            time.sleep(max(0.0, state['next'] - now))
+            recorder.intended.time = state['next']
+            state['next'] += interval
+        return pace
+
+    users = [VirtualUser(client, before_step=pacer() if interval else None) for _ in spec['users']]
+
+    def drive(user, delay):
+        # start_at and deadline are wall-clock times shared by all workers; VirtualUser runs on monotonic time
+        user.run(max(0.0, spec['start_at'] + delay - time.time()), time.monotonic() + deadline - time.time())
+
+    with ThreadPoolExecutor(max_workers=max(1, len(users))) as pool:
+        for future in [pool.submit(drive, user, delay) for user, (_, delay) in zip(users, spec['users'])]:
+            future.result()
+    elapsed = time.time() - spec['start_at']
+    client.close()
+
+    return {
+        'worker': spec['worker'],
+        'pid': os.getpid(),
+        'elapsed': elapsed,
+        'histograms': {endpoint: histogram.to_dict() for endpoint, histogram in recorder.histograms.items()},
+        'corrected': {endpoint: histogram.to_dict() for endpoint, histogram in recorder.corrected.items()},
+        'errors': recorder.errors,
+        'completed': sum(user.completed for user in users),
+        'failed': sum(user.failed for user in users),
+    }
+
+
+class DistributedLoadReport:
+    """Merged outcome of all worker processes"""
+
+    def __init__(self, users, processes, duration, rate, results):
+        self.users = users
+        self.processes = processes
+        self.duration = duration
+        self.rate = rate
+        # Lifecycles in flight at the deadline still finish, so the run lasts longer than `duration`
+        self.elapsed = max(result['elapsed'] for result in results)
+        self.completed_lifecycles = sum(result['completed'] for result in results)
+        self.failed_lifecycles = sum(result['failed'] for result in results)
+        self.histograms = self._merge(result['histograms'] for result in results)
+        self.corrected = self._merge(result['corrected'] for result in results)
+        self.errors = {}
+        for result in results:
+            for endpoint, count in result['errors'].items():
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + count
+
+    @staticmethod
+    def _merge(per_worker):
+        merged = {}
+        for histograms in per_worker:
+            for endpoint, data in histograms.items():
+                merged.setdefault(endpoint, LatencyHistogram()).merge(LatencyHistogram.from_dict(data))
+        if merged:
+            merged['ALL'] = LatencyHistogram()
+            for endpoint, histogram in list(merged.items()):
+                if endpoint != 'ALL':
+                    merged['ALL'].merge(histogram)
+        return merged
+
+    def endpoint_stats(self, corrected=False):
+        source = self.corrected if corrected else self.histograms
+        return {
+            endpoint: {
+                'requests': histogram.count,
+                'errors': self.errors.get(endpoint, 0) if endpoint != 'ALL' else sum(self.errors.values()),
+                'rps': histogram.count / self.elapsed if self.elapsed else 0.0,
+                'mean': histogram.mean,
+                **{f"p{pct:g}": histogram.percentile(pct) for pct in PERCENTILES},
+                'max': histogram.max,
+                'buckets': len(histogram.buckets),
+            }
+            for endpoint, histogram in sorted(source.items(), key=lambda item: (item[0] == 'ALL', item[0]))
+        }
+
+    def _print_table(self, title, stats):
+        print(title)
+        print(f"{'Endpoint':<26}{'Reqs':>8}{'Errs':>6}{'Req/s':>9}" + ''.join(f"{'p' + format(p, 'g'):>9}" for p in PERCENTILES)
+              + f"{'max':>9}")
+        for endpoint, row in stats.items():
+            print(f"{endpoint:<26}{row['requests']:>8}{row['errors']:>6}{row['rps']:>9.1f}"
+                  + ''.join(f"{row[f'p{pct:g}'] * 1000:>9.1f}" for pct in PERCENTILES)
+                  + f"{row['max'] * 1000:>9.1f}")
+
+    def print_report(self):
+        print("=" * 98)
+        print("CloudReady ERP Scorecard Multi-Process Load Test")
+        print(f"Virtual users: {self.users} over {self.processes} processes, Duration: {self.duration}s, "
+              f"Target rate: {f'{self.rate:g} steps/s' if self.rate else 'unthrottled'}")
+        print(f"Elapsed: {self.elapsed:.2f}s")
+        print(f"Lifecycles: {self.completed_lifecycles} completed, {self.failed_lifecycles} failed")
+        print("=" * 98)
+        self._print_table("Service time (ms), measured from the actual send", self.endpoint_stats())
+        if self.corrected:
+            print("-" * 98)
+            self._print_table("Corrected for coordinated omission (ms), measured from the intended send",
+                              self.endpoint_stats(corrected=True))
+        print("=" * 98)
+
+    def write_json(self, path):
+        with open(path, 'w') as f:
+            json.dump({
+                'users': self.users, 'processes': self.processes, 'duration': self.duration, 'elapsed': self.elapsed,
+                'rate': self.rate,
+                'completedLifecycles': self.completed_lifecycles, 'failedLifecycles': self.failed_lifecycles,
+                'endpoints': self.endpoint_stats(),
+                'corrected': self.endpoint_stats(corrected=True) if self.corrected else None,
+                'histograms': {endpoint: histogram.to_dict() for endpoint, histogram in self.histograms.items()},
+            }, f, indent=2)
+
+
+def run_distributed_load(users=10, duration=60, ramp_up=10, processes=None, rate=None, base_url=None, run_tag=None):
+    """Run `users` virtual users split over `processes` workers (default: one per core).
+
+    Users are started evenly over `ramp_up` seconds across all workers. With
+    `rate` (lifecycle steps/second over all users) each user paces its steps and
+    corrected latencies are reported as well. All workers tag their data with `run_tag`.
+    """
+    processes = max(1, min(processes or os.cpu_count() or 1, users))
+    start_at = time.time() + STARTUP_GRACE
+    step = ramp_up / users if ramp_up > 0 else 0
+    specs = [
+        {
+            'worker': worker,
+            'base_url': base_url,
+            'users': [(number, number * step) for number in range(worker, users, processes)],
+            'start_at': start_at,
+            'duration': duration,
+            'rate': None,
+            'run_tag': run_tag,
+        }
+        for worker in range(processes)
+    ]
+    for spec in specs:
+        spec['rate'] = rate * len(spec['users']) / users if rate else None
+
+    # spawn, not fork: the parent may be running an in-process server thread
+    with multiprocessing.get_context('spawn').Pool(processes) as pool:
+        results = pool.map(run_worker, specs)
+    return DistributedLoadReport(users, processes, duration, rate, results)
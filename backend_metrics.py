@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Request Metrics
+Per-request timing, payload size and status instrumentation for the
+requests session used by the backend tester and load tools.
+
+Responses are decoded here rather than inside urllib3, so every record
+carries the compressed (wire) size, the decoded size and the decode time.
+brotli is optional (pip install brotli); without it only gzip is accepted.
+"""
+
+import json
+import math
+import re
+import threading
+import time
+import zlib
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import requests
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Path segments that are generated IDs rather than route names
+ID_SEGMENT = re.compile(r'^(?=.*\d)[0-9a-fA-F-]{8,}$|^\d+$')
+
+# Content codings decode_body handles, sent on every request
+ACCEPT_ENCODING = 'br, gzip' if brotli else 'gzip'
+
+
+def route_template(url, base_url):
+    """Map a request URL to its route template, e.g. /results/:id"""
+    path = urlsplit(url).path
+    base_path = urlsplit(base_url).path.rstrip('/')
+    if base_path and path.startswith(base_path):
+        path = path[len(base_path):]
+    segments = [':id' if ID_SEGMENT.match(segment) else segment for segment in path.split('/')]
+    return '/'.join(segments) or '/'
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(values)))
+    return values[rank - 1]
+
+
+def parse_server_timing(header):
+    """Server-Timing header -> {metric: duration in seconds}; metrics without dur are skipped"""
+    timings = {}
+    for metric in (header or '').split(','):
+        name, _, params = metric.strip().partition(';')
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if name and key == 'dur':
+                try:
+                    timings[name] = timings.get(name, 0.0) + float(value.strip('"')) / 1000
+                except ValueError:
+                    pass
+    return timings
+
+
+def decode_body(body, encoding):
+    """Decode a response body sent with Content-Encoding `encoding`"""
+    encoding = (encoding or '').strip().lower()
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    if encoding == 'deflate':
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    if encoding == 'br' and brotli:
+        return brotli.decompress(body)
+    return body
+
+
+def check_budgets(summary, budgets):
+    """Payload-size budget violations, as messages.
+
+    `budgets` maps 'METHOD /route' to limits on the largest response seen:
+    wireBytes (as sent, compressed) and/or responseBytes (decoded).
+    """
+    violations = []
+    for endpoint, limits in budgets.items():
+        row = summary.get(endpoint)
+        if not row:
+            continue
+        for field, measured in (('wireBytes', row['maxWireBytes']), ('responseBytes', row['maxResponseBytes'])):
+            limit = limits.get(field)
+            if limit is not None and measured is not None and measured > limit:
+                violations.append(f"{endpoint}: {field} {measured} > budget {limit}")
+    return violations
+
+
+def _body_size(body):
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0
+
+
+def _mean_phases(rows):
+    """Mean duration per Server-Timing phase over the rows that reported it"""
+    totals, counts = {}, {}
+    for row in rows:
+        for phase, seconds in (row.get('serverTiming') or {}).items():
+            totals[phase] = totals.get(phase, 0.0) + seconds
+            counts[phase] = counts.get(phase, 0) + 1
+    return {phase: totals[phase] / counts[phase] for phase in totals}
+
+
+class MetricsRecorder:
+    """Thread-safe store of one record per HTTP request"""
+
+    def __init__(self, base_url=''):
+        self.base_url = base_url
+        self.started_at = datetime.now()
+        self.records = []
+        self._lock = threading.Lock()
+
+    def record(self, **fields):
+        with self._lock:
+            self.records.append(fields)
+
+    def drain(self):
+        """Return and forget every record so far; keeps long runs at constant memory"""
+        with self._lock:
+            records, self.records = self.records, []
+        return records
+
+    def endpoint(self, record):
+        return f"{record['method']} {record['route']}"
+
+    def summary(self, elapsed=None):
+        """Per-endpoint aggregates, keyed by 'METHOD /route'"""
+        with self._lock:
+            records = list(self.records)
+        groups = {}
+        for record in records:
+            groups.setdefault(self.endpoint(record), []).append(record)
+
+        summary = {}
+        for endpoint, rows in sorted(groups.items()):
+            wall = sorted(row['wall'] for row in rows)
+            ttfb = sorted(row['ttfb'] for row in rows if row['ttfb'] is not None)
+            # Unknown when the body never crossed the wire, e.g. replayed from a cassette. Requests that
+            # refused compression on purpose say nothing about what clients are normally sent
+            wire = [row['wireBytes'] for row in rows
+                    if row.get('wireBytes') is not None and row.get('acceptEncoding') != 'identity']
+            decode = [row['decodeSeconds'] for row in rows if row.get('decodeSeconds') is not None]
+            summary[endpoint] = {
+                'requests': len(rows),
+                'errors': sum(1 for row in rows if not row['status'] or row['status'] >= 400),
+                'rps': len(rows) / elapsed if elapsed else None,
+                'p50': percentile(wall, 50),
+                'p95': percentile(wall, 95),
+                'p99': percentile(wall, 99),
+                'max': wall[-1],
+                'ttfbP50': percentile(ttfb, 50),
+                'requestBytes': sum(row['requestBytes'] for row in rows),
+                'responseBytes': sum(row['responseBytes'] for row in rows),
+                'avgResponseBytes': sum(row['responseBytes'] for row in rows) / len(rows),
+                'maxResponseBytes': max(row['responseBytes'] for row in rows),
+                'wireBytes': sum(wire) if wire else None,
+                'avgWireBytes': sum(wire) / len(wire) if wire else None,
+                'maxWireBytes': max(wire) if wire else None,
+                'encodings': sorted({row['contentEncoding'] for row in rows if row.get('contentEncoding')}),
+                'decodeSeconds': sum(decode) / len(decode) if decode else None,
+                'retries': sum(row['retries'] for row in rows),
+                'serverTiming': _mean_phases(rows),
+            }
+        return summary
+
+    def print_summary(self, title="Per-Endpoint Summary"):
+        summary = self.summary()
+        print(title)
+        print(f"{'Endpoint':<34}{'Reqs':>6}{'Errs':>6}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"
+              f"{'TTFB ms':>9}{'Avg B':>9}{'Retry':>7}")
+        for endpoint, row in summary.items():
+            print(f"{endpoint:<34}{row['requests']:>6}{row['errors']:>6}{row['p50'] * 1000:>9.1f}"
+                  f"{row['p95'] * 1000:>9.1f}{row['max'] * 1000:>9.1f}{row['ttfbP50'] * 1000:>9.1f}"
+                  f"{row['avgResponseBytes']:>9.0f}{row['retries']:>7}")
+        self.print_server_timing(summary)
+        self.print_compression(summary)
+
+    def print_compression(self, summary=None):
+        """Wire vs decoded size and client decode time, for endpoints that sent compressed bodies"""
+        summary = summary or self.summary()
+        rows = {endpoint: row for endpoint, row in summary.items() if row['encodings'] and row['avgWireBytes']}
+        if not rows:
+            return
+        print("Response compression (mean per request)")
+        print(f"{'Endpoint':<34}{'Coding':>8}{'Wire B':>9}{'Decoded B':>11}{'Ratio':>7}{'Decode ms':>11}")
+        for endpoint, row in rows.items():
+            decode = f"{row['decodeSeconds'] * 1000:>11.3f}" if row['decodeSeconds'] is not None else f"{'-':>11}"
+            print(f"{endpoint:<34}{','.join(row['encodings']):>8}{row['avgWireBytes']:>9.0f}"
+                  f"{row['avgResponseBytes']:>11.0f}{row['avgResponseBytes'] / row['avgWireBytes']:>7.1f}{decode}")
+
+    def print_server_timing(self, summary=None):
+        """Mean Server-Timing phase per endpoint, for endpoints whose responses carried the header"""
+        summary = summary or self.summary()
+        phases = sorted({phase for row in summary.values() for phase in row['serverTiming']})
+        if not phases:
+            return
+        print("Server-Timing breakdown (mean ms per request)")
+        print(f"{'Endpoint':<34}" + ''.join(f"{phase:>11}" for phase in phases) + f"{'server':>9}{'wall p50':>10}")
+        for endpoint, row in summary.items():
+            timing = row['serverTiming']
+            if not timing:
+                continue
+            print(f"{endpoint:<34}"
+                  + ''.join(f"{timing[phase] * 1000:>11.2f}" if phase in timing else f"{'-':>11}" for phase in phases)
+                  + f"{sum(timing.values()) * 1000:>9.2f}{row['p50'] * 1000:>10.1f}")
+
+    def write_json(self, path):
+        """Write the summary and raw records for tracking latency across deployments"""
+        with self._lock:
+            records = list(self.records)
+        report = {
+            'baseUrl': self.base_url,
+            'startedAt': self.started_at.isoformat(),
+            'endpoints': self.summary(),
+            'requests': records,
+        }
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+class InstrumentedSession(requests.Session):
+    """requests.Session that records every request into a MetricsRecorder.
+
+    Bodies are read undecoded and decoded here, so each record has the wire
+    size, decoded size and decode time. A streamed response is recorded once
+    its body has been consumed or closed, with the wall time up to that point.
+    """
+
+    def __init__(self, recorder):
+        super().__init__()
+        self.recorder = recorder
+        self.headers['Accept-Encoding'] = ACCEPT_ENCODING
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        fields = {
+            'method': request.method,
+            'route': route_template(request.url, self.recorder.base_url),
+            'requestBytes': _body_size(request.body),
+            'acceptEncoding': request.headers.get('Accept-Encoding'),
+            'timestamp': time.time(),
+        }
+        stream = kwargs.pop('stream', False)
+        try:
+            response = super().send(request, stream=True, **kwargs)
+        except requests.RequestException as e:
+            self.recorder.record(status=None, wall=time.perf_counter() - started, ttfb=None,
+                                 responseBytes=0, wireBytes=None, decodeSeconds=None, contentEncoding=None,
+                                 retries=0, error=type(e).__name__, **fields)
+            raise
+
+        retries = getattr(getattr(response.raw, 'retries', None), 'history', None) or ()
+        fields.update(
+            status=response.status_code,
+            ttfb=response.elapsed.total_seconds(),
+            retries=len(retries),
+            serverTiming=parse_server_timing(response.headers.get('Server-Timing')),
+            contentEncoding=response.headers.get('Content-Encoding'),
+        )
+        if stream:
+            self._record_when_consumed(response, started, fields)
+            return response
+
+        wire_bytes = decode_seconds = None
+        if response._content_consumed:
+            # An adapter (e.g. a cassette) already read and decoded the body
+            wire_bytes = self._wire_bytes(response)
+        else:
+            body = response.raw.read(decode_content=False) or b''
+            response.raw.release_conn()
+            wire_bytes = len(body)
+            decode_started = time.perf_counter()
+            response._content = decode_body(body, fields['contentEncoding'])
+            decode_seconds = time.perf_counter() - decode_started
+            response._content_consumed = True
+        self.recorder.record(wall=time.perf_counter() - started, responseBytes=len(response.content),
+                             wireBytes=wire_bytes, decodeSeconds=decode_seconds, **fields)
+        return response
+
+    @staticmethod
+    def _wire_bytes(response):
+        """Body bytes urllib3 read off the connection, or None when the response never used one"""
+        tell = getattr(response.raw, 'tell', None)
+        return tell() if callable(tell) else None
+
+    def _record_when_consumed(self, response, started, fields):
+        """Wrap iter_content and close so the record is written once the stream is read or abandoned"""
+        iter_content, close = response.iter_content, response.close
+        state = {'bytes': 0, 'recorded': False}
+
+        def record():
+            if not state['recorded']:
+                state['recorded'] = True
+                self.recorder.record(wall=time.perf_counter() - started, responseBytes=state['bytes'],
+                                     wireBytes=self._wire_bytes(response), decodeSeconds=None, **fields)
+
+        def counted(*args, **kwargs):
+            for chunk in iter_content(*args, **kwargs):
+                state['bytes'] += len(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+                yield chunk
+            record()
+
+        def closing():
+            record()
+            close()
+
+        response.iter_content = counted
+        response.close = closing
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Reference Scoring
+A NumPy implementation of the README Scoring Logic that scores thousands of
+answer sets in one pass, used to check /api/calculate-results in bulk.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+PILLAR_KEYS = [f"P{i}" for i in range(1, 11)]
+GATE_KEYS = [f"G{i}" for i in range(1, 6)]
+RAG_LABELS = np.array(['Red', 'Amber', 'Green'])
+GATE_LABELS = np.array(['FAIL', 'CONDITIONAL', 'PASS'])
+DECISION_LABELS = np.array(['NO-GO', 'GO with conditions', 'GO'])
+TOP_N = 10
+
+
+def round_half_up(values):
+    """Match JavaScript's Math.round"""
+    return np.floor(values + 0.5)
+
+
+def _one_hot(keys, labels):
+    """(questions x labels) membership matrix; unknown or null keys map to no column"""
+    index = {label: column for column, label in enumerate(labels)}
+    matrix = np.zeros((len(keys), len(labels)))
+    for row, key in enumerate(keys):
+        if key in index:
+            matrix[row, index[key]] = 1.0
+    return matrix
+
+
+def _group_average(scores, answered, membership):
+    """Per-group mean score over answered questions; NaN where a group has no answers"""
+    totals = scores @ membership
+    counts = answered.astype(float) @ membership
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, totals / np.where(counts > 0, counts, 1), np.nan), counts
+
+
+def _rank(values, limit):
+    """Indices of the `limit` largest finite values per row, ties kept in question order; -1 pads"""
+    order = np.argsort(-values, axis=1, kind='stable')[:, :limit]
+    picked = np.take_along_axis(values, order, axis=1)
+    return np.where(np.isfinite(picked), order, -1)
+
+
+class BatchScores:
+    """Scores for a batch of answer sets; row i belongs to answer set i"""
+
+    def __init__(self, questions, pillar_percent, pillar_counts, overall_raw, gate_average, gate_counts,
+                 risk_scores, top_risks, quick_wins):
+        self.questions = questions
+        self.pillar_percent = pillar_percent
+        self.pillar_answered = pillar_counts > 0
+        self.overall_raw = overall_raw
+        self.overall = round_half_up(overall_raw).astype(int)
+        self.gate_average = gate_average
+        self.gate_answered = gate_counts > 0
+        self.risk_scores = risk_scores
+        self.top_risks = top_risks
+        self.quick_wins = quick_wins
+
+        # 0 = Red/FAIL/NO-GO ... 2 = Green/PASS/GO; -1 where nothing was answered
+        percent = np.nan_to_num(pillar_percent)
+        self.pillar_rag = np.where(self.pillar_answered, (percent >= 50).astype(int) + (percent >= 75), -1)
+        average = np.nan_to_num(gate_average)
+        self.gate_status = np.where(self.gate_answered, (average >= 2.5).astype(int) + (average >= 3.0), -1)
+        any_fail = (self.gate_status == 0).any(axis=1)
+        conditional = (self.gate_status == 1).sum(axis=1)
+        self.decision = np.where(any_fail, 0, np.where(conditional >= 2, 1, 2))
+
+    def __len__(self):
+        return len(self.overall)
+
+    def expected(self, row):
+        """Row `row` in the shape returned by /calculate-results"""
+        def risk_items(ranked):
+            return [
+                {'questionId': self.questions[column]['id'], 'riskScore': float(self.risk_scores[row, column])}
+                for column in ranked[row] if column >= 0
+            ]
+        return {
+            'overallScore': int(self.overall[row]),
+            'pillarResults': {
+                pillar: {'score': float(self.pillar_percent[row, column]),
+                         'avgScore': float(self.pillar_percent[row, column] * 4 / 100),
+                         'rag': RAG_LABELS[self.pillar_rag[row, column]]}
+                for column, pillar in enumerate(PILLAR_KEYS) if self.pillar_answered[row, column]
+            },
+            'gateResults': {
+                gate: {'avgScore': float(self.gate_average[row, column]), 'status': GATE_LABELS[self.gate_status[row, column]]}
+                for column, gate in enumerate(GATE_KEYS) if self.gate_answered[row, column]
+            },
+            'decision': DECISION_LABELS[self.decision[row]],
+            'topRisks': risk_items(self.top_risks),
+            'quickWins': risk_items(self.quick_wins),
+        }
+
+
+def score_batch(questions, weights, scores):
+    """Score a batch of answer sets.
+
+    questions: question dicts (id, pillar, gate, effort, sortOrder) in column order
+    weights:   pillar weights, e.g. {'P1': 12, ...}
+    scores:    array of shape (answer sets, questions) holding 0-4, NaN = unanswered
+    """
+    order = sorted(range(len(questions)), key=lambda column: questions[column].get('sortOrder', 0))
+    questions = [questions[column] for column in order]
+    scores = np.asarray(scores, dtype=float)[:, order]
+    answered = ~np.isnan(scores)
+    filled = np.where(answered, scores, 0.0)
+
+    pillar_membership = _one_hot([q['pillar'] for q in questions], PILLAR_KEYS)
+    gate_membership = _one_hot([q.get('gate') for q in questions], GATE_KEYS)
+    pillar_weights = np.array([weights.get(pillar, 0) for pillar in PILLAR_KEYS], dtype=float)
+
+    pillar_average, pillar_counts = _group_average(filled, answered, pillar_membership)
+    pillar_percent = pillar_average / 4 * 100
+    # OverallScore = SUM(PillarScore% * PillarWeight), with the weights normalized over the answered pillars
+    weighted_total = (np.nan_to_num(pillar_percent) * pillar_weights).sum(axis=1)
+    weight_total = ((pillar_counts > 0) * pillar_weights).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        overall_raw = np.where(weight_total > 0, weighted_total / np.where(weight_total > 0, weight_total, 1), 0.0)
+
+    gate_average, gate_counts = _group_average(filled, answered, gate_membership)
+
+    # RiskScore = (4 - Score) * PillarWeight for every answer scored 0 or 1
+    question_weights = pillar_membership @ pillar_weights
+    is_risk = answered & (filled <= 1)
+    risk_scores = np.where(is_risk, (4 - filled) * question_weights, -np.inf)
+    low_effort = np.array([q.get('effort') == 'L' for q in questions])
+    quick_win_scores = np.where(low_effort, risk_scores, -np.inf)
+
+    return BatchScores(
+        questions, pillar_percent, pillar_counts, overall_raw, gate_average, gate_counts,
+        risk_scores, _rank(risk_scores, TOP_N), _rank(quick_win_scores, TOP_N),
+    )
+
+
+def _close(server_value, raw, half_step):
+    """A rounded server value matches the raw reference value to within half a rounding step"""
+    return server_value is not None and abs(server_value - raw) <= half_step + 1e-9
+
+
+def compare(batch, server_results):
+    """Compare server results row by row; returns {field: [mismatching rows]}"""
+    mismatches = {}
+
+    def flag(field, row):
+        mismatches.setdefault(field, []).append(row)
+
+    for row, server in enumerate(server_results):
+        if server is None:
+            flag('missing', row)
+            continue
+        expected = batch.expected(row)
+        # Accept either rounding direction only when the raw score sits on a .5 boundary
+        if not _close(server.get('overallScore'), batch.overall_raw[row], 0.5):
+            flag('overallScore', row)
+        if server.get('decision') != expected['decision']:
+            flag('decision', row)
+        server_pillars = server.get('pillarResults', {})
+        if set(server_pillars) != set(expected['pillarResults']):
+            flag('pillars', row)
+        else:
+            if any(server_pillars[p].get('rag') != value['rag'] for p, value in expected['pillarResults'].items()):
+                flag('pillarRag', row)
+            if any(not _close(server_pillars[p].get('score'), value['score'], 0.5)
+                   for p, value in expected['pillarResults'].items()):
+                flag('pillarScore', row)
+            if any(not _close(server_pillars[p].get('avgScore'), value['avgScore'], 0.005)
+                   for p, value in expected['pillarResults'].items()):
+                flag('pillarAvgScore', row)
+        server_gates = server.get('gateResults', {})
+        if set(server_gates) != set(expected['gateResults']):
+            flag('gates', row)
+        else:
+            if any(server_gates[g].get('status') != value['status'] for g, value in expected['gateResults'].items()):
+                flag('gateStatus', row)
+            if any(not _close(server_gates[g].get('avgScore'), value['avgScore'], 0.005)
+                   for g, value in expected['gateResults'].items()):
+                flag('gateAvgScore', row)
+        for field in ('topRisks', 'quickWins'):
+            expected_ids = [item['questionId'] for item in expected[field]]
+            if [item.get('questionId') for item in server.get(field, [])] != expected_ids:
+                flag(field, row)
+    return mismatches
+
+
+def random_answer_sets(count, question_count, seed=0, unanswered_rate=0.1):
+    """Seeded answer sets spread across the whole 0-4 range, with some gaps"""
+    rng = np.random.default_rng(seed)
+    centre = rng.uniform(0, 4, size=(count, 1))
+    scores = np.clip(np.rint(rng.normal(centre, 1.0, size=(count, question_count))), 0, 4)
+    scores[rng.random((count, question_count)) < unanswered_rate] = np.nan
+    return scores
+
+
+def verify_server(base_url=None, count=200, workers=8, seed=0, keep_data=False):
+    """Score `count` random answer sets on the server and compare them with score_batch.
+
+    Unless `keep_data`, the assessments created on the server are torn down afterwards.
+    """
+    from backend_client import ScorecardClient, new_run_tag
+    from backend_test import ERPScorecardTester
+
+    client = ScorecardClient(base_url, pool_size=workers, run_tag=new_run_tag('verify'))
+    questions = client.get_questions().json()['questions']
+    weights = client.get_settings().json()['settings']['weights']
+    scores = random_answer_sets(count, len(questions), seed)
+
+    def run_one(row):
+        tester = ERPScorecardTester(max_workers=1, verbose=False, client=client)
+        answers = [
+            {'questionId': question['id'], 'score': int(score)}
+            for question, score in zip(questions, scores[row]) if not np.isnan(score)
+        ]
+        if tester.test_start_assessment() and tester.test_save_answers(answers) and tester.test_calculate_results():
+            return tester.last_results
+        return None
+
+    started = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            server_results = list(pool.map(run_one, range(count)))
+    finally:
+        if not keep_data:
+            client.admin_teardown()
+    server_elapsed = time.monotonic() - started
+
+    started = time.monotonic()
+    batch = score_batch(questions, weights, scores)
+    reference_elapsed = time.monotonic() - started
+
+    mismatches = compare(batch, server_results)
+    print("=" * 60)
+    print("CloudReady ERP Scorecard Scoring Verification")
+    print(f"Answer sets: {count} over {len(questions)} questions (seed {seed})")
+    print(f"Server scoring: {server_elapsed:.2f}s, reference scoring: {reference_elapsed * 1000:.1f}ms")
+    if mismatches:
+        for field, rows in sorted(mismatches.items()):
+            print(f"❌ {field}: {len(rows)} mismatching answer sets, e.g. rows {rows[:5]}")
+    else:
+        print("✅ Server results match the reference scoring for every answer set")
+    print("=" * 60)
+    return not mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify /calculate-results against the reference scoring")
+    parser.add_argument("--count", type=int, default=200, help="answer sets to score (default 200)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--offline", action="store_true", help="verify the in-process stand-in")
+    parser.add_argument("--keep-data", action="store_true",
+                        help="leave the assessments this run created instead of tearing them down")
+    args = parser.parse_args()
+
+    stub = None
+    base_url = None
+    if args.offline:
+        from backend_stub_server import StubServer
+        stub = StubServer().start()
+        base_url = stub.base_url
+    try:
+        success = verify_server(base_url, args.count, args.workers, args.seed, args.keep_data)
+    finally:
+        if stub:
+            stub.stop()
+    sys.exit(0 if success else 1)
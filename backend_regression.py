@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Performance Regression Gate
+Times each key endpoint a fixed number of times, reduces the samples to
+robust statistics (median, p95, MAD) and compares them with the baseline
+stored in perf_baseline.json for the same target. Record or re-baseline after
+an intentional change with --update-baseline (alias --rebaseline); without a
+stored baseline the gate fails.
+"""
+
+import json
+import os
+import random
+import statistics
+import time
+from datetime import datetime
+
+from backend_client import new_run_tag
+from backend_metrics import percentile
+from backend_test import ERPScorecardTester
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perf_baseline.json')
+
+# Allowed relative growth before a latency or payload size counts as a regression
+LATENCY_TOLERANCE = 0.25
+SIZE_TOLERANCE = 0.10
+
+# Latency changes smaller than this (ms), or than 3 baseline MADs, are treated as noise
+MIN_LATENCY_DELTA = 2.0
+MAD_FACTOR = 3
+
+# p95 is noisier than the median, so it gets this many times the tolerance and allowance
+P95_FACTOR = 2
+
+WARMUP = 2
+
+# Endpoints whose payload grows with the data on the server (bank size, completed assessments);
+# their bytes are reported but only their latency is gated
+SIZE_UNGATED = {'GET /admin/questions', 'GET /admin/assessments?limit=100'}
+
+
+def endpoints(tester, answers):
+    """(name, call) pairs timed by the gate; each call returns a requests.Response"""
+    client = tester.client
+    return [
+        ('GET /', client.get_root),
+        ('GET /questions', client.get_questions),
+        ('GET /settings', client.get_settings),
+        ('POST /save-answers', lambda: client.save_answers(tester.assessment_id, answers=answers)),
+        ('POST /calculate-results', lambda: client.calculate_results(tester.assessment_id, recompute=True)),
+        ('GET /results/:id', lambda: client.get_results(tester.assessment_id)),
+        ('GET /admin/questions', client.admin_list_questions),
+        ('GET /admin/stats', client.admin_stats),
+        ('GET /admin/assessments?limit=100', lambda: client.admin_assessments(limit=100)),
+    ]
+
+
+def summarize(timings, sizes):
+    """Robust statistics for one endpoint; latencies in ms"""
+    ordered = sorted(value * 1000 for value in timings)
+    median = statistics.median(ordered)
+    return {
+        'median': round(median, 3),
+        'p95': round(percentile(ordered, 95), 3),
+        'mad': round(statistics.median(abs(value - median) for value in ordered), 3),
+        'bytes': int(statistics.median(sizes)),
+        'samples': len(ordered),
+    }
+
+
+def measure(tester, answers, repeats):
+    """Time every endpoint `repeats` times after WARMUP discarded calls.
+
+    An endpoint that answers anything but 200 is recorded as {'failed': status}
+    and the remaining endpoints are still measured.
+    """
+    results = {}
+    for name, call in endpoints(tester, answers):
+        timings, sizes = [], []
+        for attempt in range(WARMUP + repeats):
+            started = time.perf_counter()
+            response = call()
+            elapsed = time.perf_counter() - started
+            if response.status_code != 200:
+                results[name] = {'failed': response.status_code}
+                break
+            if attempt >= WARMUP:
+                timings.append(elapsed)
+                sizes.append(len(response.content))
+        else:
+            results[name] = summarize(timings, sizes)
+    return results
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {'targets': {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, baseline):
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(current, baseline, latency_tolerance=LATENCY_TOLERANCE, size_tolerance=SIZE_TOLERANCE):
+    """Return {endpoint: [problem, ...]} for every endpoint that regressed against `baseline`"""
+    regressions = {}
+    for name, stats in current.items():
+        reference = baseline.get(name)
+        if reference is None or 'failed' in stats:
+            continue
+        problems = []
+        allowance = max(MIN_LATENCY_DELTA, MAD_FACTOR * reference['mad'])
+        for field, factor in (('median', 1), ('p95', P95_FACTOR)):
+            limit = reference[field] * (1 + factor * latency_tolerance) + factor * allowance
+            if stats[field] > limit:
+                problems.append(f"{field} {reference[field]:.1f}ms -> {stats[field]:.1f}ms (limit {limit:.1f}ms)")
+        size_limit = reference['bytes'] * (1 + size_tolerance)
+        if name not in SIZE_UNGATED and stats['bytes'] > size_limit:
+            problems.append(f"size {reference['bytes']}B -> {stats['bytes']}B (limit {size_limit:.0f}B)")
+        if problems:
+            regressions[name] = problems
+    return regressions
+
+
+def bench_regression(base_url=None, repeats=30, target=None, baseline_path=BASELINE_PATH,
+                     latency_tolerance=LATENCY_TOLERANCE, size_tolerance=SIZE_TOLERANCE,
+                     rebaseline=False, seed=0, keep_data=False):
+    """Benchmark the key endpoints and gate on the stored baseline for `target`.
+
+    `target` names the baseline entry ('offline' for the in-process stand-in,
+    otherwise the base URL). With `rebaseline` the measurements replace it;
+    without it, an endpoint that has no stored baseline fails the gate. Unless `keep_data`, the assessments the benchmark created are torn down.
+    """
+    rng = random.Random(seed)
+    tester = ERPScorecardTester(max_workers=1, verbose=False, base_url=base_url, run_tag=new_run_tag('bench'))
+    target = target or tester.base_url
+    try:
+        questions = tester.client.get_questions().json().get('questions', [])
+        answers = [{"questionId": q['id'], "score": rng.randint(0, 4)} for q in questions]
+        if not (tester.test_start_assessment() and tester.test_save_answers(answers)
+                and tester.test_calculate_results()):
+            print("❌ Could not prepare an assessment to benchmark")
+            return False
+        current = measure(tester, answers, repeats)
+    finally:
+        if not keep_data:
+            tester.teardown_run_data()
+
+    baseline = load_baseline(baseline_path)
+    stored = baseline['targets'].get(target, {}).get('endpoints', {})
+    failed = {name: stats['failed'] for name, stats in current.items() if 'failed' in stats}
+    regressions = {} if rebaseline else compare(current, stored, latency_tolerance, size_tolerance)
+    missing = [] if rebaseline else [name for name in current if name not in stored and name not in failed]
+
+    print("=" * 96)
+    print(f"Regression gate: {repeats} runs per endpoint against the '{target}' baseline")
+    print("=" * 96)
+    print(f"{'Endpoint':<34}{'median':>9}{'base':>9}{'p95':>9}{'base':>9}{'MAD':>7}{'bytes':>9}{'base':>9}  Status")
+    for name, stats in current.items():
+        reference = stored.get(name)
+        if name in failed:
+            print(f"{name:<34}{'-':>9}{'-':>9}{'-':>9}{'-':>9}{'-':>7}{'-':>9}{'-':>9}  ❌ FAILED (HTTP {failed[name]})")
+            continue
+        if rebaseline:
+            status = 'rebaselined'
+        elif reference is None:
+            status = '❌ no baseline'
+        else:
+            status = '❌ REGRESSED' if name in regressions else '✅'
+        base = reference or {}
+        print(f"{name:<34}{stats['median']:>9.1f}{base.get('median', float('nan')):>9.1f}"
+              f"{stats['p95']:>9.1f}{base.get('p95', float('nan')):>9.1f}{stats['mad']:>7.1f}"
+              f"{stats['bytes']:>9}{base.get('bytes', '-'):>9}  {status}"
+              f"{' (size not gated)' if name in SIZE_UNGATED and not rebaseline else ''}")
+    for name, problems in regressions.items():
+        for problem in problems:
+            print(f"   {name}: {problem}")
+
+    if failed:
+        print(f"❌ {len(failed)} endpoint(s) did not answer 200: {', '.join(failed)}")
+    if rebaseline and failed:
+        print(f"Baseline for '{target}' left unchanged; fix the failing endpoint(s) and re-run")
+    elif rebaseline:
+        baseline['targets'][target] = {
+            'recordedAt': datetime.now().isoformat(timespec='seconds'),
+            'repeats': repeats,
+            'endpoints': current,
+        }
+        save_baseline(baseline_path, baseline)
+        print(f"Baseline for '{target}' written to {baseline_path}")
+    elif not stored:
+        print(f"❌ No baseline for '{target}' in {baseline_path}; run with --update-baseline to create one")
+    elif missing:
+        print(f"❌ {len(missing)} endpoint(s) have no baseline; run with --update-baseline to record them")
+    elif regressions:
+        print(f"❌ {len(regressions)} endpoint(s) regressed beyond {latency_tolerance:.0%} latency / "
+              f"{size_tolerance:.0%} size tolerance")
+    elif not failed:
+        print("✅ No endpoint regressed against the baseline")
+    print("=" * 96)
+    return not regressions and not missing and not failed
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Bulk Rescoring Driver
+Starts the background job that rescores every completed assessment after a
+pillar-weight or question change (POST /api/admin/rescore), polls its
+progress and ETA, and reports throughput in assessments per second.
+
+Offline, the in-process stand-in is seeded with a synthetic dataset and the
+pillar weights are shifted first, so every stored result is out of date.
+"""
+
+import argparse
+import sys
+import time
+
+from backend_client import ScorecardClient
+
+
+def shift_weights(client):
+    """Move one point of weight from P2 to P1 (the total stays 100), so every stored result is stale"""
+    response = client.get_settings()
+    response.raise_for_status()
+    weights = dict(response.json()['settings']['weights'])
+    weights['P1'] += 1
+    weights['P2'] -= 1
+    client.admin_update_settings({'weights': weights}).raise_for_status()
+    return weights
+
+
+def print_progress(progress):
+    print(f"   {progress['status']:<10}{progress['processed'] + progress['failed']:>8}/{progress['total']:<8}"
+          f"{progress['percent']:>6}%{progress['ratePerSecond']:>10.0f}/s  ETA {progress['etaSeconds']:.0f}s")
+
+
+def run_rescore(client, batch_size=None, concurrency=None, poll=1.0, verbose=True):
+    """Start a rescoring job and wait for it; return (final progress, wall-clock seconds)"""
+    started = time.perf_counter()
+    response = client.admin_start_rescore(batch_size=batch_size, concurrency=concurrency)
+    if response.status_code != 202:
+        raise RuntimeError(f"Could not start rescoring: HTTP {response.status_code} {response.text}")
+    job = response.json()
+    if verbose:
+        print(f"Rescoring job {job['jobId']}: {job['total']} completed assessments, "
+              f"batches of {job['batchSize']} on {job['concurrency']} workers")
+    progress = client.wait_for_rescore(job['jobId'], poll=poll, on_progress=print_progress if verbose else None)
+    return progress, time.perf_counter() - started
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def check_counters(client):
+    """Dashboard counters after rescoring must match a full scan of the results"""
+    incremental = client.admin_stats().json()['stats']
+    recomputed = client.admin_stats(mode='recompute').json()['stats']
+    return incremental == recomputed, incremental, recomputed
+
+
+def check_interleaved_save(synthetic=200, batch_size=50):
+    """Land a save and a calculation between a rescoring batch's read and its write, on a fresh stand-in.
+
+    The fresh result must survive the batch and be counted as skipped, and the
+    dashboard counters must still match a full recompute. Returns a list of
+    failure descriptions; empty when the check passed.
+    """
+    from backend_stub_server import StubServer
+    from backend_test import ERPScorecardTester
+
+    failures = []
+    with StubServer() as stub:
+        stub.store.add_synthetic_assessments(synthetic)
+        tester = ERPScorecardTester(max_workers=1, verbose=False, base_url=stub.base_url)
+        questions = tester.client.get_questions().json()['questions']
+        if not (tester.test_start_assessment()
+                and tester.test_save_answers([{'questionId': q['id'], 'score': 1} for q in questions])
+                and tester.test_calculate_results()):
+            return ["could not prepare an assessment"]
+        shift_weights(tester.client)
+
+        store, fresh = stub.store, {}
+        write = store.rescore
+
+        def interleaved(assessment_id, *args):
+            if assessment_id == tester.assessment_id and not fresh:
+                # Runs after the batch read this assessment and before its write
+                tester.client.save_answers(tester.assessment_id, answers=[
+                    {'questionId': q['id'], 'score': 4} for q in questions]).raise_for_status()
+                fresh.update(tester.client.calculate_results(tester.assessment_id).json()['results'])
+            return write(assessment_id, *args)
+
+        store.rescore = interleaved
+        progress, _ = run_rescore(tester.client, batch_size=batch_size, verbose=False, poll=0.05)
+        stored = tester.client.get_results(tester.assessment_id).json()['result']
+        if not fresh:
+            failures.append("the rescoring job never reached the interleaved assessment")
+        elif stored['id'] != fresh['id']:
+            failures.append(f"the result calculated mid-job was overwritten (overall {fresh['overallScore']} "
+                            f"-> {stored['overallScore']})")
+        if progress['status'] != 'completed' or not progress['skipped']:
+            failures.append(f"job {progress['status']} with {progress['skipped']} skipped; expected the stale write skipped")
+        consistent, incremental, recomputed = check_counters(tester.client)
+        if not consistent:
+            failures.append(f"dashboard counters drifted: {incremental} vs {recomputed}")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rescore all completed assessments and measure throughput")
+    parser.add_argument("--batch-size", type=positive_int, default=None, help="assessments per batch (server default 200)")
+    parser.add_argument("--concurrency", type=positive_int, default=None, help="batches in flight (server default 4)")
+    parser.add_argument("--poll", type=float, default=1.0, help="seconds between progress polls")
+    parser.add_argument("--offline", action="store_true",
+                        help="rescore the in-process stand-in seeded with synthetic assessments")
+    parser.add_argument("--synthetic", type=int, default=50000,
+                        help="offline mode: synthetic completed assessments to seed (default 50000)")
+    parser.add_argument("--check-interleaving", action="store_true",
+                        help="only check, on a fresh stand-in, that a save landing mid-batch is not overwritten")
+    args = parser.parse_args()
+
+    if args.check_interleaving:
+        failures = check_interleaved_save()
+        for failure in failures:
+            print(f"❌ {failure}")
+        if not failures:
+            print("✅ A save and calculation landing mid-batch kept their result; the stale write was skipped")
+        sys.exit(1 if failures else 0)
+
+    stub = None
+    base_url = None
+    ok = False
+    if args.offline:
+        from backend_stub_server import StubServer
+        stub = StubServer().start()
+        stub.store.add_synthetic_assessments(args.synthetic)
+        base_url = stub.base_url
+    try:
+        client = ScorecardClient(base_url)
+        if args.offline:
+            weights = shift_weights(client)
+            print(f"Shifted pillar weights to P1={weights['P1']}, P2={weights['P2']}")
+        progress, elapsed = run_rescore(client, args.batch_size, args.concurrency, args.poll)
+        print(f"Status: {progress['status']}; processed {progress['processed']}, changed {progress['changed']}, "
+              f"skipped {progress['skipped']} (already current or changed meanwhile), failed {progress['failed']}")
+        print(f"Throughput: {progress['ratePerSecond']:.0f} assessments/s on the server "
+              f"({progress['elapsedSeconds']:.2f}s), {elapsed:.2f}s wall clock including polling")
+        consistent, incremental, recomputed = check_counters(client)
+        print(f"Dashboard counters {'match' if consistent else 'DO NOT match'} a full recompute"
+              + ('' if consistent else f": {incremental} vs {recomputed}"))
+        ok = progress['status'] == 'completed' and not progress['failed'] and consistent
+    except RuntimeError as e:
+        print(f"❌ {e}")
+    finally:
+        if stub:
+            stub.stop()
+    sys.exit(0 if ok else 1)
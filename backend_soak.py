@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Soak Test
+Runs a steady mix of assessment lifecycles and admin reads for hours,
+samples latency per time window together with totalAssessments from
+/admin/stats, and reports trend slopes. A steady upward latency trend
+points at a missing index or a leak that a one-shot run never shows.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+
+from backend_client import ScorecardClient
+from backend_load import VirtualUser
+from backend_metrics import percentile
+
+# Relative p50 growth over the run, predicted by the trend line, that raises an alert
+DRIFT_THRESHOLD = 0.30
+
+# Minimum correlation between window index and p50 for the growth to count as steady
+DRIFT_CORRELATION = 0.6
+
+MIN_WINDOWS = 4
+
+
+def linear_trend(xs, ys):
+    """Least-squares slope and Pearson correlation of ys against xs"""
+    if len(xs) < 2:
+        return 0.0, 0.0
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = sxy / sxx if sxx else 0.0
+    correlation = sxy / (sxx * syy) ** 0.5 if sxx and syy else 0.0
+    return slope, correlation
+
+
+class SoakReport:
+    """Windowed samples of a soak run and the trends derived from them"""
+
+    def __init__(self, hours, window, users, windows, completed, failed):
+        self.hours = hours
+        self.window = window
+        self.users = users
+        self.windows = windows
+        self.completed_lifecycles = completed
+        self.failed_lifecycles = failed
+
+    def trends(self):
+        """Per-endpoint p50 slope (ms/hour and ms per 1k assessments) and drift verdict"""
+        endpoints = sorted({endpoint for window in self.windows for endpoint in window['endpoints']})
+        trends = {}
+        for endpoint in endpoints:
+            points = [(window['hours'], window['totalAssessments'], window['endpoints'][endpoint]['p50'])
+                      for window in self.windows if endpoint in window['endpoints']]
+            if len(points) < 2:
+                continue
+            hours, totals, p50s = zip(*points)
+            per_hour, correlation = linear_trend(hours, p50s)
+            per_assessment, _ = linear_trend(totals, p50s) if None not in totals else (0.0, 0.0)
+            first = p50s[0] or min(p50s) or 1e-9
+            growth = per_hour * (hours[-1] - hours[0]) / first
+            trends[endpoint] = {
+                'windows': len(points),
+                'firstP50': p50s[0],
+                'lastP50': p50s[-1],
+                'msPerHour': per_hour,
+                'msPer1kAssessments': per_assessment * 1000,
+                'correlation': correlation,
+                'growth': growth,
+                'drifting': (len(points) >= MIN_WINDOWS and growth > DRIFT_THRESHOLD
+                             and correlation > DRIFT_CORRELATION),
+            }
+        return trends
+
+    def data_growth(self):
+        """totalAssessments per hour over the run"""
+        points = [(window['hours'], window['totalAssessments'])
+                  for window in self.windows if window['totalAssessments'] is not None]
+        if len(points) < 2:
+            return 0.0
+        return linear_trend(*zip(*points))[0]
+
+    def drifting(self):
+        return [endpoint for endpoint, trend in self.trends().items() if trend['drifting']]
+
+    def print_report(self):
+        print("=" * 92)
+        print("CloudReady ERP Scorecard Soak Test")
+        print(f"Duration: {self.hours}h, Window: {self.window}s, Virtual users: {self.users}")
+        print(f"Lifecycles: {self.completed_lifecycles} completed, {self.failed_lifecycles} failed")
+        print("=" * 92)
+        print(f"{'Window':>6}{'At min':>8}{'Reqs':>8}{'Errs':>6}{'p50 ms':>9}{'p95 ms':>9}{'Assessments':>13}")
+        for window in self.windows:
+            total = window['totalAssessments']
+            print(f"{window['index']:>6}{window['hours'] * 60:>8.1f}{window['requests']:>8}{window['errors']:>6}"
+                  f"{window['p50'] * 1000:>9.1f}{window['p95'] * 1000:>9.1f}{total if total is not None else '-':>13}")
+        print("-" * 92)
+        print(f"{'Endpoint':<34}{'first p50':>10}{'last p50':>10}{'ms/hour':>10}{'ms/1k rows':>12}{'r':>7}  Trend")
+        for endpoint, trend in self.trends().items():
+            verdict = '❌ DRIFT' if trend['drifting'] else '✅ flat'
+            print(f"{endpoint:<34}{trend['firstP50'] * 1000:>10.1f}{trend['lastP50'] * 1000:>10.1f}"
+                  f"{trend['msPerHour'] * 1000:>10.2f}{trend['msPer1kAssessments'] * 1000:>12.3f}"
+                  f"{trend['correlation']:>7.2f}  {verdict}")
+        print(f"Data growth: {self.data_growth():.0f} assessments/hour")
+        drifting = self.drifting()
+        if drifting:
+            print(f"⚠️  Steady latency drift on {', '.join(drifting)}: check indexes and server memory")
+        elif len(self.windows) < MIN_WINDOWS:
+            print(f"⚠️  Only {len(self.windows)} windows sampled; need {MIN_WINDOWS} to judge drift")
+        else:
+            print("✅ No steady latency drift")
+        print("=" * 92)
+
+    def write_json(self, path):
+        with open(path, 'w') as f:
+            json.dump({'hours': self.hours, 'window': self.window, 'users': self.users,
+                       'windows': self.windows, 'trends': self.trends(),
+                       'assessmentsPerHour': self.data_growth()}, f, indent=2)
+
+
+def summarize_window(index, elapsed, records, total_assessments):
+    """Reduce one window's request records to latency percentiles, overall and per endpoint"""
+    groups = {}
+    for record in records:
+        groups.setdefault(f"{record['method']} {record['route']}", []).append(record['wall'])
+    wall = sorted(record['wall'] for record in records)
+    return {
+        'index': index,
+        'hours': elapsed / 3600,
+        'at': datetime.now().isoformat(timespec='seconds'),
+        'requests': len(records),
+        'errors': sum(1 for record in records if not record['status'] or record['status'] >= 400),
+        'p50': percentile(wall, 50),
+        'p95': percentile(wall, 95),
+        'totalAssessments': total_assessments,
+        'endpoints': {
+            endpoint: {'requests': len(values), 'p50': percentile(sorted(values), 50),
+                       'p95': percentile(sorted(values), 95)}
+            for endpoint, values in sorted(groups.items())
+        },
+    }
+
+
+def run_soak(hours=4, window=300, users=4, think=1.0, admin_interval=10.0, base_url=None, client=None,
+             on_window=None, run_tag=None):
+    """Run a steady lifecycle and admin-read mix for `hours`, sampling every `window` seconds.
+
+    Each of `users` virtual users pauses `think` seconds between lifecycles;
+    one admin reader loads the dashboard every `admin_interval` seconds.
+    Request records are drained every window so memory stays flat. Lifecycle
+    data is tagged with `run_tag`.
+    """
+    client = client or ScorecardClient(base_url, pool_size=users + 1, run_tag=run_tag)
+    recorder = client.metrics
+    virtual_users = [VirtualUser(client) for _ in range(users)]
+    started = time.monotonic()
+    deadline = started + hours * 3600
+    stop = threading.Event()
+
+    def drive(user):
+        while not stop.is_set() and time.monotonic() < deadline:
+            if user.run_lifecycle():
+                user.completed += 1
+            else:
+                user.failed += 1
+            stop.wait(think)
+
+    def read_dashboard():
+        while not stop.is_set() and time.monotonic() < deadline:
+            try:
+                client.admin_stats()
+                client.admin_assessments(limit=100)
+                client.admin_list_questions()
+            except Exception:
+                pass
+            stop.wait(admin_interval)
+
+    def total_assessments():
+        try:
+            response = client.admin_stats()
+            return response.json()['stats']['totalAssessments'] if response.status_code == 200 else None
+        except Exception:
+            return None
+
+    threads = [threading.Thread(target=drive, args=(user,), daemon=True) for user in virtual_users]
+    threads.append(threading.Thread(target=read_dashboard, daemon=True))
+    for thread in threads:
+        thread.start()
+
+    windows = []
+    recorder.drain()
+    try:
+        while time.monotonic() < deadline:
+            stop.wait(min(window, max(0.0, deadline - time.monotonic())))
+            records = recorder.drain()
+            sample = summarize_window(len(windows) + 1, time.monotonic() - started, records, total_assessments())
+            windows.append(sample)
+            if on_window:
+                on_window(sample)
+    except KeyboardInterrupt:
+        print("Soak interrupted; reporting the windows sampled so far")
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return SoakReport(hours, window, users, windows,
+                      sum(user.completed for user in virtual_users),
+                      sum(user.failed for user in virtual_users))
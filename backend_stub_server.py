@@ -0,0 +1,1618 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Offline Stand-in
+An in-process, in-memory implementation of the /api surface exercised by
+backend_test.py, so the suite can run on a build box with no network.
+Scoring follows the Scoring Logic section of the README.
+"""
+
+import base64
+import binascii
+import bisect
+import csv
+import hashlib
+import io
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', 'Murugan@369')
+
+PILLARS = {
+    'P1': 'Process Discipline',
+    'P2': 'Planning Excellence',
+    'P3': 'Inventory Control',
+    'P4': 'Finance & Costing',
+    'P5': 'Master Data Quality',
+    'P6': 'Shopfloor & Operations',
+    'P7': 'Technical Readiness',
+    'P8': 'Reporting & Analytics',
+    'P9': 'Integration Health',
+    'P10': 'Security & Controls',
+}
+
+GATES = {
+    'G1': 'Data Readiness',
+    'G2': 'Process Stability',
+    'G3': 'Customization Risk',
+    'G4': 'Controls & Security',
+    'G5': 'Testing & Change Readiness',
+}
+
+PILLAR_OWNERS = {
+    'P1': 'Operations Lead',
+    'P2': 'Planning Manager',
+    'P3': 'Warehouse Manager',
+    'P4': 'Finance Controller',
+    'P5': 'Data Steward',
+    'P6': 'Plant Manager',
+    'P7': 'IT Manager',
+    'P8': 'BI Lead',
+    'P9': 'Integration Architect',
+    'P10': 'Security Officer',
+}
+
+DEFAULT_WEIGHTS = {
+    'P1': 12, 'P2': 12, 'P3': 12, 'P4': 12, 'P5': 10,
+    'P6': 10, 'P7': 10, 'P8': 8, 'P9': 7, 'P10': 7,
+}
+
+DECISIONS = ['GO', 'GO with conditions', 'NO-GO']
+EFFORTS = ['L', 'M', 'H']
+TOP_N = 10
+MAX_PAGE_SIZE = 1000
+MAX_WHAT_IF_CANDIDATES = 1000
+
+# Capabilities GET / advertises, so test tooling can tell the stand-in's extensions are there
+FEATURES = ['stand-in', 'answers-version', 'results-cache', 'rescore', 'teardown', 'server-timing']
+IMPORT_BATCH_SIZE = 500
+
+# Routes with large, repetitive JSON bodies whose responses are compressed when the client accepts it
+COMPRESSED_ROUTES = (r'/questions', r'/results/(?P<assessment_id>[^/]+)', r'/admin/assessments')
+# Smaller bodies go out as they are; compressing them costs more than it saves
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+MAX_RESCORE_CONCURRENCY = 16
+TEARDOWN_BATCH_SIZE = 500
+MAX_IMPORT_ERRORS = 1000
+
+QUESTION_TEXT_FIELDS = ['whyItMatters', 'evidenceToCheck', 'fixHint', 'riskText']
+TRUE_VALUES = {'true', '1', 'yes', 'y'}
+FALSE_VALUES = {'false', '0', 'no', 'n'}
+
+
+def now_iso():
+    """Millisecond UTC timestamp in the same shape as JavaScript's toISOString"""
+    return iso(datetime.now(timezone.utc))
+
+
+def iso(moment):
+    return moment.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def round_half_up(value, digits=0):
+    """Round like JavaScript's Math.round rather than Python's banker's rounding"""
+    factor = 10 ** digits
+    return math.floor(value * factor + 0.5) / factor if digits else int(math.floor(value + 0.5))
+
+
+def seed_questions():
+    """The 40-question MVP bank: four questions per pillar, every question gated"""
+    questions = []
+    for index in range(40):
+        pillar = f"P{index // 4 + 1}"
+        gate = f"G{index % 5 + 1}"
+        number = index + 1
+        questions.append({
+            'id': str(uuid.uuid4()),
+            'qid': f"Q{number}",
+            'pillar': pillar,
+            'gate': gate,
+            'text': f"How mature is {PILLARS[pillar].lower()} practice #{index % 4 + 1}?",
+            'whyItMatters': f"Weak {PILLARS[pillar].lower()} puts {GATES[gate].lower()} at risk during cloud cutover.",
+            'evidenceToCheck': f"Documented procedures and audit trail for {PILLARS[pillar].lower()}.",
+            'effort': EFFORTS[index % 3],
+            'fixHint': f"Standardise and document {PILLARS[pillar].lower()} practice #{index % 4 + 1}.",
+            'riskText': f"Gaps in {PILLARS[pillar].lower()} will carry straight into the cloud tenant.",
+            'active': True,
+            'sortOrder': number,
+        })
+    return questions
+
+
+def supported_encodings():
+    """Content codings the stand-in can produce, most preferred first"""
+    return ['br', 'gzip'] if brotli else ['gzip']
+
+
+def negotiate_encoding(accept_encoding):
+    """Pick a content coding from an Accept-Encoding header, or None for identity"""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(','):
+        coding, *params = [part.strip() for part in item.split(';')]
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if coding:
+            weights[coding.lower()] = weight
+    candidates = [(weights.get(coding, weights.get('*', 0.0)), -rank, coding)
+                  for rank, coding in enumerate(supported_encodings())]
+    weight, _, coding = max(candidates)
+    return coding if weight > 0 else None
+
+
+class Compressor:
+    """Incremental gzip or brotli encoder for one response body"""
+
+    def __init__(self, encoding):
+        self.encoding = encoding
+        if encoding == 'br':
+            self._encoder = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._encoder = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data):
+        if self.encoding == 'br':
+            return self._encoder.process(data)
+        return self._encoder.compress(data)
+
+    def flush(self):
+        """Emit everything compressed so far, so the client can decode it before the body ends"""
+        return self._encoder.flush() if self.encoding == 'br' else self._encoder.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._encoder.finish() if self.encoding == 'br' else self._encoder.flush()
+
+    def stream(self, chunks):
+        # Flushed per chunk: a streamed body must reach the client as it is produced, not at the end
+        for chunk in chunks:
+            data = self.compress(chunk) + self.flush()
+            if data:
+                yield data
+        yield self.finish()
+
+
+def parse_question_row(row):
+    """Validate one CSV row against the question schema; return (question fields, errors)"""
+    errors = []
+    cell = lambda name: (row.get(name) or '').strip()
+    qid, pillar, text = cell('qid'), cell('pillar').upper(), cell('text')
+    gate, effort = cell('gate').upper(), cell('effort').upper() or 'M'
+    if not qid:
+        errors.append('qid is required')
+    if pillar not in PILLARS:
+        errors.append(f"pillar must be P1-P10, got {pillar or 'nothing'}")
+    if gate in ('', 'NULL', 'NONE'):
+        gate = None
+    elif gate not in GATES:
+        errors.append(f"gate must be G1-G5 or empty, got {gate}")
+    if effort not in EFFORTS:
+        errors.append(f"effort must be L, M or H, got {effort}")
+    if not text:
+        errors.append('text is required')
+
+    active = cell('active').lower()
+    if active and active not in TRUE_VALUES | FALSE_VALUES:
+        errors.append(f"active must be true or false, got {active}")
+    sort_order = cell('sortOrder')
+    try:
+        sort_order = int(sort_order) if sort_order else 0
+    except ValueError:
+        errors.append(f"sortOrder must be an integer, got {sort_order}")
+
+    question = {
+        'qid': qid,
+        'pillar': pillar,
+        'gate': gate,
+        'text': text,
+        **{field: cell(field) for field in QUESTION_TEXT_FIELDS},
+        'effort': effort,
+        'active': active not in FALSE_VALUES,
+        'sortOrder': sort_order,
+    }
+    if cell('isTest').lower() in TRUE_VALUES:
+        question['isTest'] = True
+    return question, errors
+
+
+def default_settings():
+    return {
+        'id': str(uuid.uuid4()),
+        'weights': dict(DEFAULT_WEIGHTS),
+        'currency': 'INR',
+        'pricing': {
+            'tierA': {'INR': 14999, 'AED': 550},
+            'tierB': {'INR': 150000, 'AED': 5500},
+        },
+        'tierC': {'name': 'Enterprise Programme', 'description': 'Custom engagement'},
+        'guidedReviewLink': 'https://calendly.com/cloudready/guided-review',
+        'tierCBookingLink': 'https://calendly.com/cloudready/enterprise',
+    }
+
+
+def calculate_results(questions, answers, weights):
+    """Score one assessment per the README Scoring Logic section"""
+    return score_assessment(questions, answers, weights)[0]
+
+
+def score_assessment(questions, answers, weights):
+    """calculate_results plus the unrounded overall score"""
+    by_id = {question['id']: question for question in questions}
+    scored = [
+        (by_id[answer['questionId']], answer['score'])
+        for answer in answers
+        if answer.get('questionId') in by_id and answer.get('score') is not None
+    ]
+    scored.sort(key=lambda item: item[0].get('sortOrder', 0))
+
+    pillar_scores = {}
+    gate_scores = {}
+    for question, score in scored:
+        pillar_scores.setdefault(question['pillar'], []).append(score)
+        if question.get('gate'):
+            gate_scores.setdefault(question['gate'], []).append(score)
+
+    pillar_results = {}
+    weighted_total = 0.0
+    weight_total = 0.0
+    for pillar in sorted(pillar_scores, key=lambda p: int(p[1:])):
+        scores = pillar_scores[pillar]
+        average = sum(scores) / len(scores)
+        percent = average / 4 * 100
+        weight = weights.get(pillar, 0)
+        weighted_total += percent * weight
+        weight_total += weight
+        pillar_results[pillar] = {
+            'pillar': pillar,
+            'name': PILLARS.get(pillar, pillar),
+            'score': round_half_up(percent),
+            'avgScore': round_half_up(average, 2),
+            'weight': weight,
+            'weighted': round_half_up(percent * weight / 100, 2),
+            'rag': 'Green' if percent >= 75 else 'Amber' if percent >= 50 else 'Red',
+            'answered': len(scores),
+        }
+    # OverallScore = SUM(PillarScore% x PillarWeight), with the weights normalized over the answered pillars
+    overall_raw = weighted_total / weight_total if weight_total else 0.0
+    overall_score = round_half_up(overall_raw)
+
+    gate_results = {}
+    for gate in sorted(gate_scores):
+        scores = gate_scores[gate]
+        average = sum(scores) / len(scores)
+        gate_results[gate] = {
+            'gate': gate,
+            'name': GATES.get(gate, gate),
+            'avgScore': round_half_up(average, 2),
+            'status': 'PASS' if average >= 3.0 else 'CONDITIONAL' if average >= 2.5 else 'FAIL',
+        }
+    statuses = [gate['status'] for gate in gate_results.values()]
+    if 'FAIL' in statuses:
+        decision = 'NO-GO'
+    elif statuses.count('CONDITIONAL') >= 2:
+        decision = 'GO with conditions'
+    else:
+        decision = 'GO'
+
+    risks = []
+    for question, score in scored:
+        if score <= 1:
+            risks.append({
+                'questionId': question['id'],
+                'qid': question['qid'],
+                'pillar': question['pillar'],
+                'gate': question.get('gate'),
+                'text': question['text'],
+                'score': score,
+                'riskScore': (4 - score) * weights.get(question['pillar'], 0),
+                'effort': question.get('effort'),
+                'fixHint': question.get('fixHint'),
+                'riskText': question.get('riskText'),
+            })
+    # Stable sort keeps question order for ties
+    risks.sort(key=lambda risk: -risk['riskScore'])
+    top_risks = risks[:TOP_N]
+    quick_wins = [risk for risk in risks if risk['effort'] == 'L'][:TOP_N]
+
+    return {
+        'overallScore': overall_score,
+        'pillarResults': pillar_results,
+        'gateResults': gate_results,
+        'topRisks': top_risks,
+        'quickWins': quick_wins,
+        'decision': decision,
+        'roadmap': build_roadmap(risks),
+    }, overall_raw
+
+
+def results_inputs_hash(answers, versions):
+    """Content hash of an answer set plus the questions and settings versions it was scored against"""
+    digest = hashlib.sha256()
+    for question_id, score in sorted((answer['questionId'], answer['score']) for answer in answers):
+        digest.update(f"{question_id}={score};".encode())
+    digest.update(f"questions={versions['questions'][0]};settings={versions['settings'][0]}".encode())
+    return digest.hexdigest()
+
+
+def build_roadmap(risks):
+    """Group risks into pillar workstreams scheduled across the 90 days"""
+    workstreams = {}
+    for risk in risks:
+        stream = workstreams.setdefault(risk['pillar'], {
+            'workstream': PILLARS.get(risk['pillar'], risk['pillar']),
+            'pillar': risk['pillar'],
+            'owner': PILLAR_OWNERS.get(risk['pillar'], 'ERP Lead'),
+            'riskScore': 0,
+            'effort': 'L',
+            'actions': [],
+        })
+        stream['riskScore'] += risk['riskScore']
+        if EFFORTS.index(risk['effort'] or 'L') > EFFORTS.index(stream['effort']):
+            stream['effort'] = risk['effort']
+        stream['actions'].append(risk['fixHint'])
+    timelines = {'L': '0-30 days', 'M': '31-60 days', 'H': '61-90 days'}
+    roadmap = sorted(workstreams.values(), key=lambda stream: -stream['riskScore'])
+    for stream in roadmap:
+        stream['timeline'] = timelines[stream['effort']]
+    return roadmap
+
+
+class RescoreJob:
+    """Rescores every completed assessment against the current questions and weights.
+
+    Assessments are processed in batches on at most `concurrency` threads, so
+    the store sees a bounded number of batch reads and writes at a time.
+    Results whose inputsHash is still current are skipped, and so are those
+    whose answers or result changed between the batch read and its write.
+    """
+
+    def __init__(self, store, batch_size=200, concurrency=4):
+        self.store = store
+        self.id = str(uuid.uuid4())
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.status = 'running'
+        self.error = None
+        self.cancelled = threading.Event()
+        self.counts = {'processed': 0, 'changed': 0, 'skipped': 0, 'failed': 0}
+        self._lock = threading.Lock()
+        with store.lock:
+            self.assessment_ids = [assessment_id for _, assessment_id in store.completed_index]
+        self.total = len(self.assessment_ids)
+        self.started_at = time.time()
+        self.finished_at = None
+
+    def start(self):
+        threading.Thread(target=self.run, name=f'rescore-{self.id[:8]}', daemon=True).start()
+        return self
+
+    def run(self):
+        batches = [self.assessment_ids[i:i + self.batch_size] for i in range(0, self.total, self.batch_size)]
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                list(pool.map(self.rescore_batch, batches))
+            self.status = 'cancelled' if self.cancelled.is_set() else 'completed'
+        except Exception as e:
+            self.status, self.error = 'failed', str(e)
+        self.finished_at = time.time()
+
+    def rescore_batch(self, assessment_ids):
+        if self.cancelled.is_set():
+            return
+        store = self.store
+        with store.lock:
+            questions = list(store.questions.values())
+            weights = dict(store.settings['weights'])
+            versions = dict(store.versions)
+            work = [(assessment_id, list(store.answers[assessment_id].values()), store.results[assessment_id],
+                     store.assessments[assessment_id]['answersVersion'])
+                    for assessment_id in assessment_ids if assessment_id in store.results]
+        counts = {'processed': 0, 'changed': 0, 'skipped': 0, 'failed': len(assessment_ids) - len(work)}
+        for assessment_id, answers, previous, answers_version in work:
+            inputs_hash = results_inputs_hash(answers, versions)
+            if previous.get('inputsHash') == inputs_hash:
+                counts['processed'] += 1
+                counts['skipped'] += 1
+                continue
+            result = {**previous, **calculate_results(questions, answers, weights),
+                      'inputsHash': inputs_hash, 'rescoredAt': now_iso()}
+            outcome = store.rescore(assessment_id, result, previous.get('inputsHash'), answers_version)
+            if outcome == 'deleted':
+                counts['failed'] += 1
+                continue
+            counts['processed'] += 1
+            if outcome == 'stale':
+                # A save or calculation landed meanwhile; its data wins
+                counts['skipped'] += 1
+                continue
+            if (result['overallScore'], result['decision']) != (previous['overallScore'], previous['decision']):
+                counts['changed'] += 1
+        with self._lock:
+            for key, value in counts.items():
+                self.counts[key] += value
+
+    def progress(self):
+        with self._lock:
+            counts = dict(self.counts)
+        done = counts['processed'] + counts['failed']
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        rate = done / elapsed if elapsed else 0.0
+        return {
+            'jobId': self.id,
+            'status': self.status,
+            'error': self.error,
+            'total': self.total,
+            **counts,
+            'percent': round_half_up(done / self.total * 100, 1) if self.total else 100,
+            'elapsedSeconds': round_half_up(elapsed, 3),
+            'ratePerSecond': round_half_up(rate, 1),
+            'etaSeconds': round_half_up((self.total - done) / rate, 1) if rate and self.status == 'running' else 0,
+            'batchSize': self.batch_size,
+            'concurrency': self.concurrency,
+            'startedAt': iso(datetime.fromtimestamp(self.started_at, timezone.utc)),
+            'finishedAt': iso(datetime.fromtimestamp(self.finished_at, timezone.utc)) if self.finished_at else None,
+        }
+
+
+class ServerTiming:
+    """Per-request phase durations, sent back as a Server-Timing header"""
+
+    def __init__(self):
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def header(self):
+        return ', '.join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.phases.items())
+
+
+class StubResponse:
+    """A handler result that needs a non-200 status or extra headers"""
+
+    def __init__(self, payload, status=200, headers=None):
+        self.payload = payload
+        self.status = status
+        self.headers = headers or {}
+
+
+class ApiError(Exception):
+    """An error response with an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ScorecardStore:
+    """In-memory stand-in for the MongoDB collections"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.questions = {question['id']: question for question in seed_questions()}
+        self.settings = default_settings()
+        self.about_us = {
+            'companyName': 'CloudReady ERP Solutions',
+            'description': 'Cloud readiness assessments for Epicor manufacturers.',
+            'logoUrl': '',
+            'businessHours': 'Mon-Fri 9AM-6PM',
+        }
+        self.contact_us = {
+            'email': 'hello@cloudready.example',
+            'phone': '',
+            'address': '',
+            'linkedIn': '',
+            'twitter': '',
+        }
+        self.profiles = {}
+        self.assessments = {}
+        self.answers = {}
+        self.results = {}
+        # Validators for conditional GETs: (version, last modified) per cacheable resource
+        self.boot_id = uuid.uuid4().hex[:8]
+        self.versions = {'questions': (1, time.time()), 'settings': (1, time.time())}
+        # (completedAt, id) of completed assessments, ascending, for cursor pagination
+        self.completed_index = []
+        # Dashboard counters, kept up to date on every start and completion
+        self.counters = {
+            'totalAssessments': 0,
+            'completedAssessments': 0,
+            'scoreSum': 0,
+            'decisions': {decision: 0 for decision in DECISIONS},
+        }
+        # Background rescoring jobs by id
+        self.jobs = {}
+
+    def add_assessment(self, profile, assessment, answers=None):
+        with self.lock:
+            self.profiles[profile['id']] = profile
+            self.assessments[assessment['id']] = assessment
+            self.answers[assessment['id']] = answers or {}
+            self.counters['totalAssessments'] += 1
+
+    def complete(self, assessment, result, completed_at=None):
+        """Store a result and mark its assessment COMPLETED, keeping completed_index sorted"""
+        with self.lock:
+            counters = self.counters
+            previous = self.results.get(assessment['id']) if assessment['status'] != 'DRAFT' else None
+            if previous:
+                counters['scoreSum'] -= previous['overallScore']
+                counters['decisions'][previous['decision']] -= 1
+            else:
+                counters['completedAssessments'] += 1
+            counters['scoreSum'] += result['overallScore']
+            counters['decisions'][result['decision']] += 1
+
+            if assessment['completedAt']:
+                key = (assessment['completedAt'], assessment['id'])
+                position = bisect.bisect_left(self.completed_index, key)
+                if position < len(self.completed_index) and self.completed_index[position] == key:
+                    del self.completed_index[position]
+            self.results[assessment['id']] = result
+            assessment['status'] = 'COMPLETED'
+            assessment['completedAt'] = completed_at or now_iso()
+            bisect.insort(self.completed_index, (assessment['completedAt'], assessment['id']))
+
+    def delete_assessments(self, assessment_ids):
+        """Remove assessments with their answers, results and index entries; return per-collection counts"""
+        deleted = {'assessments': 0, 'answers': 0, 'results': 0}
+        with self.lock:
+            counters = self.counters
+            for assessment_id in assessment_ids:
+                assessment = self.assessments.pop(assessment_id, None)
+                if not assessment:
+                    continue
+                deleted['assessments'] += 1
+                counters['totalAssessments'] -= 1
+                deleted['answers'] += len(self.answers.pop(assessment_id, {}))
+                result = self.results.pop(assessment_id, None)
+                if result:
+                    deleted['results'] += 1
+                    if assessment['status'] != 'DRAFT':
+                        counters['completedAssessments'] -= 1
+                        counters['scoreSum'] -= result['overallScore']
+                        counters['decisions'][result['decision']] -= 1
+                if assessment['completedAt']:
+                    key = (assessment['completedAt'], assessment_id)
+                    position = bisect.bisect_left(self.completed_index, key)
+                    if position < len(self.completed_index) and self.completed_index[position] == key:
+                        del self.completed_index[position]
+        return deleted
+
+    def rescore(self, assessment_id, result, expected_hash, expected_version):
+        """Replace a completed assessment's result in place; completedAt and its index entry stay put.
+
+        Compare-and-swap: the write only happens while the stored result's
+        inputsHash and the answers version are still the ones the result was
+        computed from. Returns 'rescored', 'stale' or 'deleted'.
+        """
+        with self.lock:
+            previous = self.results.get(assessment_id)
+            if previous is None:
+                # Torn down since the batch was read
+                return 'deleted'
+            if (previous.get('inputsHash') != expected_hash
+                    or self.assessments[assessment_id]['answersVersion'] != expected_version):
+                return 'stale'
+            self.counters['scoreSum'] += result['overallScore'] - previous['overallScore']
+            self.counters['decisions'][previous['decision']] -= 1
+            self.counters['decisions'][result['decision']] += 1
+            self.results[assessment_id] = result
+            return 'rescored'
+
+    def add_synthetic_assessments(self, count, seed=0):
+        """Bulk-create completed assessments with random answers, for benchmarks"""
+        rng = random.Random(seed)
+        questions = self.active_questions()
+        with self.lock:
+            weights = dict(self.settings['weights'])
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+        for number in range(count):
+            profile_id = str(uuid.uuid4())
+            assessment_id = str(uuid.uuid4())
+            centre = rng.uniform(0, 4)
+            answers = {
+                question['id']: {
+                    'questionId': question['id'],
+                    'score': min(4, max(0, round(rng.gauss(centre, 1.0)))),
+                }
+                for question in questions
+            }
+            profile = {
+                'id': profile_id,
+                'name': f"Synthetic User {number}",
+                'email': f"synthetic{number}@example.com",
+                'companyName': f"Synthetic Manufacturing {number}",
+            }
+            assessment = {
+                'id': assessment_id,
+                'profileId': profile_id,
+                'email': profile['email'],
+                'status': 'DRAFT',
+                'createdAt': iso(datetime.fromtimestamp(start + number * 60, timezone.utc)),
+                'completedAt': None,
+                'answersVersion': 1,
+            }
+            result = {
+                'id': str(uuid.uuid4()),
+                'assessmentId': assessment_id,
+                'createdAt': assessment['createdAt'],
+                **calculate_results(questions, list(answers.values()), weights),
+            }
+            with self.lock:
+                self.add_assessment(profile, assessment, answers)
+                self.complete(assessment, result, iso(datetime.fromtimestamp(start + number * 60 + 30, timezone.utc)))
+
+    def touch(self, resource):
+        """Record a write so cached copies of `resource` stop validating"""
+        with self.lock:
+            version, _ = self.versions[resource]
+            self.versions[resource] = (version + 1, time.time())
+
+    def active_questions(self):
+        with self.lock:
+            questions = [question for question in self.questions.values() if question.get('active', True)]
+        return sorted(questions, key=lambda question: question.get('sortOrder', 0))
+
+
+class StubApp:
+    """Route table and handlers for the /api surface"""
+
+    def __init__(self, store=None, admin_password=ADMIN_PASSWORD):
+        self.store = store or ScorecardStore()
+        self.admin_password = admin_password
+        self.routes = [
+            ('GET', r'/', self.root),
+            ('GET', r'/questions', self.get_questions),
+            ('GET', r'/settings', self.get_settings),
+            ('POST', r'/start-assessment', self.start_assessment),
+            ('POST', r'/save-answers', self.save_answers),
+            ('POST', r'/calculate-results', self.calculate),
+            ('POST', r'/what-if', self.what_if),
+            ('GET', r'/results/(?P<assessment_id>[^/]+)', self.get_results),
+            ('GET', r'/admin/verify', self.admin_verify),
+            ('GET', r'/admin/questions', self.admin_list_questions),
+            ('POST', r'/admin/questions', self.admin_create_question),
+            ('POST', r'/admin/questions/import', self.admin_import_questions),
+            ('DELETE', r'/admin/questions/(?P<question_id>[^/]+)', self.admin_delete_question),
+            ('POST', r'/admin/settings', self.admin_update_settings),
+            ('GET', r'/admin/stats', self.admin_stats),
+            ('GET', r'/admin/assessments', self.admin_assessments),
+            ('GET', r'/admin/export', self.admin_export),
+            ('POST', r'/admin/rescore', self.admin_start_rescore),
+            ('GET', r'/admin/rescore/(?P<job_id>[^/]+)', self.admin_rescore_status),
+            ('DELETE', r'/admin/rescore/(?P<job_id>[^/]+)', self.admin_cancel_rescore),
+            ('POST', r'/admin/teardown', self.admin_teardown),
+            ('GET', r'/admin/about', self.get_about),
+            ('POST', r'/admin/about', self.update_about),
+            ('GET', r'/admin/contact', self.get_contact),
+            ('POST', r'/admin/contact', self.update_contact),
+            ('GET', r'/admin/pricing', self.admin_pricing),
+            ('POST', r'/admin/remove-test-question', self.admin_remove_test_questions),
+        ]
+        self.routes = [(method, re.compile(f"^{pattern}$"), handler) for method, pattern, handler in self.routes]
+        self.compressed_routes = [re.compile(f"^{pattern}$") for pattern in COMPRESSED_ROUTES]
+
+    def dispatch(self, request):
+        """Return (status, payload, headers) for a parsed request"""
+        path_matched = False
+        for method, pattern, handler in self.routes:
+            match = pattern.match(request.path)
+            if not match:
+                continue
+            path_matched = True
+            if method == request.method:
+                try:
+                    result = handler(request, **match.groupdict())
+                except ApiError as e:
+                    return e.status, {'error': e.message}, {}
+                if isinstance(result, StubResponse):
+                    return result.status, result.payload, result.headers
+                return 200, result, {}
+        if path_matched:
+            return 405, {'error': 'Method not allowed'}, {}
+        return 404, {'error': 'Not found'}, {}
+
+    def route_of(self, request):
+        """'METHOD pattern' of the route serving `request`, or None when nothing matches"""
+        for method, pattern, _ in self.routes:
+            if method == request.method and pattern.match(request.path):
+                return f"{method} {pattern.pattern}"
+        return None
+
+    def compressible(self, request):
+        """Whether `request` is a GET on one of the heavy routes that negotiate a content coding"""
+        return request.method == 'GET' and any(pattern.match(request.path) for pattern in self.compressed_routes)
+
+    def conditional(self, request, resource, build_payload):
+        """Answer 304 when the client's ETag or Last-Modified still matches `resource`"""
+        with request.timing.phase('db-read'), self.store.lock:
+            version, modified = self.store.versions[resource]
+            etag = f'W/"{resource}-{self.store.boot_id}-{version}"'
+            headers = {
+                'ETag': etag,
+                'Last-Modified': formatdate(modified, usegmt=True),
+                'Cache-Control': 'no-cache',
+            }
+            if_none_match = request.headers.get('if-none-match')
+            if if_none_match is not None:
+                fresh = etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+            else:
+                fresh = False
+                if_modified_since = request.headers.get('if-modified-since')
+                if if_modified_since:
+                    try:
+                        fresh = parsedate_to_datetime(if_modified_since).timestamp() >= int(modified)
+                    except (TypeError, ValueError):
+                        pass
+            if fresh:
+                return StubResponse(None, 304, headers)
+            return StubResponse(build_payload(), 200, headers)
+
+    def require_admin(self, request):
+        if request.headers.get('x-admin-password') != self.admin_password:
+            raise ApiError(401, 'Unauthorized')
+
+    # Public routes
+
+    def root(self, request):
+        return {'message': 'CloudReady ERP Scorecard API', 'version': '1.0.0', 'features': FEATURES}
+
+    def get_questions(self, request):
+        return self.conditional(request, 'questions', lambda: {'questions': self.store.active_questions()})
+
+    def get_settings(self, request):
+        return self.conditional(request, 'settings', lambda: {'settings': dict(self.store.settings)})
+
+    def start_assessment(self, request):
+        body = request.json()
+        if not body.get('email') or not body.get('name'):
+            raise ApiError(400, 'name and email are required')
+        profile = {
+            'id': str(uuid.uuid4()),
+            'name': body['name'],
+            'email': body['email'],
+            'companyName': body.get('companyName', ''),
+            'role': body.get('role', ''),
+            'erp': body.get('erp', ''),
+            'epicorVersion': body.get('epicorVersion', ''),
+            'timeline': body.get('timeline', ''),
+            'createdAt': now_iso(),
+        }
+        assessment = {
+            'id': str(uuid.uuid4()),
+            'profileId': profile['id'],
+            'email': profile['email'],
+            'status': 'DRAFT',
+            'createdAt': now_iso(),
+            'completedAt': None,
+            'answersVersion': 0,
+        }
+        if body.get('runTag'):
+            # Set by test tooling, so POST /admin/teardown can remove the run's data
+            profile['runTag'] = assessment['runTag'] = str(body['runTag'])
+        with request.timing.phase('db-write'):
+            self.store.add_assessment(profile, assessment)
+        return {'success': True, 'assessmentId': assessment['id'], 'profileId': profile['id']}
+
+    def _assessment(self, assessment_id):
+        assessment = self.store.assessments.get(assessment_id)
+        if not assessment:
+            raise ApiError(404, 'Assessment not found')
+        return assessment
+
+    def save_answers(self, request):
+        """Upsert answers and bump the assessment's answers version.
+
+        Accepts the full `answers` array, a delta of `changes`, or a single
+        `answer`. When `baseVersion` is sent and no longer matches, nothing
+        is written and 409 is returned with the current version.
+        """
+        body = request.json()
+        if 'answer' in body:
+            answers = [body['answer']] if isinstance(body['answer'], dict) else None
+        else:
+            answers = body.get('changes', body.get('answers'))
+        if not isinstance(answers, list):
+            raise ApiError(400, 'answers must be a list')
+        for answer in answers:
+            if not isinstance(answer, dict):
+                raise ApiError(400, 'Each answer must be an object')
+            score = answer.get('score')
+            if not answer.get('questionId') or not isinstance(score, int) or not 0 <= score <= 4:
+                raise ApiError(400, 'Each answer needs a questionId and a score from 0 to 4')
+        with request.timing.phase('db-write'), self.store.lock:
+            assessment = self._assessment(body.get('assessmentId'))
+            base_version = body.get('baseVersion')
+            if base_version is not None and base_version != assessment['answersVersion']:
+                return StubResponse({
+                    'error': 'Answers were changed by another save',
+                    'version': assessment['answersVersion'],
+                }, 409)
+            saved = self.store.answers[body['assessmentId']]
+            for answer in answers:
+                saved[answer['questionId']] = {
+                    'id': saved.get(answer['questionId'], {}).get('id', str(uuid.uuid4())),
+                    'assessmentId': body['assessmentId'],
+                    'questionId': answer['questionId'],
+                    'score': answer['score'],
+                    'notes': answer.get('notes', ''),
+                }
+            assessment['answersVersion'] += 1
+            version = assessment['answersVersion']
+        return {'success': True, 'saved': len(answers), 'version': version}
+
+    def calculate(self, request):
+        """Score an assessment, or return its stored result when nothing it depends on changed.
+
+        The stored result carries an inputsHash over the answers and the
+        questions/settings versions; admin writes bump those versions, so a
+        matching hash means the result is still current and nothing is
+        recomputed or written. {"recompute": true} skips the lookup.
+        """
+        body = request.json()
+        assessment_id = body.get('assessmentId')
+        with request.timing.phase('db-read'), self.store.lock:
+            assessment = self._assessment(assessment_id)
+            answers = list(self.store.answers[assessment_id].values())
+            inputs_hash = results_inputs_hash(answers, self.store.versions)
+            stored = self.store.results.get(assessment_id)
+            if stored and stored.get('inputsHash') == inputs_hash and not body.get('recompute'):
+                return StubResponse({'success': True, 'cached': True, 'results': stored},
+                                    headers={'X-Cache': 'HIT'})
+            questions = list(self.store.questions.values())
+            weights = dict(self.store.settings['weights'])
+        with request.timing.phase('scoring'):
+            results = calculate_results(questions, answers, weights)
+        result = {'id': str(uuid.uuid4()), 'assessmentId': assessment_id, 'createdAt': now_iso(),
+                  'inputsHash': inputs_hash, **results}
+        with request.timing.phase('db-write'):
+            self.store.complete(assessment, result)
+        return StubResponse({'success': True, 'cached': False, 'results': result}, headers={'X-Cache': 'MISS'})
+
+    def what_if(self, request):
+        """Score candidate answer changes against an assessment without saving anything.
+
+        Body: {assessmentId, candidates: [{id, changes: [{questionId, score}]}]}.
+        Each candidate is applied on its own to the assessment's saved answers.
+        """
+        body = request.json()
+        candidates = body.get('candidates')
+        if not isinstance(candidates, list) or not candidates:
+            raise ApiError(400, 'candidates must be a non-empty list')
+        if len(candidates) > MAX_WHAT_IF_CANDIDATES:
+            raise ApiError(400, f"At most {MAX_WHAT_IF_CANDIDATES} candidates per request")
+        with request.timing.phase('db-read'), self.store.lock:
+            self._assessment(body.get('assessmentId'))
+            questions = list(self.store.questions.values())
+            base_answers = {
+                question_id: answer['score']
+                for question_id, answer in self.store.answers[body['assessmentId']].items()
+            }
+            weights = dict(self.store.settings['weights'])
+
+        def summarise(answers):
+            with request.timing.phase('scoring'):
+                results, overall_raw = score_assessment(
+                    questions, [{'questionId': qid, 'score': score} for qid, score in answers.items()], weights)
+            return {
+                'overallRaw': overall_raw,
+                'overallScore': results['overallScore'],
+                'decision': results['decision'],
+                'gates': {gate: value['status'] for gate, value in results['gateResults'].items()},
+            }
+
+        base = summarise(base_answers)
+        scored = []
+        for index, candidate in enumerate(candidates):
+            changes = candidate.get('changes') if isinstance(candidate, dict) else None
+            if not isinstance(changes, list) or not all(
+                    isinstance(change, dict) and change.get('questionId')
+                    and isinstance(change.get('score'), int) and 0 <= change['score'] <= 4 for change in changes):
+                raise ApiError(400, f"Candidate {index} needs changes with a questionId and a score from 0 to 4")
+            answers = dict(base_answers)
+            answers.update({change['questionId']: change['score'] for change in changes})
+            outcome = summarise(answers)
+            scored.append({
+                'id': candidate.get('id', index),
+                'overallScore': outcome['overallScore'],
+                'deltaScore': round_half_up(outcome['overallRaw'] - base['overallRaw'], 2),
+                'decision': outcome['decision'],
+                'decisionChanged': outcome['decision'] != base['decision'],
+                'gateChanges': {
+                    gate: {'from': base['gates'].get(gate), 'to': status}
+                    for gate, status in outcome['gates'].items() if base['gates'].get(gate) != status
+                },
+            })
+        base.pop('overallRaw')
+        return {'success': True, 'base': base, 'candidates': scored}
+
+    def get_results(self, request, assessment_id):
+        with request.timing.phase('db-read'), self.store.lock:
+            result = self.store.results.get(assessment_id)
+        if not result:
+            raise ApiError(404, 'Results not found')
+        return {'result': result}
+
+    def get_about(self, request):
+        with self.store.lock:
+            return {'aboutUs': dict(self.store.about_us)}
+
+    def get_contact(self, request):
+        with self.store.lock:
+            return {'contactUs': dict(self.store.contact_us)}
+
+    def admin_pricing(self, request):
+        with self.store.lock:
+            settings = self.store.settings
+            return {
+                'pricing': settings['pricing'],
+                'currency': settings['currency'],
+                'tierC': settings.get('tierC'),
+                'guidedReviewLink': settings.get('guidedReviewLink'),
+                'tierCBookingLink': settings.get('tierCBookingLink'),
+            }
+
+    def admin_verify(self, request):
+        return {'valid': request.headers.get('x-admin-password') == self.admin_password}
+
+    # Admin routes
+
+    def admin_list_questions(self, request):
+        with self.store.lock:
+            questions = list(self.store.questions.values())
+        return {'questions': sorted(questions, key=lambda question: question.get('sortOrder', 0))}
+
+    def admin_create_question(self, request):
+        body = request.json()
+        missing = [field for field in ('qid', 'pillar', 'text') if not body.get(field)]
+        if missing:
+            raise ApiError(400, f"Missing fields: {', '.join(missing)}")
+        if body['pillar'] not in PILLARS:
+            raise ApiError(400, f"Unknown pillar {body['pillar']}")
+        if body.get('gate') and body['gate'] not in GATES:
+            raise ApiError(400, f"Unknown gate {body['gate']}")
+        question = {
+            'whyItMatters': '', 'evidenceToCheck': '', 'effort': 'M', 'fixHint': '', 'riskText': '',
+            'gate': None, 'active': True, 'sortOrder': 0,
+            **body,
+            'id': str(uuid.uuid4()),
+        }
+        with self.store.lock:
+            self.store.questions[question['id']] = question
+        self.store.touch('questions')
+        return {'success': True, 'question': question}
+
+    def admin_import_questions(self, request):
+        """Upsert questions by qid from a streamed CSV body.
+
+        Rows are validated as they are read and applied in batches of
+        ?batchSize rows under the store lock. ?allOrNothing=true stages every
+        batch and applies nothing if any row fails; ?dryRun=true only validates.
+        An existing question only takes the columns the CSV has; defaults for
+        the missing ones apply to new questions only.
+        """
+        self.require_admin(request)
+        try:
+            batch_size = max(1, min(int(request.query.get('batchSize', [IMPORT_BATCH_SIZE])[0]), 10 * IMPORT_BATCH_SIZE))
+        except ValueError:
+            raise ApiError(400, 'batchSize must be an integer')
+        all_or_nothing = request.query.get('allOrNothing', ['false'])[0].lower() in TRUE_VALUES
+        dry_run = request.query.get('dryRun', ['false'])[0].lower() in TRUE_VALUES
+
+        reader = csv.DictReader(io.TextIOWrapper(request.stream, encoding='utf-8-sig', newline=''))
+        missing = [field for field in ('qid', 'pillar', 'text') if field not in (reader.fieldnames or [])]
+        if missing:
+            raise ApiError(400, f"CSV header is missing columns: {', '.join(missing)}")
+
+        columns = set(reader.fieldnames)
+        report = {'rows': 0, 'created': 0, 'updated': 0, 'batches': 0, 'errorCount': 0, 'errors': []}
+        seen = {}
+        staged = []
+
+        def apply(batch):
+            with request.timing.phase('db-write'), self.store.lock:
+                by_qid = {question['qid']: question for question in self.store.questions.values()}
+                for question in batch:
+                    existing = by_qid.get(question['qid'])
+                    if existing:
+                        existing.update({field: value for field, value in question.items() if field in columns})
+                        report['updated'] += 1
+                    else:
+                        question['id'] = str(uuid.uuid4())
+                        self.store.questions[question['id']] = question
+                        report['created'] += 1
+            report['batches'] += 1
+
+        def flush(batch):
+            if all_or_nothing or dry_run:
+                staged.append(batch)
+            else:
+                apply(batch)
+
+        batch = []
+        # Line 1 is the header, so data rows start at line 2
+        for line, row in enumerate(reader, start=2):
+            report['rows'] += 1
+            question, errors = parse_question_row(row)
+            if question['qid'] in seen:
+                errors.append(f"duplicate qid {question['qid']} (first on line {seen[question['qid']]})")
+            elif question['qid']:
+                seen[question['qid']] = line
+            if errors:
+                report['errorCount'] += 1
+                if len(report['errors']) < MAX_IMPORT_ERRORS:
+                    report['errors'].append({'line': line, 'qid': question['qid'], 'errors': errors})
+                continue
+            batch.append(question)
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+
+        applied = not dry_run and not (all_or_nothing and report['errorCount'])
+        if applied:
+            for batch in staged:
+                apply(batch)
+        if report['created'] or report['updated']:
+            self.store.touch('questions')
+        return {'success': not report['errorCount'], 'applied': applied, 'dryRun': dry_run, **report}
+
+    def admin_delete_question(self, request, question_id):
+        with self.store.lock:
+            if not self.store.questions.pop(question_id, None):
+                raise ApiError(404, 'Question not found')
+        self.store.touch('questions')
+        return {'success': True}
+
+    def admin_update_settings(self, request):
+        self.require_admin(request)
+        body = request.json()
+        body.pop('id', None)
+        with self.store.lock:
+            self.store.settings.update(body)
+            self.store.touch('settings')
+            return {'success': True, 'settings': dict(self.store.settings)}
+
+    def admin_stats(self, request):
+        """Dashboard stats from the incremental counters, in constant time.
+
+        ?mode=recompute scans every assessment and result instead, so the
+        counters can be checked against the collections.
+        """
+        self.require_admin(request)
+        with request.timing.phase('db-read'), self.store.lock:
+            if request.query.get('mode', [''])[0] == 'recompute':
+                total, completed, score_sum, decisions = self._recompute_stats()
+            else:
+                counters = self.store.counters
+                total = counters['totalAssessments']
+                completed = counters['completedAssessments']
+                score_sum = counters['scoreSum']
+                decisions = dict(counters['decisions'])
+        return {'stats': {
+            'totalAssessments': total,
+            'completedAssessments': completed,
+            'avgScore': round_half_up(score_sum / completed) if completed else 0,
+            'completionRate': round_half_up(completed / total * 100) if total else 0,
+            'decisions': decisions,
+        }}
+
+    def _recompute_stats(self):
+        completed = [
+            self.store.results[assessment['id']]
+            for assessment in self.store.assessments.values()
+            if assessment['status'] != 'DRAFT' and assessment['id'] in self.store.results
+        ]
+        decisions = {decision: 0 for decision in DECISIONS}
+        for result in completed:
+            decisions[result['decision']] += 1
+        return (len(self.store.assessments), len(completed),
+                sum(result['overallScore'] for result in completed), decisions)
+
+    def _assessment_row(self, assessment_id):
+        assessment = self.store.assessments[assessment_id]
+        profile = self.store.profiles.get(assessment['profileId'], {})
+        result = self.store.results[assessment_id]
+        return {
+            'id': assessment['id'],
+            'name': profile.get('name'),
+            'email': assessment['email'],
+            'companyName': profile.get('companyName'),
+            'completedAt': assessment['completedAt'],
+            'overallScore': result['overallScore'],
+            'decision': result['decision'],
+        }
+
+    def _page(self, before, limit):
+        """Up to `limit` completed-index keys older than `before`, newest first"""
+        with self.store.lock:
+            index = self.store.completed_index
+            end = bisect.bisect_left(index, before) if before else len(index)
+            keys = index[max(0, end - limit):end]
+            return [self._assessment_row(assessment_id) for _, assessment_id in reversed(keys)]
+
+    def admin_assessments(self, request):
+        """Completed assessments, newest first.
+
+        With ?limit=N returns one page plus nextCursor; pass it back as
+        ?cursor= for the next page. ?format=ndjson streams every row as one
+        JSON object per line instead of building a single response.
+        """
+        self.require_admin(request)
+        if request.query.get('format', [''])[0] == 'ndjson':
+            return StubResponse(self._stream_assessments(), headers={'Content-Type': 'application/x-ndjson'})
+
+        limit = request.query.get('limit', [None])[0]
+        if limit is None:
+            with request.timing.phase('db-read'):
+                return {'assessments': self._page(None, len(self.store.completed_index))}
+        try:
+            limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        except ValueError:
+            raise ApiError(400, 'Invalid limit')
+        cursor = request.query.get('cursor', [None])[0]
+        before = self._decode_cursor(cursor) if cursor else None
+        with request.timing.phase('db-read'):
+            rows = self._page(before, limit)
+        next_cursor = None
+        if len(rows) == limit:
+            last = (rows[-1]['completedAt'], rows[-1]['id'])
+            next_cursor = base64.urlsafe_b64encode(json.dumps(last).encode()).decode()
+        return {'assessments': rows, 'nextCursor': next_cursor}
+
+    def _decode_cursor(self, cursor):
+        """Decode a nextCursor back into its (completedAt, id) key, rejecting anything else"""
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError, binascii.Error):
+            raise ApiError(400, 'Invalid cursor')
+        if not (isinstance(key, list) and len(key) == 2 and all(isinstance(part, str) for part in key)):
+            raise ApiError(400, 'Invalid cursor')
+        return tuple(key)
+
+    def _stream_assessments(self, batch_size=500):
+        before = None
+        while True:
+            rows = self._page(before, batch_size)
+            if not rows:
+                return
+            yield ''.join(json.dumps(row) + '\n' for row in rows).encode('utf-8')
+            before = (rows[-1]['completedAt'], rows[-1]['id'])
+
+    def _export_row(self, assessment_id):
+        """One completed assessment joined with its profile and result, risks reduced to qids"""
+        assessment = self.store.assessments[assessment_id]
+        profile = self.store.profiles.get(assessment['profileId'], {})
+        result = self.store.results[assessment_id]
+        return {
+            'assessmentId': assessment['id'],
+            'status': assessment['status'],
+            'createdAt': assessment['createdAt'],
+            'completedAt': assessment['completedAt'],
+            'profile': {field: profile.get(field) for field in
+                        ('name', 'email', 'companyName', 'role', 'erp', 'epicorVersion', 'timeline')},
+            'overallScore': result['overallScore'],
+            'decision': result['decision'],
+            'pillars': {pillar: {'score': row['score'], 'rag': row['rag'], 'answered': row['answered']}
+                        for pillar, row in result['pillarResults'].items()},
+            'gates': {gate: {'avgScore': row['avgScore'], 'status': row['status']}
+                      for gate, row in result['gateResults'].items()},
+            'topRisks': [risk['qid'] for risk in result['topRisks']],
+            'quickWins': [risk['qid'] for risk in result['quickWins']],
+        }
+
+    def admin_export(self, request):
+        """Every completed assessment joined with profile and result, streamed as NDJSON, oldest first.
+
+        ?since=<completedAt> resumes after an earlier export.
+        """
+        self.require_admin(request)
+        since = request.query.get('since', [None])[0]
+        return StubResponse(self._stream_export(since), headers={'Content-Type': 'application/x-ndjson'})
+
+    def _stream_export(self, since=None, batch_size=500):
+        # Past the last possible id for `since`, so rows completed exactly then are skipped
+        after = (since, '\uffff') if since else None
+        while True:
+            with self.store.lock:
+                index = self.store.completed_index
+                start = bisect.bisect_right(index, after) if after else 0
+                keys = index[start:start + batch_size]
+                rows = [self._export_row(assessment_id) for _, assessment_id in keys]
+            if not rows:
+                return
+            yield ''.join(json.dumps(row) + '\n' for row in rows).encode('utf-8')
+            after = keys[-1]
+
+    def admin_start_rescore(self, request):
+        """Start rescoring every completed assessment in the background; poll /admin/rescore/:jobId"""
+        self.require_admin(request)
+        body = request.json()
+        try:
+            batch_size = int(body.get('batchSize', 200))
+            concurrency = int(body.get('concurrency', 4))
+        except (TypeError, ValueError):
+            raise ApiError(400, 'batchSize and concurrency must be integers')
+        if batch_size < 1 or concurrency < 1:
+            raise ApiError(400, 'batchSize and concurrency must be positive')
+        batch_size = min(batch_size, MAX_PAGE_SIZE)
+        concurrency = min(concurrency, MAX_RESCORE_CONCURRENCY)
+        with self.store.lock:
+            running = [job for job in self.store.jobs.values() if job.status == 'running']
+            if running:
+                return StubResponse({'error': 'A rescoring job is already running', **running[0].progress()}, 409)
+            job = RescoreJob(self.store, batch_size, concurrency)
+            self.store.jobs[job.id] = job
+        return StubResponse(job.start().progress(), 202)
+
+    def _job(self, job_id):
+        job = self.store.jobs.get(job_id)
+        if not job:
+            raise ApiError(404, 'Rescoring job not found')
+        return job
+
+    def admin_rescore_status(self, request, job_id):
+        self.require_admin(request)
+        return self._job(job_id).progress()
+
+    def admin_cancel_rescore(self, request, job_id):
+        """Stop a running job after the batches already in flight"""
+        self.require_admin(request)
+        job = self._job(job_id)
+        job.cancelled.set()
+        return job.progress()
+
+    def update_about(self, request):
+        self.require_admin(request)
+        with self.store.lock:
+            self.store.about_us.update(request.json())
+        return {'success': True}
+
+    def update_contact(self, request):
+        self.require_admin(request)
+        with self.store.lock:
+            self.store.contact_us.update(request.json())
+        return {'success': True}
+
+    def admin_teardown(self, request):
+        """Delete everything a tagged tool run created, in batches.
+
+        Body: {runTag, batchSize}. Profiles and assessments carrying the tag go,
+        along with the assessments' answers and results; the lock is released
+        between batches so live traffic is not blocked for the whole teardown.
+        """
+        self.require_admin(request)
+        body = request.json()
+        run_tag = body.get('runTag')
+        if not run_tag or not isinstance(run_tag, str):
+            raise ApiError(400, 'runTag is required')
+        try:
+            batch_size = max(1, min(int(body.get('batchSize', TEARDOWN_BATCH_SIZE)), MAX_PAGE_SIZE))
+        except (TypeError, ValueError):
+            raise ApiError(400, 'batchSize must be an integer')
+        started = time.perf_counter()
+        with self.store.lock:
+            assessment_ids = [assessment_id for assessment_id, assessment in self.store.assessments.items()
+                              if assessment.get('runTag') == run_tag]
+            profile_ids = [profile_id for profile_id, profile in self.store.profiles.items()
+                           if profile.get('runTag') == run_tag]
+        deleted = {'profiles': 0, 'assessments': 0, 'answers': 0, 'results': 0}
+        batches = 0
+        for i in range(0, len(assessment_ids), batch_size):
+            for collection, count in self.store.delete_assessments(assessment_ids[i:i + batch_size]).items():
+                deleted[collection] += count
+            batches += 1
+        for i in range(0, len(profile_ids), batch_size):
+            with self.store.lock:
+                for profile_id in profile_ids[i:i + batch_size]:
+                    if self.store.profiles.pop(profile_id, None):
+                        deleted['profiles'] += 1
+            batches += 1
+        return {'success': True, 'runTag': run_tag, 'deleted': deleted, 'batches': batches,
+                'elapsedMs': round_half_up((time.perf_counter() - started) * 1000, 1)}
+
+    def admin_remove_test_questions(self, request):
+        self.require_admin(request)
+        with self.store.lock:
+            doomed = [
+                question_id for question_id, question in self.store.questions.items()
+                if str(question.get('qid', '')).startswith('TEST') or question.get('isTest')
+            ]
+            for question_id in doomed:
+                del self.store.questions[question_id]
+            if doomed:
+                self.store.touch('questions')
+        return {'success': True, 'deletedCount': len(doomed)}
+
+
+class StubRequest:
+    """The parts of an incoming request the handlers need"""
+
+    def __init__(self, method, path, query, headers, body, stream=None):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+        # Streaming handlers read the body from here instead of `body`
+        self.stream = stream or io.BytesIO(body or b'')
+        self.timing = ServerTiming()
+
+    def json(self):
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except ValueError:
+            raise ApiError(400, 'Invalid JSON body')
+        if not isinstance(data, dict):
+            raise ApiError(400, 'JSON body must be an object')
+        return data
+
+
+class ChunkedReader(io.RawIOBase):
+    """Readable stream over a chunked request body"""
+
+    def __init__(self, rfile):
+        self.rfile = rfile
+        self.remaining = 0
+        self.done = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.done:
+            return 0
+        if not self.remaining:
+            size = int(self.rfile.readline().split(b';')[0].strip() or b'0', 16)
+            if size == 0:
+                # Skip optional trailers up to the blank line
+                while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                    pass
+                self.done = True
+                return 0
+            self.remaining = size
+        data = self.rfile.read(min(len(buffer), self.remaining))
+        buffer[:len(data)] = data
+        self.remaining -= len(data)
+        if not self.remaining:
+            self.rfile.readline()
+        return len(data)
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; don't let Nagle hold the body back
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_PUT(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        server = self.server
+        stream = None
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            stream = ChunkedReader(self.rfile)
+            body = b''
+        else:
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else b''
+        url = urlsplit(self.path)
+        path = url.path
+        if not path.startswith('/api'):
+            self._drain(stream)
+            return self._send(404, {'error': 'Not found'})
+        path = path[len('/api'):].rstrip('/') or '/'
+        headers = {key.lower(): value for key, value in self.headers.items()}
+        request = StubRequest(self.command, path, parse_qs(url.query), headers, body, stream)
+
+        delay, fail = server.faults.next()
+        delay += server.faults.cold_start_delay(server.app.route_of(request))
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self._drain(stream)
+            return self._send(503, {'error': 'Injected failure'})
+        status, payload, headers = server.app.dispatch(request)
+        # The connection is kept alive, so whatever the handler left unread must go
+        self._drain(stream)
+        encoding = None
+        if server.app.compressible(request):
+            # The body depends on Accept-Encoding, so shared caches must key on it
+            headers = {**headers, 'Vary': 'Accept-Encoding'}
+            if status == 200:
+                encoding = negotiate_encoding(request.headers.get('accept-encoding'))
+        self._send(status, payload, headers, request.timing, encoding)
+
+    def _drain(self, stream):
+        if stream is not None:
+            while stream.read(65536):
+                pass
+
+    def _send(self, status, payload, headers=None, timing=None, encoding=None):
+        """Send a JSON payload or a stream of byte chunks, compressed with `encoding` when given"""
+        timing = timing or ServerTiming()
+        if hasattr(payload, '__next__'):
+            if timing.phases:
+                headers = {**(headers or {}), 'Server-Timing': timing.header()}
+            if encoding:
+                headers = {**(headers or {}), 'Content-Encoding': encoding}
+                payload = Compressor(encoding).stream(payload)
+            return self._send_stream(status, payload, headers or {})
+        with timing.phase('serialize'):
+            body = b'' if status == 304 else json.dumps(payload).encode('utf-8')
+        if encoding and len(body) >= MIN_COMPRESS_BYTES:
+            with timing.phase('compress'):
+                compressor = Compressor(encoding)
+                body = compressor.compress(body) + compressor.finish()
+            headers = {**(headers or {}), 'Content-Encoding': encoding}
+        headers = {**(headers or {}), 'Server-Timing': timing.header()}
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, status, chunks, headers):
+        """Send an iterator of byte chunks with chunked transfer encoding"""
+        self.send_response(status)
+        self.send_header('Transfer-Encoding', 'chunked')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        for chunk in chunks:
+            if chunk:
+                self.wfile.write(f"{len(chunk):X}\r\n".encode() + chunk + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class FaultInjector:
+    """Seeded latency and error injection so benchmarks are repeatable"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, seed=None, cold_start=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        # Simulated compile/import cost paid by the first request to each route
+        self.cold_start = cold_start
+        self._warm_routes = set()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next(self):
+        """Return (delay seconds, whether to fail) for the next request"""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+        return max(0.0, delay), fail
+
+    def cold_start_delay(self, route):
+        """cold_start seconds the first time `route` is hit, 0 afterwards"""
+        if not self.cold_start:
+            return 0.0
+        with self._lock:
+            if route in self._warm_routes:
+                return 0.0
+            self._warm_routes.add(route)
+        return self.cold_start
+
+
+class StubServer:
+    """Run the stand-in on a background thread; usable as a context manager.
+
+    >>> with StubServer(latency=0.02) as server:
+    ...     tester = ERPScorecardTester(base_url=server.base_url)
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, jitter=0.0, error_rate=0.0, seed=None,
+                 store=None, cold_start=0.0):
+        self.app = StubApp(store)
+        self.httpd = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.app = self.app
+        self.httpd.faults = FaultInjector(latency, jitter, error_rate, seed, cold_start)
+        self._thread = None
+
+    @property
+    def store(self):
+        return self.app.store
+
+    @property
+    def faults(self):
+        return self.httpd.faults
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='scorecard-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the offline /api stand-in")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--latency", type=float, default=0.0, help="injected latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random +/- latency in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--cold-start", type=float, default=0.0,
+                        help="simulated delay in ms on the first request to each route")
+    args = parser.parse_args()
+
+    server = StubServer(port=args.port, latency=args.latency / 1000, jitter=args.jitter / 1000,
+                        error_rate=args.error_rate, seed=args.seed, cold_start=args.cold_start / 1000)
+    print(f"Serving stand-in API at {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
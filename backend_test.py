@@ -4,39 +4,194 @@ CloudReady ERP Scorecard Backend API Tests
 Tests all backend endpoints for the ERP Cloud Readiness assessment platform.
 """
 
-import requests
+import argparse
+import base64
 import json
+import os
+import statistics
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
 
-# Base URL from environment
-BASE_URL = "https://scorecloud.preview.emergentagent.com/api"
+import requests
+
+from backend_cache import RevalidatingCache
+from backend_client import ScorecardClient, base_url_from_env, new_run_tag
+from backend_metrics import ACCEPT_ENCODING, check_budgets
+
+# Base URL from environment (SCORECARD_BASE_URL)
+BASE_URL = base_url_from_env()
+
+# Number of tests allowed in flight at once
+DEFAULT_WORKERS = 8
+
+# Per-route payload-size limits checked at the end of the suite
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'payload_budgets.json')
+
+# Checks that need a capability the server advertises in GET / 'features'; skipped when it is missing
+REQUIRED_FEATURES = {
+    "Save Answers Delta": 'answers-version',
+    "Calculate Results Cache": 'results-cache',
+    "Admin Rescore": 'rescore',
+    "Teardown Run Data": 'teardown',
+}
+
+# Checks that write /admin/settings; only run against the stand-in or with allow_settings_writes
+SETTINGS_WRITERS = {"Admin Settings", "Calculate Results Cache"}
+
+# Tests that may only start once the listed tests have finished.
+# Everything not listed here is independent and runs concurrently.
+TEST_DEPENDENCIES = {
+    "Save Answers": ["Start Assessment"],
+    "Save Answers Delta": ["Save Answers"],
+    "Calculate Results": ["Save Answers Delta"],
+    "Get Results": ["Calculate Results"],
+    "What-If Scoring": ["Calculate Results"],
+    # Toggles pillar weights, so it runs once nothing else reads or writes settings or results
+    "Calculate Results Cache": ["Get Results", "What-If Scoring", "Conditional GET"],
+    "Admin Remove Test Question": ["Admin Questions", "Admin Import Questions", "Conditional GET",
+                                   "Calculate Results Cache", "Response Compression"],
+    # Imports an ungated question, which the gate check of Questions API would trip over
+    "Admin Import Questions": ["Questions API"],
+    # Compares encodings of /questions, so the bank must not change in between
+    "Response Compression": ["Admin Questions", "Admin Import Questions", "Conditional GET"],
+    # Listings must not change while pages are walked
+    "Admin Assessments Pagination": ["Get Results", "Calculate Results Cache"],
+    "Admin Export": ["Get Results", "Calculate Results Cache"],
+    # Rewrites stored results, so it runs after the question removal and the readers that compare scores
+    "Admin Rescore": ["Admin Remove Test Question", "Admin Assessments Pagination", "Admin Export"],
+    # Admin writes invalidate the cache, so measure revalidation once they are done
+    # and after the other revalidating readers, so no one else sends the same validators meanwhile
+    "Conditional GET": ["Admin Questions", "Admin Import Questions", "Admin Settings", "Save Answers Delta"],
+}
+
+def teardown_run(base_url, run_tag):
+    """Remove the data a run tagged `run_tag` created; returns success"""
+    client = ScorecardClient(base_url or BASE_URL, run_tag=run_tag)
+    return ERPScorecardTester(max_workers=1, client=client).teardown_run_data()
+
 
 class ERPScorecardTester:
-    def __init__(self):
-        self.base_url = BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+    def __init__(self, max_workers=DEFAULT_WORKERS, verbose=True, base_url=None, metrics=None, client=None,
+                 run_tag=None):
+        self.max_workers = max(1, max_workers)
+        self.verbose = verbose
+        # Pass a shared client to reuse one connection pool (and metrics recorder) across testers;
+        # otherwise size the pool to one connection per worker so concurrent tests don't queue
+        self.client = client or ScorecardClient(base_url or BASE_URL, pool_size=self.max_workers, metrics=metrics,
+                                                run_tag=run_tag)
+        # Everything this run creates is tagged, so teardown_run_data can remove it
+        if not self.client.run_tag:
+            self.client.run_tag = new_run_tag('tester')
+        self.base_url = self.client.base_url
+        self.session = self.client.session
+        self.metrics = self.client.metrics
         self.assessment_id = None
         self.profile_id = None
+        self.last_results = None
+        # Filled in by probe_features at the start of run_all_tests
+        self.features = set()
+        self.settings_writable = False
+        self.answers_version = None
+        self.saved_answers = None
+        self._output = threading.local()
         
     def log_test(self, test_name, success, message="", data=None):
         """Log test results"""
+        if not self.verbose:
+            return
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}")
+        lines = [f"{status} {test_name}"]
         if message:
-            print(f"   {message}")
+            lines.append(f"   {message}")
         if data and not success:
-            print(f"   Response: {json.dumps(data, indent=2)}")
-        print()
+            lines.append(f"   Response: {json.dumps(data, indent=2)}")
+        lines.append("")
+        self._emit("\n".join(lines))
+
+    def iter_admin_assessments(self, page_size=500):
+        """Yield every completed assessment, one cursor page in memory at a time"""
+        return self.client.iter_admin_assessments(page_size)
+
+    def iter_admin_assessments_ndjson(self):
+        """Yield every completed assessment from the NDJSON stream as it arrives"""
+        return self.client.iter_admin_assessments_ndjson()
+
+    def cached_get(self, path):
+        """GET a rarely-changing route through the client's revalidating cache"""
+        return self.client.cache.get(self.session, self.client.url(path), timeout=self.client.timeout)
+
+    def _emit(self, text):
+        """Print text, or hold it back while a scheduled test is running"""
+        buffer = getattr(self._output, 'buffer', None)
+        if buffer is not None:
+            buffer.append(text)
+        else:
+            print(text)
+
+    def _run_test(self, test_name, test_func):
+        """Run a single test on a worker thread, capturing its log output"""
+        self._output.buffer = []
+        try:
+            success = bool(test_func())
+        except Exception as e:
+            self._emit(f"❌ FAIL {test_name} - Unexpected error: {str(e)}")
+            success = False
+        finally:
+            output = self._output.buffer
+            self._output.buffer = None
+        return success, "".join(f"{text}\n" for text in output)
+
+    def _run_scheduled(self, tests):
+        """Run tests on a bounded pool, honouring TEST_DEPENDENCIES.
+
+        Output is printed in the order the tests are declared, as soon as
+        every earlier test has finished, so logs read the same as a serial run.
+        """
+        names = [test_name for test_name, _ in tests]
+        funcs = dict(tests)
+
+        def scheduled_deps(test_name):
+            # A dependency that is not being run (e.g. skipped) passes its own dependencies on
+            found = []
+            for dep in TEST_DEPENDENCIES.get(test_name, []):
+                found.extend([dep] if dep in funcs else scheduled_deps(dep))
+            return found
+
+        deps = {test_name: scheduled_deps(test_name) for test_name in names}
+        results = {}
+        outputs = {}
+        pending = list(names)
+        running = {}
+        next_to_print = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                for test_name in list(pending):
+                    if all(dep in results for dep in deps[test_name]):
+                        pending.remove(test_name)
+                        future = pool.submit(self._run_test, test_name, funcs[test_name])
+                        running[future] = test_name
+                if not running:
+                    raise RuntimeError(f"Unsatisfiable test dependencies: {pending}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    test_name = running.pop(future)
+                    results[test_name], outputs[test_name] = future.result()
+
+                while next_to_print < len(names) and names[next_to_print] in outputs:
+                    print(outputs[names[next_to_print]], end='')
+                    next_to_print += 1
+
+        return results
         
     def test_api_root(self):
         """Test API root endpoint"""
         try:
-            response = self.session.get(f"{self.base_url}/")
+            response = self.client.get_root()
             if response.status_code == 200:
                 data = response.json()
                 if data.get('message') == 'CloudReady ERP Scorecard API':
@@ -55,7 +210,7 @@ class ERPScorecardTester:
     def test_questions_api(self):
         """Test Questions API - Should return at least 25 active questions"""
         try:
-            response = self.session.get(f"{self.base_url}/questions")
+            response = self.client.get_questions()
             if response.status_code == 200:
                 data = response.json()
                 questions = data.get('questions', [])
@@ -95,7 +250,7 @@ class ERPScorecardTester:
     def test_settings_api(self):
         """Test Settings API - Should return default settings"""
         try:
-            response = self.session.get(f"{self.base_url}/settings")
+            response = self.client.get_settings()
             if response.status_code == 200:
                 data = response.json()
                 settings = data.get('settings', {})
@@ -146,7 +301,7 @@ class ERPScorecardTester:
                 "timeline": "6-12 months"
             }
             
-            response = self.session.post(f"{self.base_url}/start-assessment", json=profile_data)
+            response = self.client.start_assessment(profile_data)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('success') and 'assessmentId' in data and 'profileId' in data:
@@ -164,41 +319,45 @@ class ERPScorecardTester:
             self.log_test("Start Assessment", False, f"Exception: {str(e)}")
             return False
     
-    def test_save_answers(self):
-        """Test Answers API - POST /api/save-answers"""
+    def test_save_answers(self, answers=None):
+        """Test Answers API - POST /api/save-answers
+
+        Submits `answers` when given, otherwise 25 sample answers mapped
+        onto the first 25 live question IDs.
+        """
         if not self.assessment_id:
             self.log_test("Save Answers", False, "No assessment ID available")
             return False
             
         try:
-            # Create 25 sample answers with scores 2-3 (realistic scores)
-            sample_answers = []
-            for i in range(1, 26):
-                sample_answers.append({
-                    "questionId": f"q{i}",  # This will be replaced with actual question IDs
-                    "score": 2 if i % 3 == 0 else 3  # Mix of scores 2 and 3
-                })
-            
-            # First get actual question IDs
-            questions_response = self.session.get(f"{self.base_url}/questions")
-            if questions_response.status_code == 200:
-                questions_data = questions_response.json()
-                questions = questions_data.get('questions', [])
+            if answers is not None:
+                sample_answers = answers
+            else:
+                # Create 25 sample answers with scores 2-3 (realistic scores)
+                sample_answers = []
+                for i in range(1, 26):
+                    sample_answers.append({
+                        "questionId": f"q{i}",  # This will be replaced with actual question IDs
+                        "score": 2 if i % 3 == 0 else 3  # Mix of scores 2 and 3
+                    })
                 
-                # Update answers with real question IDs
-                for i, answer in enumerate(sample_answers):
-                    if i < len(questions):
-                        answer['questionId'] = questions[i]['id']
-            
-            answers_data = {
-                "assessmentId": self.assessment_id,
-                "answers": sample_answers
-            }
+                # First get actual question IDs
+                questions_response = self.cached_get("/questions")
+                if questions_response.status_code == 200:
+                    questions_data = questions_response.json()
+                    questions = questions_data.get('questions', [])
+                    
+                    # Update answers with real question IDs
+                    for i, answer in enumerate(sample_answers):
+                        if i < len(questions):
+                            answer['questionId'] = questions[i]['id']
             
-            response = self.session.post(f"{self.base_url}/save-answers", json=answers_data)
+            response = self.client.save_answers(self.assessment_id, answers=sample_answers)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('success'):
+                    self.answers_version = data.get('version')
+                    self.saved_answers = sample_answers
                     self.log_test("Save Answers", True, f"Saved {len(sample_answers)} answers")
                     return True
                 else:
@@ -211,20 +370,61 @@ class ERPScorecardTester:
             self.log_test("Save Answers", False, f"Exception: {str(e)}")
             return False
     
-    def test_calculate_results(self):
-        """Test Results Calculation - POST /api/calculate-results"""
+    def test_save_answers_delta(self):
+        """Test Delta Save - POST /api/save-answers with a single answer, changes and baseVersion"""
+        if not self.assessment_id:
+            self.log_test("Save Answers Delta", False, "No assessment ID available")
+            return False
+        if self.answers_version is None:
+            self.log_test("Save Answers Delta", False, "Full save returned no answers version")
+            return False
+
+        try:
+            questions = self.cached_get("/questions").json().get('questions', [])
+            # Re-send scores already saved by test_save_answers so the results are unchanged
+            single = {"questionId": questions[0]['id'], "score": 3}
+            response = self.client.save_answers(self.assessment_id, answer=single, base_version=self.answers_version)
+            data = response.json()
+            if response.status_code != 200 or data.get('version') != self.answers_version + 1:
+                self.log_test("Save Answers Delta", False, f"Single upsert: HTTP {response.status_code}", data)
+                return False
+
+            changes = [{"questionId": questions[1]['id'], "score": 3},
+                       {"questionId": questions[2]['id'], "score": 2}]
+            response = self.client.save_answers(self.assessment_id, changes=changes, base_version=data['version'])
+            data = response.json()
+            if response.status_code != 200 or data.get('version') != self.answers_version + 2:
+                self.log_test("Save Answers Delta", False, f"Delta save: HTTP {response.status_code}", data)
+                return False
+
+            response = self.client.save_answers(self.assessment_id, answer=single, base_version=self.answers_version)
+            if response.status_code != 409:
+                self.log_test("Save Answers Delta", False, f"Stale baseVersion should return 409, got {response.status_code}")
+                return False
+
+            self.answers_version = data['version']
+            self.log_test("Save Answers Delta", True, f"Single and delta upserts saved at version {data['version']}, stale save rejected")
+            return True
+        except Exception as e:
+            self.log_test("Save Answers Delta", False, f"Exception: {str(e)}")
+            return False
+
+    def test_calculate_results(self, recompute=False):
+        """Test Results Calculation - POST /api/calculate-results
+
+        `recompute` bypasses the stored result, for timing the scoring itself.
+        """
         if not self.assessment_id:
             self.log_test("Calculate Results", False, "No assessment ID available")
             return False
             
         try:
-            calc_data = {"assessmentId": self.assessment_id}
-            
-            response = self.session.post(f"{self.base_url}/calculate-results", json=calc_data)
+            response = self.client.calculate_results(self.assessment_id, recompute=recompute)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('success') and 'results' in data:
                     results = data['results']
+                    self.last_results = results
                     
                     # Verify scoring engine results
                     required_fields = ['overallScore', 'pillarResults', 'gateResults', 'topRisks', 'quickWins', 'decision', 'roadmap']
@@ -273,6 +473,111 @@ class ERPScorecardTester:
             self.log_test("Calculate Results", False, f"Exception: {str(e)}")
             return False
     
+    def test_what_if(self):
+        """Test What-If Scoring - POST /api/what-if scores candidates without saving"""
+        if not self.assessment_id or not self.saved_answers:
+            self.log_test("What-If Scoring", False, "No scored assessment available")
+            return False
+
+        try:
+            candidates = [
+                {"id": answer['questionId'], "changes": [{"questionId": answer['questionId'], "score": 4}]}
+                for answer in self.saved_answers
+            ]
+            before = self.client.get_results(self.assessment_id).json().get('result', {})
+            response = self.client.what_if(self.assessment_id, candidates)
+            if response.status_code != 200:
+                self.log_test("What-If Scoring", False, f"HTTP {response.status_code}", response.text)
+                return False
+            data = response.json()
+            scored = data.get('candidates', [])
+            if len(scored) != len(candidates) or any('deltaScore' not in c or 'decision' not in c for c in scored):
+                self.log_test("What-If Scoring", False, f"Expected {len(candidates)} scored candidates", data)
+                return False
+            if any(candidate['deltaScore'] < 0 for candidate in scored):
+                self.log_test("What-If Scoring", False, "Raising a score to 4 lowered the overall score")
+                return False
+
+            after = self.client.get_results(self.assessment_id).json().get('result', {})
+            if before.get('id') != after.get('id'):
+                self.log_test("What-If Scoring", False, "What-if request rewrote the stored results")
+                return False
+
+            malformed = self.client.what_if(self.assessment_id, [{"id": "bad", "changes": ["not-an-object"]}])
+            if malformed.status_code != 400:
+                self.log_test("What-If Scoring", False, f"Malformed change should be rejected, got HTTP {malformed.status_code}")
+                return False
+
+            best = max(candidate['deltaScore'] for candidate in scored)
+            self.log_test("What-If Scoring", True,
+                          f"Scored {len(scored)} candidates in one request, best gain +{best}, results untouched")
+            return True
+        except Exception as e:
+            self.log_test("What-If Scoring", False, f"Exception: {str(e)}")
+            return False
+
+    def test_calculate_results_cache(self, hits=5):
+        """Test Memoized Calculation - repeat POST /api/calculate-results is served from the stored result
+
+        Changes the P1/P2 weights (total stays 100) and back, so each call after a
+        settings write must recompute, then times repeat calls that must not.
+        """
+        if not self.assessment_id:
+            self.log_test("Calculate Results Cache", False, "No assessment ID available")
+            return False
+
+        def timed_calculation():
+            started = time.perf_counter()
+            response = self.client.calculate_results(self.assessment_id)
+            elapsed = time.perf_counter() - started
+            response.raise_for_status()
+            return response.json(), elapsed
+
+        try:
+            original = self.client.get_settings().json()['settings']['weights']
+            shifted = {**original, 'P1': original['P1'] + 1, 'P2': original['P2'] - 1}
+            misses = []
+            restored = False
+            try:
+                for weights in (shifted, original, shifted, original):
+                    write = self.client.admin_update_settings({'weights': weights})
+                    if write.status_code != 200:
+                        self.log_test("Calculate Results Cache", False, f"Weight update failed: HTTP {write.status_code}")
+                        return False
+                    data, elapsed = timed_calculation()
+                    weight = data['results']['pillarResults'].get('P1', {}).get('weight')
+                    if data.get('cached') or weight != weights['P1']:
+                        self.log_test("Calculate Results Cache", False,
+                                      f"Weight change did not force a recompute (cached={data.get('cached')}, "
+                                      f"P1 weight {weight}, expected {weights['P1']})")
+                        return False
+                    misses.append(elapsed)
+                    restored = weights is original
+            finally:
+                # Another settings write would invalidate the result just computed
+                if not restored:
+                    self.client.admin_update_settings({'weights': original})
+
+            recomputed = data['results']
+            hit_times = []
+            for _ in range(hits):
+                data, elapsed = timed_calculation()
+                if not data.get('cached') or data['results']['id'] != recomputed['id']:
+                    self.log_test("Calculate Results Cache", False, "Unchanged answers and weights were recomputed")
+                    return False
+                hit_times.append(elapsed)
+            self.last_results = recomputed
+
+            miss_ms = statistics.median(misses) * 1000
+            hit_ms = statistics.median(hit_times) * 1000
+            self.log_test("Calculate Results Cache", True,
+                          f"Weight changes recomputed {len(misses)}x; repeats served from cache: "
+                          f"miss {miss_ms:.1f}ms vs hit {hit_ms:.1f}ms median")
+            return True
+        except Exception as e:
+            self.log_test("Calculate Results Cache", False, f"Exception: {str(e)}")
+            return False
+
     def test_get_results(self):
         """Test Results Retrieval - GET /api/results/:assessmentId"""
         if not self.assessment_id:
@@ -280,7 +585,7 @@ class ERPScorecardTester:
             return False
             
         try:
-            response = self.session.get(f"{self.base_url}/results/{self.assessment_id}")
+            response = self.client.get_results(self.assessment_id)
             if response.status_code == 200:
                 data = response.json()
                 if 'result' in data:
@@ -301,11 +606,14 @@ class ERPScorecardTester:
             self.log_test("Get Results", False, f"Exception: {str(e)}")
             return False
     
-    def test_admin_questions(self):
-        """Test Admin Questions API - POST /api/admin/questions"""
+    def test_admin_questions(self, question=None):
+        """Test Admin Questions API - POST /api/admin/questions
+
+        Creates `question` when given, otherwise the TEST1 sample question.
+        """
         try:
             # Test creating a new question
-            new_question = {
+            new_question = question or {
                 "qid": "TEST1",
                 "pillar": "P1",
                 "gate": "G1",
@@ -319,7 +627,7 @@ class ERPScorecardTester:
                 "sortOrder": 999
             }
             
-            response = self.session.post(f"{self.base_url}/admin/questions", json=new_question)
+            response = self.client.admin_create_question(new_question)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('success') and 'question' in data:
@@ -340,6 +648,163 @@ class ERPScorecardTester:
             self.log_test("Admin Questions", False, f"Exception: {str(e)}")
             return False
     
+    def test_admin_import_questions(self):
+        """Test Bulk Question Import - POST /api/admin/questions/import
+
+        Streams a small CSV with one invalid row, then imports it again to
+        check that rows are upserted by qid rather than duplicated, and once
+        more with only some columns, which must leave the others untouched.
+        """
+        try:
+            lines = [
+                "qid,pillar,gate,text,effort,active,sortOrder,isTest\n",
+                "TESTIMPORT1,P1,G1,Imported question one?,L,true,901,true\n",
+                "TESTIMPORT2,P5,,Imported question two?,M,true,902,true\n",
+                "TESTIMPORT3,P10,G5,\"Imported, quoted question three?\",H,false,903,true\n",
+                "TESTIMPORT4,P11,G9,Invalid row,X,true,904,true\n",
+            ]
+            first = self.client.admin_import_questions(line.encode() for line in lines)
+            if first.status_code != 200:
+                self.log_test("Admin Import Questions", False, f"HTTP {first.status_code}", first.text)
+                return False
+            report = first.json()
+            bad_lines = [error['line'] for error in report.get('errors', [])]
+            if report.get('rows') != 4 or report.get('created', 0) + report.get('updated', 0) != 3 or bad_lines != [5]:
+                self.log_test("Admin Import Questions", False, "Unexpected import report", report)
+                return False
+
+            second = self.client.admin_import_questions("".join(lines[:4]).encode())
+            if second.status_code != 200 or second.json().get('updated') != 3 or second.json().get('created') != 0:
+                self.log_test("Admin Import Questions", False, "Re-import did not upsert by qid", second.text)
+                return False
+
+            partial = self.client.admin_import_questions(
+                b"qid,pillar,text\nTESTIMPORT1,P1,Reworded question one?\nTESTIMPORT3,P10,Reworded question three?\n")
+            if partial.status_code != 200 or partial.json().get('updated') != 2:
+                self.log_test("Admin Import Questions", False, "Partial-column re-import failed", partial.text)
+                return False
+            stored = {question['qid']: question
+                      for question in self.client.admin_list_questions().json().get('questions', [])}
+            expected = {
+                'TESTIMPORT1': {'text': 'Reworded question one?', 'gate': 'G1', 'effort': 'L', 'active': True,
+                                'sortOrder': 901, 'isTest': True},
+                'TESTIMPORT3': {'text': 'Reworded question three?', 'gate': 'G5', 'effort': 'H', 'active': False,
+                                'sortOrder': 903, 'isTest': True},
+            }
+            for qid, fields in expected.items():
+                changed = {field: stored.get(qid, {}).get(field) for field, value in fields.items()
+                           if stored.get(qid, {}).get(field) != value}
+                if changed:
+                    self.log_test("Admin Import Questions", False, f"Partial re-import overwrote {qid} columns it lacked",
+                                  changed)
+                    return False
+
+            self.log_test("Admin Import Questions", True,
+                          f"{report['rows']} rows in {report['batches']} batch(es), invalid row reported on line 5, "
+                          f"re-import updated 3, partial-column re-import kept the other columns")
+            return True
+        except Exception as e:
+            self.log_test("Admin Import Questions", False, f"Exception: {str(e)}")
+            return False
+
+    def test_response_compression(self):
+        """Test Response Compression - heavy GET routes negotiate each accepted coding and decode to the same JSON"""
+        try:
+            url = f"{self.base_url}/questions"
+            plain = self.session.get(url, headers={'Accept-Encoding': 'identity'}, timeout=self.client.timeout)
+            if plain.status_code != 200 or plain.headers.get('Content-Encoding'):
+                self.log_test("Response Compression", False,
+                              f"identity: HTTP {plain.status_code}, Content-Encoding {plain.headers.get('Content-Encoding')}")
+                return False
+            codings = [coding.strip() for coding in ACCEPT_ENCODING.split(',')]
+            for coding in codings:
+                response = self.session.get(url, headers={'Accept-Encoding': coding}, timeout=self.client.timeout)
+                if response.headers.get('Content-Encoding') != coding:
+                    self.log_test("Response Compression", False,
+                                  f"Asked for {coding}, got Content-Encoding {response.headers.get('Content-Encoding')}")
+                    return False
+                if 'accept-encoding' not in response.headers.get('Vary', '').lower():
+                    self.log_test("Response Compression", False, f"{coding} response has no Vary: Accept-Encoding")
+                    return False
+                if response.json() != plain.json():
+                    self.log_test("Response Compression", False, f"{coding} body decodes to different JSON")
+                    return False
+            self.log_test("Response Compression", True,
+                          f"/questions negotiated {', '.join(codings)}; {len(plain.content)}B decoded")
+            return True
+        except Exception as e:
+            self.log_test("Response Compression", False, f"Exception: {str(e)}")
+            return False
+
+    def check_payload_budgets(self, budgets):
+        """Fail when the largest response of a budgeted route exceeded its wire or decoded size limit"""
+        violations = check_budgets(self.metrics.summary(), budgets)
+        if violations:
+            self.log_test("Payload Budgets", False, "; ".join(violations))
+            return False
+        self.log_test("Payload Budgets", True, f"{len(budgets)} budgeted routes within their size limits")
+        return True
+
+    def test_conditional_get(self):
+        """Test Conditional GET - 304 revalidation of /api/questions and /api/settings"""
+        try:
+            cache = RevalidatingCache()
+            savings = []
+            for path in ("/questions", "/settings"):
+                url = f"{self.base_url}{path}"
+                started = time.perf_counter()
+                first = cache.get(self.session, url)
+                full_time = time.perf_counter() - started
+                if first.status_code != 200:
+                    self.log_test("Conditional GET", False, f"{path}: HTTP {first.status_code}", first.text)
+                    return False
+                if not (first.headers.get('ETag') or first.headers.get('Last-Modified')):
+                    self.log_test("Conditional GET", False, f"{path}: no ETag or Last-Modified header")
+                    return False
+
+                started = time.perf_counter()
+                second = cache.get(self.session, url)
+                revalidate_time = time.perf_counter() - started
+                if not second.from_cache:
+                    self.log_test("Conditional GET", False, f"{path}: unchanged data was sent again (HTTP {second.status_code})")
+                    return False
+                if first.from_cache or second.json() != first.json():
+                    self.log_test("Conditional GET", False, f"{path}: revalidated copy differs from, or flagged, the original")
+                    return False
+                savings.append(f"{path} saved {len(first.content)}B, "
+                               f"{full_time * 1000:.1f}ms -> {revalidate_time * 1000:.1f}ms")
+
+            # Admin writes must invalidate both cached payloads
+            question = {"qid": "TESTCACHE", "pillar": "P1", "gate": "G1", "text": "Cache invalidation test?",
+                        "effort": "L", "active": True, "sortOrder": 999, "isTest": True}
+            write = self.client.admin_create_question(question)
+            if write.status_code != 200:
+                self.log_test("Conditional GET", False, f"Question write failed: HTTP {write.status_code}")
+                return False
+            if cache.get(self.session, f"{self.base_url}/questions").from_cache:
+                self.log_test("Conditional GET", False, "/questions still validated after /admin/questions write")
+                return False
+
+            if self.settings_writable:
+                settings = self.client.get_settings().json().get('settings', {})
+                settings.pop('id', None)
+                write = self.client.admin_update_settings(settings)
+                if write.status_code != 200:
+                    self.log_test("Conditional GET", False, f"Settings write failed: HTTP {write.status_code}")
+                    return False
+                if cache.get(self.session, f"{self.base_url}/settings").from_cache:
+                    self.log_test("Conditional GET", False, "/settings still validated after /admin/settings write")
+                    return False
+                savings.append("invalidated by admin writes")
+            else:
+                savings.append("invalidated by question writes (settings write skipped)")
+
+            self.log_test("Conditional GET", True, "; ".join(savings))
+            return True
+        except Exception as e:
+            self.log_test("Conditional GET", False, f"Exception: {str(e)}")
+            return False
+
     def test_admin_settings(self):
         """Test Admin Settings API - POST /api/admin/settings"""
         try:
@@ -357,9 +822,7 @@ class ERPScorecardTester:
                 "guidedReviewLink": "https://calendly.com/test/guided-review"
             }
             
-            # Add admin password header
-            headers = {'x-admin-password': 'Murugan@369'}
-            response = self.session.post(f"{self.base_url}/admin/settings", json=updated_settings, headers=headers)
+            response = self.client.admin_update_settings(updated_settings)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('success'):
@@ -379,14 +842,12 @@ class ERPScorecardTester:
         """Test Admin Password Verification - GET /api/admin/verify"""
         try:
             # Test with correct password
-            headers = {'x-admin-password': 'Murugan@369'}
-            response = self.session.get(f"{self.base_url}/admin/verify", headers=headers)
+            response = self.client.admin_verify()
             if response.status_code == 200:
                 data = response.json()
                 if data.get('valid') == True:
                     # Test with wrong password
-                    wrong_headers = {'x-admin-password': 'wrongpassword'}
-                    wrong_response = self.session.get(f"{self.base_url}/admin/verify", headers=wrong_headers)
+                    wrong_response = self.client.admin_verify(password='wrongpassword')
                     if wrong_response.status_code == 200:
                         wrong_data = wrong_response.json()
                         if wrong_data.get('valid') == False:
@@ -411,8 +872,7 @@ class ERPScorecardTester:
     def test_admin_stats(self):
         """Test Admin Dashboard Stats - GET /api/admin/stats"""
         try:
-            headers = {'x-admin-password': 'Murugan@369'}
-            response = self.session.get(f"{self.base_url}/admin/stats", headers=headers)
+            response = self.client.admin_stats()
             if response.status_code == 200:
                 data = response.json()
                 if 'stats' in data:
@@ -447,8 +907,7 @@ class ERPScorecardTester:
     def test_admin_assessments(self):
         """Test Admin Assessments List - GET /api/admin/assessments"""
         try:
-            headers = {'x-admin-password': 'Murugan@369'}
-            response = self.session.get(f"{self.base_url}/admin/assessments", headers=headers)
+            response = self.client.admin_assessments()
             if response.status_code == 200:
                 data = response.json()
                 if 'assessments' in data:
@@ -478,11 +937,125 @@ class ERPScorecardTester:
             self.log_test("Admin Assessments", False, f"Exception: {str(e)}")
             return False
 
+    def test_admin_assessments_paginated(self):
+        """Test Admin Assessments Pagination - cursor pages and NDJSON stream match the full list"""
+        try:
+            response = self.client.admin_assessments()
+            if response.status_code != 200:
+                self.log_test("Admin Assessments Pagination", False, f"HTTP {response.status_code}", response.text)
+                return False
+            expected = [row['id'] for row in response.json().get('assessments', [])]
+
+            paged = [row['id'] for row in self.iter_admin_assessments(page_size=2)]
+            if paged != expected:
+                self.log_test("Admin Assessments Pagination", False,
+                              f"Cursor pages returned {len(paged)} rows, full list has {len(expected)}")
+                return False
+            streamed = [row['id'] for row in self.iter_admin_assessments_ndjson()]
+            if streamed != expected:
+                self.log_test("Admin Assessments Pagination", False,
+                              f"NDJSON stream returned {len(streamed)} rows, full list has {len(expected)}")
+                return False
+            # Tampered cursors: not base64, base64 of non-JSON, and JSON of the wrong shape
+            bad_cursors = ['not-a-cursor!', base64.urlsafe_b64encode(b'\xff\xfe').decode(),
+                           base64.urlsafe_b64encode(json.dumps({'id': 1}).encode()).decode(),
+                           base64.urlsafe_b64encode(json.dumps([1, 2, 3]).encode()).decode()]
+            for cursor in bad_cursors:
+                response = self.client.admin_assessments(limit=2, cursor=cursor)
+                if response.status_code != 400:
+                    self.log_test("Admin Assessments Pagination", False,
+                                  f"Cursor {cursor!r} returned HTTP {response.status_code}, expected 400", response.text)
+                    return False
+
+            self.log_test("Admin Assessments Pagination", True,
+                          f"Cursor pages and NDJSON stream both returned all {len(expected)} assessments in order; "
+                          f"{len(bad_cursors)} tampered cursors rejected with 400")
+            return True
+        except Exception as e:
+            self.log_test("Admin Assessments Pagination", False, f"Exception: {str(e)}")
+            return False
+
+    def test_admin_export(self):
+        """Test Bulk Export - GET /api/admin/export joins profile, assessment and result in one stream"""
+        try:
+            rows = 0
+            found = None
+            for row in self.client.iter_export():
+                rows += 1
+                if row['assessmentId'] == self.assessment_id:
+                    found = row
+            if found is None:
+                self.log_test("Admin Export", False, f"Completed assessment {self.assessment_id} missing from {rows} rows")
+                return False
+            missing = [field for field in ('profile', 'overallScore', 'decision', 'pillars', 'gates', 'topRisks')
+                       if field not in found]
+            if missing:
+                self.log_test("Admin Export", False, f"Missing fields: {', '.join(missing)}", found)
+                return False
+            if self.last_results and found['overallScore'] != self.last_results.get('overallScore'):
+                self.log_test("Admin Export", False,
+                              f"Exported score {found['overallScore']} != calculated {self.last_results.get('overallScore')}")
+                return False
+            # A streamed response is recorded once its body is read, with the bytes and time of the whole body
+            record = [record for record in self.metrics.records if record['route'] == '/admin/export'][-1]
+            if not record['responseBytes'] or record['wall'] < record['ttfb']:
+                self.log_test("Admin Export", False,
+                              f"Stream recorded {record['responseBytes']} bytes in {record['wall'] * 1000:.1f}ms, "
+                              f"headers after {record['ttfb'] * 1000:.1f}ms")
+                return False
+            self.log_test("Admin Export", True,
+                          f"{rows} joined rows streamed ({record['responseBytes'] / 1024:.1f} KB), {len(found['pillars'])} pillars and {len(found['gates'])} gates per row")
+            return True
+        except Exception as e:
+            self.log_test("Admin Export", False, f"Exception: {str(e)}")
+            return False
+
+    def test_admin_rescore(self, timeout=120):
+        """Test Bulk Rescoring - POST /api/admin/rescore rescores completed assessments in the background
+
+        Polls the job to completion, then checks the dashboard counters against a
+        full recompute and that this run's own result is current again.
+        """
+        try:
+            response = self.client.admin_start_rescore(batch_size=0, concurrency=4)
+            if response.status_code != 400:
+                self.log_test("Admin Rescore", False, f"batchSize 0 should be rejected, got HTTP {response.status_code}")
+                return False
+            response = self.client.admin_start_rescore(batch_size=100, concurrency=4)
+            if response.status_code != 202:
+                self.log_test("Admin Rescore", False, f"HTTP {response.status_code}", response.text)
+                return False
+            job = response.json()
+            progress = self.client.wait_for_rescore(job['jobId'], poll=0.2, timeout=timeout)
+            if progress['status'] != 'completed' or progress['failed']:
+                self.log_test("Admin Rescore", False, f"Job {progress['status']}, {progress['failed']} failed", progress)
+                return False
+            if progress['processed'] != progress['total']:
+                self.log_test("Admin Rescore", False, f"Processed {progress['processed']} of {progress['total']}")
+                return False
+            stats = self.client.admin_stats().json()['stats']
+            recomputed = self.client.admin_stats(mode='recompute').json()['stats']
+            if stats != recomputed:
+                self.log_test("Admin Rescore", False, "Counters drifted from the results", {'counters': stats, 'recompute': recomputed})
+                return False
+            if self.assessment_id:
+                data = self.client.calculate_results(self.assessment_id).json()
+                if not data.get('cached'):
+                    self.log_test("Admin Rescore", False, "Own result was not current after rescoring")
+                    return False
+            self.log_test("Admin Rescore", True,
+                          f"{progress['processed']} rescored ({progress['changed']} changed, {progress['skipped']} current) "
+                          f"in {progress['elapsedSeconds']:.2f}s, {progress['ratePerSecond']:.0f}/s")
+            return True
+        except Exception as e:
+            self.log_test("Admin Rescore", False, f"Exception: {str(e)}")
+            return False
+
     def test_admin_about(self):
         """Test Admin About Us - GET and POST /api/admin/about"""
         try:
             # Test GET (public endpoint)
-            response = self.session.get(f"{self.base_url}/admin/about")
+            response = self.client.get_about()
             if response.status_code == 200:
                 data = response.json()
                 if 'aboutUs' in data:
@@ -499,8 +1072,7 @@ class ERPScorecardTester:
                             "businessHours": "Mon-Fri 9AM-6PM"
                         }
                         
-                        headers = {'x-admin-password': 'Murugan@369'}
-                        post_response = self.session.post(f"{self.base_url}/admin/about", json=test_about, headers=headers)
+                        post_response = self.client.admin_update_about(test_about)
                         if post_response.status_code == 200:
                             post_data = post_response.json()
                             if post_data.get('success'):
@@ -529,7 +1101,7 @@ class ERPScorecardTester:
         """Test Admin Contact Us - GET and POST /api/admin/contact"""
         try:
             # Test GET (public endpoint)
-            response = self.session.get(f"{self.base_url}/admin/contact")
+            response = self.client.get_contact()
             if response.status_code == 200:
                 data = response.json()
                 if 'contactUs' in data:
@@ -547,8 +1119,7 @@ class ERPScorecardTester:
                             "twitter": "https://twitter.com/test"
                         }
                         
-                        headers = {'x-admin-password': 'Murugan@369'}
-                        post_response = self.session.post(f"{self.base_url}/admin/contact", json=test_contact, headers=headers)
+                        post_response = self.client.admin_update_contact(test_contact)
                         if post_response.status_code == 200:
                             post_data = post_response.json()
                             if post_data.get('success'):
@@ -576,7 +1147,7 @@ class ERPScorecardTester:
     def test_admin_pricing(self):
         """Test Admin Pricing - GET /api/admin/pricing"""
         try:
-            response = self.session.get(f"{self.base_url}/admin/pricing")
+            response = self.client.get_pricing()
             if response.status_code == 200:
                 data = response.json()
                 expected_fields = ['pricing', 'currency', 'guidedReviewLink', 'tierCBookingLink']
@@ -604,8 +1175,7 @@ class ERPScorecardTester:
     def test_admin_remove_test_question(self):
         """Test Admin Remove Test Questions - POST /api/admin/remove-test-question"""
         try:
-            headers = {'x-admin-password': 'Murugan@369'}
-            response = self.session.post(f"{self.base_url}/admin/remove-test-question", json={}, headers=headers)
+            response = self.client.admin_remove_test_questions()
             if response.status_code == 200:
                 data = response.json()
                 if data.get('success') and 'deletedCount' in data:
@@ -626,10 +1196,10 @@ class ERPScorecardTester:
         """Test Admin Endpoints Without Authorization"""
         try:
             # Test admin stats without password
-            response = self.session.get(f"{self.base_url}/admin/stats")
+            response = self.client.request('GET', '/admin/stats')
             if response.status_code == 401:
                 # Test admin assessments without password
-                response2 = self.session.get(f"{self.base_url}/admin/assessments")
+                response2 = self.client.request('GET', '/admin/assessments')
                 if response2.status_code == 401:
                     self.log_test("Admin Unauthorized", True, "Protected endpoints correctly return 401 without auth")
                     return True
@@ -643,11 +1213,65 @@ class ERPScorecardTester:
             self.log_test("Admin Unauthorized", False, f"Exception: {str(e)}")
             return False
     
-    def run_all_tests(self):
-        """Run all backend API tests"""
+    def teardown_run_data(self):
+        """Delete the profiles, assessments, answers and results tagged with this run's tag"""
+        try:
+            response = self.client.admin_teardown()
+            if response.status_code != 200:
+                self.log_test("Teardown Run Data", False, f"HTTP {response.status_code}", response.text)
+                return False
+            data = response.json()
+            deleted = data['deleted']
+            if self.assessment_id and self.client.get_results(self.assessment_id).status_code != 404:
+                self.log_test("Teardown Run Data", False, f"Assessment {self.assessment_id} still has results", data)
+                return False
+            self.log_test("Teardown Run Data", True,
+                          f"Removed run {data['runTag']}: {deleted['profiles']} profiles, {deleted['assessments']} assessments, "
+                          f"{deleted['answers']} answers, {deleted['results']} results in {data['elapsedMs']}ms")
+            return True
+        except Exception as e:
+            self.log_test("Teardown Run Data", False, f"Exception: {str(e)}")
+            return False
+
+    def probe_features(self):
+        """Read the capabilities the server advertises in GET / (none for a server that lists none)"""
+        try:
+            response = self.client.get_root()
+            self.features = set(response.json().get('features', [])) if response.status_code == 200 else set()
+        except (requests.RequestException, ValueError):
+            self.features = set()
+        return self.features
+
+    def skip_reason(self, test_name):
+        """Why `test_name` cannot run against this server, or None when it can"""
+        feature = REQUIRED_FEATURES.get(test_name)
+        if feature and feature not in self.features:
+            return f"server does not advertise '{feature}'"
+        if test_name in SETTINGS_WRITERS and not self.settings_writable:
+            return "writes settings; pass --allow-settings-writes to run it against this server"
+        return None
+
+    def log_skip(self, test_name, reason):
+        if self.verbose:
+            self._emit(f"⏭️  SKIP {test_name}\n   {reason}\n")
+
+    def run_all_tests(self, report_path=None, keep_data=False, budgets=None, allow_settings_writes=False):
+        """Run all backend API tests, optionally writing a JSON metrics report.
+
+        Checks that need a capability the server does not advertise are
+        reported as skipped, as are settings writes against anything but the
+        stand-in unless `allow_settings_writes`. Unless `keep_data`, the data
+        the run created is torn down afterwards. `budgets` ('METHOD /route' ->
+        size limits) fail the run when exceeded.
+        """
+        self.probe_features()
+        self.settings_writable = allow_settings_writes or 'stand-in' in self.features
         print("=" * 60)
         print("CloudReady ERP Scorecard Backend API Tests")
         print(f"Base URL: {self.base_url}")
+        print(f"Workers: {self.max_workers}")
+        print(f"Run tag: {self.client.run_tag}")
+        print(f"Server features: {', '.join(sorted(self.features)) or 'none advertised'}")
         print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
         print()
@@ -658,14 +1282,23 @@ class ERPScorecardTester:
             ("Settings API", self.test_settings_api),
             ("Start Assessment", self.test_start_assessment),
             ("Save Answers", self.test_save_answers),
+            ("Save Answers Delta", self.test_save_answers_delta),
             ("Calculate Results", self.test_calculate_results),
             ("Get Results", self.test_get_results),
+            ("What-If Scoring", self.test_what_if),
+            ("Calculate Results Cache", self.test_calculate_results_cache),
             ("Admin Questions", self.test_admin_questions),
+            ("Admin Import Questions", self.test_admin_import_questions),
             ("Admin Settings", self.test_admin_settings),
+            ("Conditional GET", self.test_conditional_get),
+            ("Response Compression", self.test_response_compression),
             # New Admin Dashboard Tests
             ("Admin Verify", self.test_admin_verify),
             ("Admin Stats", self.test_admin_stats),
             ("Admin Assessments", self.test_admin_assessments),
+            ("Admin Assessments Pagination", self.test_admin_assessments_paginated),
+            ("Admin Export", self.test_admin_export),
+            ("Admin Rescore", self.test_admin_rescore),
             ("Admin About", self.test_admin_about),
             ("Admin Contact", self.test_admin_contact),
             ("Admin Pricing", self.test_admin_pricing),
@@ -673,27 +1306,217 @@ class ERPScorecardTester:
             ("Admin Unauthorized", self.test_admin_unauthorized)
         ]
         
-        passed = 0
-        failed = 0
+        skipped = {test_name: self.skip_reason(test_name) for test_name, _ in tests}
+        skipped = {test_name: reason for test_name, reason in skipped.items() if reason}
+        for test_name, reason in skipped.items():
+            self.log_skip(test_name, reason)
+
+        started = time.monotonic()
+        results = self._run_scheduled([test for test in tests if test[0] not in skipped])
+        elapsed = time.monotonic() - started
+        if not keep_data:
+            reason = self.skip_reason("Teardown Run Data")
+            if reason:
+                skipped["Teardown Run Data"] = reason
+                self.log_skip("Teardown Run Data", f"{reason}; data tagged {self.client.run_tag} is left in place")
+            else:
+                results["Teardown Run Data"] = self.teardown_run_data()
+        if budgets:
+            results["Payload Budgets"] = self.check_payload_budgets(budgets)
         
-        for test_name, test_func in tests:
-            try:
-                if test_func():
-                    passed += 1
-                else:
-                    failed += 1
-            except Exception as e:
-                print(f"❌ FAIL {test_name} - Unexpected error: {str(e)}")
-                failed += 1
+        passed = sum(1 for success in results.values() if success)
+        failed = len(results) - passed
         
         print("=" * 60)
-        print(f"Test Results: {passed} passed, {failed} failed")
+        print(f"Test Results: {passed} passed, {failed} failed, {len(skipped)} skipped")
+        print(f"Elapsed: {elapsed:.2f}s")
         print(f"Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
+        self.metrics.print_summary()
+        print("=" * 60)
+        if report_path:
+            self.metrics.write_json(report_path)
+            print(f"Metrics report written to {report_path}")
         
         return failed == 0
 
 if __name__ == "__main__":
-    tester = ERPScorecardTester()
-    success = tester.run_all_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="CloudReady ERP Scorecard backend API tests")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"maximum tests in flight at once (default {DEFAULT_WORKERS}, 1 = serial)")
+    parser.add_argument("--load", action="store_true",
+                        help="run the load generator instead of the functional suite")
+    parser.add_argument("--users", type=int, default=10,
+                        help="load/soak mode: concurrent virtual users (default 10)")
+    parser.add_argument("--duration", type=float, default=60,
+                        help="load mode: seconds to keep generating load (default 60)")
+    parser.add_argument("--ramp-up", type=float, default=10,
+                        help="load mode: seconds over which virtual users are started (default 10)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="load mode: spread virtual users over N worker processes (0 = one per core)")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="load mode: target lifecycle steps/s over all users; adds coordinated-omission-corrected latencies")
+    parser.add_argument("--soak", action="store_true",
+                        help="run a soak test: steady lifecycles and admin reads, reporting latency drift")
+    parser.add_argument("--hours", type=float, default=4,
+                        help="soak mode: hours to run (default 4)")
+    parser.add_argument("--window", type=float, default=300,
+                        help="soak mode: seconds per latency sample window (default 300)")
+    parser.add_argument("--think", type=float, default=1.0,
+                        help="soak mode: seconds each virtual user pauses between lifecycles (default 1)")
+    parser.add_argument("--bench", choices=["scaling", "autosave", "pagination", "stats", "regression", "coldstart"],
+                        help="run a benchmark from backend_bench instead of the functional suite")
+    parser.add_argument("--bank-sizes", type=lambda value: [int(size) for size in value.split(",")],
+                        default=None, help="scaling benchmark: comma-separated question bank sizes")
+    parser.add_argument("--repeats", type=int, default=30,
+                        help="regression benchmark: timed runs per endpoint (default 30)")
+    parser.add_argument("--baseline", metavar="PATH", default=None,
+                        help="regression benchmark: baseline JSON (default perf_baseline.json)")
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="regression benchmark: allowed relative latency growth (default 0.25)")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="coldstart benchmark: fresh starts to take the median over (default 3)")
+    parser.add_argument("--server-command", default=None,
+                        help="coldstart benchmark: command that starts the backend at BASE_URL, e.g. 'yarn start'")
+    parser.add_argument("--cold-start", type=float, default=0.0,
+                        help="offline mode: simulated delay in ms on the first request to each route")
+    parser.add_argument("--update-baseline", "--rebaseline", dest="rebaseline", action="store_true",
+                        help="regression benchmark: record this run as the stored baseline (required when none exists)")
+    parser.add_argument("--offline", action="store_true",
+                        help="run against an in-process stand-in of the API instead of BASE_URL")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="offline mode: injected latency per request in ms")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="offline mode: random +/- latency in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="offline mode: fraction of requests answered with HTTP 503")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="offline mode: seed for injected latency and errors")
+    parser.add_argument("--report-json", metavar="PATH",
+                        help="write per-request metrics and the per-endpoint summary to PATH")
+    parser.add_argument("--budgets", metavar="PATH", default=BUDGETS_PATH,
+                        help="per-route payload-size budgets JSON (default payload_budgets.json; '' to skip)")
+    parser.add_argument("--allow-settings-writes", action="store_true",
+                        help="let settings-writing checks run against a server other than the stand-in")
+    parser.add_argument("--keep-data", action="store_true",
+                        help="leave the profiles and assessments this run created instead of tearing them down")
+    parser.add_argument("--teardown", metavar="RUN_TAG", default=None,
+                        help="only delete the data of an earlier run with this tag (printed at the start of a run)")
+    cassette_mode = parser.add_mutually_exclusive_group()
+    cassette_mode.add_argument("--record", metavar="PATH",
+                               help="record every request/response of the suite into a cassette at PATH")
+    cassette_mode.add_argument("--replay", metavar="PATH",
+                               help="serve the suite from the cassette at PATH without any server")
+    args = parser.parse_args()
+    budgets = None
+    if args.budgets and os.path.exists(args.budgets):
+        with open(args.budgets) as f:
+            budgets = json.load(f)
+
+    stub = None
+    base_url = None
+    cassette = None
+    if args.bench == 'coldstart':
+        # The benchmark starts its own fresh backend for every run
+        pass
+    elif args.replay:
+        from backend_cassette import Cassette
+        cassette = Cassette.load(args.replay)
+        base_url = cassette.base_url
+    elif args.offline:
+        from backend_stub_server import StubServer
+        stub = StubServer(latency=args.latency / 1000, jitter=args.jitter / 1000,
+                          error_rate=args.error_rate, seed=args.seed, cold_start=args.cold_start / 1000).start()
+        base_url = stub.base_url
+
+    try:
+        if args.teardown:
+            success = teardown_run(base_url, args.teardown)
+        elif args.bench:
+            from backend_bench import BENCHMARKS
+            options = {}
+            if args.bench == 'scaling':
+                options['sizes'] = args.bank_sizes
+            if args.bench in ('pagination', 'stats') and stub:
+                options['store'] = stub.store
+            if args.bench == 'coldstart':
+                from backend_coldstart import command_launcher, stub_launcher
+                options['runs'] = args.runs
+                if args.offline:
+                    options['launch'] = stub_launcher(args.cold_start / 1000)
+                elif args.server_command:
+                    options['launch'] = command_launcher(args.server_command, BASE_URL)
+            if args.bench == 'regression':
+                options.update(repeats=args.repeats, rebaseline=args.rebaseline,
+                               target='offline' if stub else base_url or BASE_URL)
+                if args.baseline:
+                    options['baseline_path'] = args.baseline
+                if args.tolerance is not None:
+                    options['latency_tolerance'] = args.tolerance
+            if args.bench in ('scaling', 'autosave', 'stats', 'regression', 'coldstart'):
+                options['keep_data'] = args.keep_data
+            success = BENCHMARKS[args.bench](base_url, **options)
+        elif args.soak:
+            from backend_soak import run_soak
+            run_tag = new_run_tag('soak')
+            report = run_soak(hours=args.hours, window=args.window, users=args.users, think=args.think,
+                              base_url=base_url, run_tag=run_tag,
+                              on_window=lambda sample: print(
+                                  f"window {sample['index']}: {sample['requests']} requests, "
+                                  f"p50 {sample['p50'] * 1000:.1f}ms, p95 {sample['p95'] * 1000:.1f}ms, "
+                                  f"totalAssessments {sample['totalAssessments']}", flush=True))
+            report.print_report()
+            if args.report_json:
+                report.write_json(args.report_json)
+            success = not report.drifting() and report.failed_lifecycles == 0
+            if not args.keep_data:
+                success = teardown_run(base_url, run_tag) and success
+        elif args.load and (args.processes is not None or args.rate):
+            from backend_loadgen import run_distributed_load
+            run_tag = new_run_tag('load')
+            report = run_distributed_load(users=args.users, duration=args.duration, ramp_up=args.ramp_up,
+                                          processes=args.processes or None, rate=args.rate, base_url=base_url,
+                                          run_tag=run_tag)
+            report.print_report()
+            if args.report_json:
+                report.write_json(args.report_json)
+            success = report.failed_lifecycles == 0
+            if not args.keep_data:
+                success = teardown_run(base_url, run_tag) and success
+        elif args.load:
+            from backend_load import run_load
+            run_tag = new_run_tag('load')
+            report = run_load(users=args.users, duration=args.duration, ramp_up=args.ramp_up, base_url=base_url,
+                              run_tag=run_tag)
+            report.print_report()
+            if args.report_json:
+                report.recorder.write_json(args.report_json)
+            success = report.failed_lifecycles == 0
+            if not args.keep_data:
+                success = teardown_run(base_url, run_tag) and success
+        elif args.record or args.replay:
+            import backend_cassette
+            client = ScorecardClient(base_url or BASE_URL, pool_size=args.workers)
+            if args.record:
+                cassette = backend_cassette.Cassette(client.base_url)
+                backend_cassette.install_recorder(client, cassette)
+            else:
+                replayer = backend_cassette.install_replayer(client, cassette)
+            tester = ERPScorecardTester(max_workers=args.workers, client=client)
+            success = tester.run_all_tests(report_path=args.report_json, keep_data=args.keep_data, budgets=budgets,
+                                           allow_settings_writes=args.allow_settings_writes)
+            if args.record:
+                backend_cassette.report_changes(args.record, cassette)
+                cassette.save(args.record)
+                print(f"Recorded {len(cassette.interactions)} interactions to {args.record}")
+            elif replayer.misses:
+                print(f"{len(replayer.misses)} requests had no recorded response")
+                success = False
+        else:
+            tester = ERPScorecardTester(max_workers=args.workers, base_url=base_url)
+            success = tester.run_all_tests(report_path=args.report_json, keep_data=args.keep_data, budgets=budgets,
+                                           allow_settings_writes=args.allow_settings_writes)
+    finally:
+        if stub:
+            stub.stop()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+CloudReady ERP Scorecard Remediation Planner
+Builds one what-if candidate per improvable answer, scores them with
+POST /api/what-if (one request per 1000 candidates), and ranks the fixes by
+score gained per unit of effort.
+"""
+
+import argparse
+import random
+import sys
+
+from backend_client import new_run_tag
+from backend_test import ERPScorecardTester
+
+# Relative cost of a fix by question effort
+EFFORT_UNITS = {'L': 1, 'M': 2, 'H': 3}
+
+# Candidates per /what-if request; the API rejects more than 1000
+MAX_CANDIDATES_PER_REQUEST = 1000
+
+
+class RemediationPlanner:
+    """Ranks remediation options for one assessment using an ERPScorecardTester's client"""
+
+    def __init__(self, tester, target_score=4):
+        self.tester = tester
+        self.target_score = target_score
+
+    def candidates(self, answers, questions):
+        """One candidate per answered question below the target score, raising it to the target"""
+        by_id = {question['id']: question for question in questions}
+        return [
+            {'id': answer['questionId'], 'changes': [{'questionId': answer['questionId'], 'score': self.target_score}]}
+            for answer in answers
+            if answer['questionId'] in by_id and answer['score'] < self.target_score
+        ]
+
+    def what_if(self, assessment_id, candidates):
+        """Score `candidates` in requests of at most MAX_CANDIDATES_PER_REQUEST and merge the outcomes"""
+        merged = None
+        for start in range(0, len(candidates), MAX_CANDIDATES_PER_REQUEST):
+            response = self.tester.client.what_if(assessment_id, candidates[start:start + MAX_CANDIDATES_PER_REQUEST])
+            response.raise_for_status()
+            data = response.json()
+            if merged is None:
+                merged = data
+            else:
+                merged['candidates'].extend(data['candidates'])
+        return merged
+
+    def rank(self, assessment_id, answers):
+        """Return (base outcome, options sorted by deltaScore per effort unit, best first)"""
+        questions = self.tester.cached_get("/questions").json().get('questions', [])
+        by_id = {question['id']: question for question in questions}
+        candidates = self.candidates(answers, questions)
+        if not candidates:
+            return None, []
+        data = self.what_if(assessment_id, candidates)
+
+        options = []
+        for outcome in data['candidates']:
+            question = by_id[outcome['id']]
+            effort = question.get('effort') or 'M'
+            options.append({
+                **outcome,
+                'qid': question['qid'],
+                'pillar': question['pillar'],
+                'gate': question.get('gate'),
+                'effort': effort,
+                'gainPerEffort': outcome['deltaScore'] / EFFORT_UNITS.get(effort, 2),
+                'unblocksGate': any(change['from'] == 'FAIL' for change in outcome['gateChanges'].values()),
+            })
+        # Fixes that flip the decision or clear a FAIL gate win ties on score per effort
+        options.sort(key=lambda option: (-option['gainPerEffort'], not option['decisionChanged'],
+                                         not option['unblocksGate'], option['qid']))
+        return data['base'], options
+
+    def print_plan(self, base, options, limit=15):
+        print("=" * 78)
+        print("Remediation options ranked by score gained per unit of effort (L=1, M=2, H=3)")
+        print(f"Base: overall {base['overallScore']}, decision {base['decision']}, gates {base['gates']}")
+        print("=" * 78)
+        print(f"{'QID':<10}{'Pillar':<8}{'Gate':<6}{'Effort':<8}{'+Score':>8}{'/Effort':>9}  Outcome")
+        for option in options[:limit]:
+            notes = [f"{gate} {change['from']}->{change['to']}" for gate, change in option['gateChanges'].items()]
+            if option['decisionChanged']:
+                notes.append(f"decision -> {option['decision']}")
+            print(f"{option['qid']:<10}{option['pillar']:<8}{option['gate'] or '-':<6}{option['effort']:<8}"
+                  f"{option['deltaScore']:>8.2f}{option['gainPerEffort']:>9.2f}  {', '.join(notes)}")
+        print("=" * 78)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rank remediation options for a random assessment")
+    parser.add_argument("--offline", action="store_true", help="use the in-process stand-in")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep-data", action="store_true",
+                        help="leave the assessment this run created instead of tearing it down")
+    args = parser.parse_args()
+
+    stub = None
+    base_url = None
+    if args.offline:
+        from backend_stub_server import StubServer
+        stub = StubServer().start()
+        base_url = stub.base_url
+    tester = ERPScorecardTester(verbose=False, base_url=base_url, run_tag=new_run_tag('whatif'))
+    try:
+        rng = random.Random(args.seed)
+        questions = tester.cached_get("/questions").json()['questions']
+        answers = [{'questionId': q['id'], 'score': rng.choice([1, 2, 2, 3, 3, 4])} for q in questions]
+        if not (tester.test_start_assessment() and tester.test_save_answers(answers)):
+            sys.exit(1)
+        planner = RemediationPlanner(tester)
+        planner.print_plan(*planner.rank(tester.assessment_id, answers))
+    finally:
+        if not args.keep_data:
+            tester.teardown_run_data()
+        if stub:
+            stub.stop()